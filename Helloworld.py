@@ -1,9 +1,14 @@
 from manim import *
 import numpy as np
 import math
+from functools import lru_cache
 import sys, os
+import tempfile
+import zipfile
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from my_manim_setup import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
+from surface_lod import lod_surface
 
 # 全局字体：中文请用系统已安装字体
 config.font = "Microsoft YaHei"
@@ -21,13 +26,192 @@ def Rx(a):
     c, s = np.cos(a), np.sin(a)
     return np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
 
+@lru_cache(maxsize=None)
+def orbit_rotation(Omega=0, inc=0, omega=0):
+    # 轨道姿态矩阵 Rz(Ω)·Rx(i)·Rz(ω)，按 (Ω, i, ω) 缓存，只构造一次
+    R = Rz(Omega) @ Rx(inc) @ Rz(omega)
+    R.setflags(write=False)
+    return R
+
 def kepler_pos_3d(f, a, e, Omega=0, inc=0, omega=0):
     # 真近点角 f → 焦点极坐标 → 3D 姿态
-    p = a * (1 - e * e)
-    r = p / (1 + e * np.cos(f))
-    x, y, z = r * np.cos(f), r * np.sin(f), 0.0
-    R = Rz(Omega) @ Rx(inc) @ Rz(omega)
-    return (R @ np.array([x, y, z])).astype(float)
+    return KeplerOrbit(a, e, Omega, inc, omega).position(f)
+
+class KeplerOrbit:
+    """
+    开普勒轨道引擎：r = p / (1 + e cos f)，p = a(1 - e²)。
+    姿态矩阵按 (Ω, i, ω) 缓存；f 可为标量或数组，一次 NumPy 调用
+    同时给出位置、单位切向与单位径向（焦点 → 天体）。
+    """
+    def __init__(self, a, e, Omega=0, inc=0, omega=0):
+        self.a, self.e = a, e
+        self.p = a * (1 - e * e)
+        self.R = orbit_rotation(Omega, inc, omega)
+        self._last_f, self._last_state = None, None
+
+    def state(self, f):
+        f = np.asarray(f, dtype=float)
+        c, s = np.cos(f), np.sin(f)
+        denom = 1 + self.e * c
+        r = self.p / denom
+        dr = self.p * self.e * s / (denom * denom)  # dr/df
+        zero = np.zeros_like(f)
+        local_pos = np.stack([r * c, r * s, zero], axis=-1)
+        local_tan = np.stack([dr * c - r * s, dr * s + r * c, zero], axis=-1)
+        pos = local_pos @ self.R.T
+        tan = local_tan @ self.R.T
+        tan = tan / np.linalg.norm(tan, axis=-1, keepdims=True)
+        rad = pos / r[..., None]
+        return pos, tan, rad
+
+    def position(self, f):
+        return self.state(f)[0]
+
+    def at(self, f):
+        # 单帧内多个 updater 共用同一 f 的求值结果
+        f = float(f)
+        if f != self._last_f:
+            self._last_f, self._last_state = f, self.state(f)
+        return self._last_state
+
+    def path(self, n=181, t_range=(-PI, PI), **kwargs):
+        # 整圈轨道一次性采样为平滑折线
+        pts = self.position(np.linspace(t_range[0], t_range[1], n))
+        return VMobject(**kwargs).set_points_smoothly(pts)
+
+class KeplerSolver:
+    """
+    开普勒方程 M = E - e·sinE：平近点角 M → 偏近点角 E → 真近点角 f。
+    向量化 Newton 迭代，e 与 M 可为等长数组（成千上万个天体一次求解）；
+    上一帧的 E 作为热启动初值，帧间 M 变化很小时 1~2 次迭代即收敛。
+    """
+    def __init__(self, e, tol=1e-12, max_iter=30):
+        self.e = np.asarray(e, dtype=float)
+        self.tol, self.max_iter = tol, max_iter
+        self._E = None
+
+    def _newton(self, E, M):
+        e = self.e
+        for _ in range(self.max_iter):
+            dE = (E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+            dE = np.clip(dE, -1.0, 1.0)  # 限幅：高偏心率时避免 Newton 振荡
+            E = E - dE
+            if np.max(np.abs(dE)) < self.tol:
+                return E, True
+        return E, False
+
+    def eccentric_anomaly(self, M):
+        M = np.asarray(M, dtype=float)
+        e = self.e
+        converged = False
+        if self._E is not None and np.shape(self._E) == np.shape(M):
+            # 热启动：按残差修正上一帧的 E，并保持在 M 所在的同一圈
+            res = M - (self._E - e * np.sin(self._E))
+            E, converged = self._newton(self._E + (res + PI) % TAU - PI, M)
+        if not converged:
+            # 冷启动：Danby 初值 E0 = M + 0.85·e·sign(sinM)
+            E, _ = self._newton(M + 0.85 * e * np.sign(np.sin(M)), M)
+        self._E = E
+        return E
+
+    def true_anomaly(self, M):
+        E = self.eccentric_anomaly(M)
+        e = self.e
+        return 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+
+
+class KeplerSystem:
+    """
+    N 个天体的开普勒轨道：参数均为长度 N 的数组，姿态矩阵堆叠为 (N, 3, 3)，
+    positions(t) 一次返回 (N, 3)，无逐天体的 Python 循环。
+    周期按第三定律 T ∝ a^1.5（GM 取 4π²，a=1 时 T=1）。
+    """
+    def __init__(self, a, e, Omega=0, inc=0, omega=0, M0=0):
+        # 全为标量时也视作 N = 1，保证后面可以逐天体组装姿态矩阵
+        a, e, Omega, inc, omega, M0 = np.broadcast_arrays(
+            *[np.atleast_1d(np.asarray(x, dtype=float)) for x in (a, e, Omega, inc, omega, M0)])
+        self.a, self.e, self.M0 = a, e, M0
+        self.p = a * (1 - e * e)
+        self.n = TAU / a ** 1.5  # 平均角速度
+        self.R = np.stack([orbit_rotation(*o) for o in zip(Omega, inc, omega)])
+        self.solver = KeplerSolver(e)
+
+    def positions(self, t):
+        f = self.solver.true_anomaly(self.M0 + self.n * t)
+        r = self.p / (1 + self.e * np.cos(f))
+        local = np.stack([r * np.cos(f), r * np.sin(f), np.zeros_like(r)], axis=-1)
+        return np.einsum("nij,nj->ni", self.R, local)
+
+
+class NBodySystem:
+    """
+    引力 N 体：位置 / 速度为 (N, 3) 数组，kick-drift-kick 蛙跳（速度 Verlet）积分。
+    固定步长 dt，与渲染帧率无关（-ql 与 -qk 结果一致）；加速度由成对差分一次广播
+    求出，softening 为软化长度，避免近距离交会时数值爆炸。
+    """
+    def __init__(self, pos, vel, mass, G=1.0, dt=1/480, softening=0.05):
+        self.pos = np.array(pos, dtype=float)
+        self.vel = np.array(vel, dtype=float)
+        self.mass = np.array(mass, dtype=float)
+        self.G, self.dt, self.eps2 = G, dt, softening ** 2
+        self._acc = self.accelerations()
+        self._lag = 0.0
+
+    def accelerations(self):
+        x, y, z = self.pos.T
+        dx, dy, dz = x[None, :] - x[:, None], y[None, :] - y[:, None], z[None, :] - z[:, None]
+        r2 = dx * dx + dy * dy + dz * dz + self.eps2
+        w = self.mass[None, :] / (r2 * np.sqrt(r2))  # m_j / |r_ij|³
+        np.fill_diagonal(w, 0.0)
+        return self.G * np.stack([(dx * w).sum(axis=1), (dy * w).sum(axis=1), (dz * w).sum(axis=1)], axis=1)
+
+    def step(self, substeps=1):
+        h = self.dt
+        for _ in range(substeps):
+            self.vel += 0.5 * h * self._acc
+            self.pos += h * self.vel
+            self._acc = self.accelerations()
+            self.vel += 0.5 * h * self._acc
+        return self.pos
+
+    def advance(self, duration):
+        # 按固定步长推进 duration（帧间时间），余量留到下一帧
+        self._lag += duration
+        n = int(self._lag / self.dt)
+        self._lag -= n * self.dt
+        return self.step(n)
+
+    @classmethod
+    def binary(cls, m1, m2, a, e, Omega=0, inc=0, omega=0, G=1.0, **kwargs):
+        # 双星特例：从远拱点出发（f = -π），与 binary_stars_3d 的解析解一致
+        M = m1 + m2
+        pos_rel, tan, _ = KeplerOrbit(a, e, Omega, inc, omega).state(-PI)
+        v_rel = tan * np.sqrt(G * M * (1 - e) / (a * (1 + e)))
+        mu1, mu2 = m1 / M, m2 / M
+        return cls([-mu2 * pos_rel, mu1 * pos_rel], [-mu2 * v_rel, mu1 * v_rel], [m1, m2], G=G, **kwargs)
+
+    @classmethod
+    def cluster(cls, n, radius, total_mass, G=1.0, seed=0, **kwargs):
+        # 均匀球状星团，速度各向同性、按维里平衡估计速度弥散
+        rng = np.random.default_rng(seed)
+        dirs = rng.normal(size=(n, 3))
+        dirs /= np.linalg.norm(dirs, axis=1, keepdims=True)
+        pos = dirs * radius * rng.random((n, 1)) ** (1 / 3)
+        sigma = np.sqrt(0.3 * G * total_mass / radius)
+        vel = rng.normal(scale=sigma / np.sqrt(3), size=(n, 3))
+        vel -= vel.mean(axis=0)
+        return cls(pos, vel, np.full(n, total_mass / n), G=G, **kwargs)
+
+    @classmethod
+    def combine(cls, *systems, **kwargs):
+        first = systems[0]
+        kwargs.setdefault("G", first.G)
+        kwargs.setdefault("dt", first.dt)
+        kwargs.setdefault("softening", np.sqrt(first.eps2))
+        return cls(np.concatenate([s.pos for s in systems]),
+                   np.concatenate([s.vel for s in systems]),
+                   np.concatenate([s.mass for s in systems]), **kwargs)
+
 
 def make_sphere(center, radius, color):
     # 球体的通用构造，若 Sphere 不可用，退化为 Dot3D 或 Dot
@@ -43,30 +227,234 @@ def make_sphere(center, radius, color):
         except Exception:
             return Dot(center[:2], color=color).scale(1.2)
 
-def segmented_polar_conic(e_val, l_val, color=YELLOW, stroke_width=4):
+class MovingBody(VGroup):
+    """
+    可复用的"运动天体"：球体网格由 make_sphere 只构造一次，之后仅平移；
+    附着的 Line（径向、速度、加速度等）用 set_points_as_corners 原地改写，
+    不再每帧 always_redraw 新建 Sphere / Line。
+    """
+    def __init__(self, center, radius, color, anchor=ORIGIN):
+        super().__init__()
+        self.anchor = np.array(anchor, dtype=float)
+        self.body = make_sphere(ORIGIN, radius, color)
+        self.body.move_to(center)
+        self.pos = np.array(center, dtype=float)
+        self.radius_line = None
+        self.vectors = {}
+        self.add(self.body)
+
+    def with_radius(self, **line_kwargs):
+        # 锚点（焦点/质心）→ 天体
+        self.radius_line = Line(self.anchor, self.pos, **line_kwargs)
+        self.add_to_back(self.radius_line)
+        return self
+
+    def with_vector(self, name, vec, **line_kwargs):
+        # 天体 → 天体 + vec
+        self.vectors[name] = Line(self.pos, self.pos + vec, **line_kwargs)
+        self.add(self.vectors[name])
+        return self
+
+    def set_state(self, center, **vecs):
+        center = np.array(center, dtype=float)
+        self.body.shift(center - self.pos)
+        self.pos = center
+        if self.radius_line is not None:
+            self.radius_line.set_points_as_corners([self.anchor, center])
+        for name, vec in vecs.items():
+            self.vectors[name].set_points_as_corners([center, center + vec])
+        return self
+
+class PolarConicSampler:
+    """
+    自适应极坐标圆锥曲线采样：r = l / (1 + e cosθ)
+    - 细网格上向量化求值，按"弧长 + 转角"分配采样点：曲率大处、靠近渐近线处更密，平坦处更疏
+    - 按可见画面裁剪（略大于 frame），不再用固定 eps 避让奇点
+    - 每段固定 n 个点、参数网格 u 不变，相邻 e 之间只改写点坐标，可逐点形变
+    """
+    def __init__(self, l_val, n=120, fine=4096, margin=1.1, bend_weight=1.0):
+        self.l = l_val
+        self.n = n
+        self.fine = fine
+        self.theta = np.linspace(-PI, PI, fine, endpoint=False)
+        self.cos, self.sin = np.cos(self.theta), np.sin(self.theta)
+        self.u = np.linspace(0, 1, n)
+        self.margin = margin
+        self.bounds = np.array([config.frame_x_radius, config.frame_y_radius]) * margin
+        self.bend_weight = bend_weight
+        self._last_e, self._last_spans = None, None
+
+    def point(self, theta, e_val):
+        r = self.l / (1 + e_val * np.cos(theta))
+        return np.stack([r * np.cos(theta), r * np.sin(theta), np.zeros_like(r)], axis=-1)
+
+    def _runs(self, inside):
+        # 画面内的连续 θ 区间（环形）：返回 [(θ 数组, 是否闭合)]
+        if inside.all():
+            return [(np.append(self.theta, self.theta[0] + TAU), True)]
+        k = int(np.argmin(inside))  # 从一个画面外的点切开环
+        mask = np.roll(inside, -k)
+        th = np.roll(self.theta, -k)
+        th = np.where(th < th[0], th + TAU, th)
+        edges = np.diff(np.concatenate([[0], mask.astype(np.int8), [0]]))
+        starts, stops = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+        return [(th[i:j], False) for i, j in zip(starts, stops) if j - i >= 2]
+
+    def _resample(self, th, e_val):
+        pts = self.point(th, e_val)[:, :2]
+        seg = np.diff(pts, axis=0)
+        ds = np.linalg.norm(seg, axis=1)
+        heading = np.unwrap(np.arctan2(seg[:, 1], seg[:, 0]))
+        turn = np.abs(np.diff(heading))
+        bend = np.zeros_like(ds)
+        bend[:-1] += turn / 2
+        bend[1:] += turn / 2
+        w = ds / max(ds.sum(), 1e-9) + self.bend_weight * bend / max(bend.sum(), 1e-9)
+        cum = np.concatenate([[0], np.cumsum(w)])
+        return np.interp(self.u * cum[-1], cum, th)
+
+    def layout(self, e_val):
+        """画面内各段的采样参数：[(单调递增的 θ 数组 (n,), 是否闭合)]"""
+        denom = 1 + e_val * self.cos
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = self.l / denom
+            inside = (np.abs(r * self.cos) <= self.bounds[0]) & (np.abs(r * self.sin) <= self.bounds[1])
+        return [(self._resample(th, e_val), closed) for th, closed in self._runs(inside & np.isfinite(r))]
+
+    def points_on(self, ths, e_val, closed):
+        pts = self.point(ths, e_val)
+        if closed:
+            pts[-1] = pts[0]
+        return pts
+
+    def spans(self, e_val):
+        if e_val == self._last_e:
+            return self._last_spans
+        spans = [self.points_on(ths, e_val, closed) for ths, closed in self.layout(e_val)]
+        self._last_e, self._last_spans = e_val, spans
+        return spans
+
+
+class PolarConic(VMobject):
+    """
+    r = l / (1 + e cosθ) 的单一 VMobject（多段子路径）；set_e 原地改写点，
+    配合 PolarConicSampler 在离心率连续变化时无需每帧重建曲线。
+    """
+    def __init__(self, e_val, l_val, sampler=None, **kwargs):
+        super().__init__(**kwargs)
+        self.sampler = sampler or PolarConicSampler(l_val)
+        self.e_val = None
+        self.set_e(e_val)
+
+    def set_e(self, e_val):
+        if e_val == self.e_val:
+            return self
+        self.e_val = e_val
+        self.reset_points()
+        for pts in self.sampler.spans(e_val):
+            self.start_new_path(pts[0])
+            self.add_points_as_corners(pts[1:])
+        return self
+
+
+def segmented_polar_conic(e_val, l_val, color=YELLOW, stroke_width=4, sampler=None):
     """
     极坐标统一方程：r = l / (1 + e cosθ)
-    分段避开奇点（抛物线与双曲线），返回 VGroup 片段。
+    按可见画面分段（抛物线与双曲线在渐近方向自动截断），返回 VGroup 片段。
     """
-    segs = VGroup()
-    eps = 0.06
-    if e_val < 1 - 1e-6:  # 圆/椭圆
-        spans = [(-PI, PI)]
-    elif abs(e_val - 1) <= 1e-6:  # 抛物线
-        spans = [(-PI + eps, PI - eps)]
-    else:  # 双曲线
-        th0 = math.acos(-1 / e_val)  # singular angles
-        spans = [(-PI + eps, -th0 - eps), (-th0 + eps, th0 - eps), (th0 + eps, PI - eps)]
-
-    def fn(theta):
-        denom = 1 + e_val * math.cos(theta)
-        if abs(denom) < 1e-4:
-            denom = np.sign(denom) * 1e-4
-        r = l_val / denom
-        return np.array([r * math.cos(theta), r * math.sin(theta), 0])
-    for t0, t1 in spans:
-        segs.add(ParametricFunction(fn, t_range=(t0, t1), color=color, stroke_width=stroke_width))
-    return segs
+    sampler = sampler or PolarConicSampler(l_val)
+    return VGroup(*[
+        VMobject(color=color, stroke_width=stroke_width).set_points_as_corners(pts)
+        for pts in sampler.spans(e_val)
+    ])
+
+
+class EccentricityKeyframes:
+    """
+    离心率扫描关键帧缓存：在稠密 e 网格（圆 → 椭圆 → 抛物线 → 双曲线）上
+    一次性用 PolarConicSampler 预计算各段的采样参数 θ 并存盘，文件名由格式版本、
+    (e 网格, l, 每段点数) 与采样器设置（fine、margin、bend_weight、画面边界）决定；
+    -ql / -qk 等不同画质共用同一份缓存。
+    渲染时 spans(e) 在相邻两个关键帧之间插值 θ，再在 e 处精确求值，点始终落在真实曲线上。
+    两帧布局不同（段数或闭合与否不同，或同一下标的 θ 相差过大，如画面裁切位置改变）时
+    不插值，取较近一帧的 θ。
+    """
+    MAX_SPANS = 2
+    VERSION = 2
+    MAX_THETA_STEP = 0.5  # 相邻两帧同一下标的 θ 最多相差的弧度，超过即视为布局改变
+
+    def __init__(self, l_val, e_max=1.6, count=161, n=120, cache_dir=None, **sampler_options):
+        self.e_grid = np.linspace(0.0, e_max, count)
+        self.sampler = PolarConicSampler(l_val, n=n, **sampler_options)
+        s = self.sampler
+        cache_dir = cache_dir or os.path.join(config.media_dir, "conic_keyframes")
+        key = (f"v{self.VERSION}_e0-{e_max:.3f}x{count}_l{l_val:.3f}_n{n}"
+               f"_fine{s.fine}_m{s.margin:.3f}_b{s.bend_weight:.3f}_frame{s.bounds[0]:.3f}x{s.bounds[1]:.3f}.npz")
+        path = os.path.join(cache_dir, key)
+        cached = self._load(path, n)
+        if cached is not None:
+            self.thetas, self.counts, self.closed = cached
+        else:
+            self.thetas, self.counts, self.closed = self._build(n)
+            self._store(path)
+
+    def _load(self, path, n):
+        # 文件缺失、残缺或形状不符都按未命中处理，重新计算
+        try:
+            with np.load(path) as data:
+                thetas, counts, closed = data["thetas"], data["counts"], data["closed"]
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            return None
+        shape = (len(self.e_grid), self.MAX_SPANS)
+        if thetas.shape != shape + (n,) or counts.shape != shape[:1] or closed.shape != shape:
+            return None
+        return thetas, counts, closed
+
+    def _store(self, path):
+        # 先写临时文件再原子替换：render_chapters 的多个进程同时冷启动时，
+        # 读到的要么是完整文件，要么没有文件
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(f, thetas=self.thetas, counts=self.counts, closed=self.closed)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _build(self, n):
+        thetas = np.zeros((len(self.e_grid), self.MAX_SPANS, n))
+        counts = np.zeros(len(self.e_grid), dtype=np.int8)
+        closed = np.zeros((len(self.e_grid), self.MAX_SPANS), dtype=bool)
+        for i, e_val in enumerate(self.e_grid):
+            layout = self.sampler.layout(e_val)
+            if len(layout) > self.MAX_SPANS:
+                raise ValueError(
+                    f"EccentricityKeyframes: e = {e_val:.3f} 时画面内有 {len(layout)} 段曲线，"
+                    f"超过 MAX_SPANS = {self.MAX_SPANS}"
+                )
+            counts[i] = len(layout)
+            for j, (ths, is_closed) in enumerate(layout):
+                thetas[i, j], closed[i, j] = ths, is_closed
+        return thetas, counts, closed
+
+    def spans(self, e_val):
+        i = int(np.clip(np.searchsorted(self.e_grid, e_val) - 1, 0, len(self.e_grid) - 2))
+        j = i + 1
+        t = float(np.clip((e_val - self.e_grid[i]) / (self.e_grid[j] - self.e_grid[i]), 0, 1))
+        th_i, th_j = self.thetas[i, :self.counts[i]], self.thetas[j, :self.counts[j]]
+        blend = self.counts[i] == self.counts[j] and (self.closed[i] == self.closed[j]).all()
+        if blend:
+            # 环从不同位置切开时，同一段在两帧中可能相差整圈，先对齐
+            th_j = th_j + TAU * np.round((th_i - th_j).mean(axis=1, keepdims=True) / TAU)
+            blend = np.abs(th_i - th_j).max(initial=0) <= self.MAX_THETA_STEP
+        if blend:
+            ths, closed = (1 - t) * th_i + t * th_j, self.closed[i]
+        else:
+            k = i if t < 0.5 else j
+            ths, closed = self.thetas[k, :self.counts[k]], self.closed[k]
+        return [self.sampler.points_on(th, e_val, c) for th, c in zip(ths, closed)]
 
 
 # ============ 主场景：整合全部内容（ThreeDScene） ============
@@ -94,6 +482,7 @@ class ConicSectionsComplete(ThreeDScene):
         # 9. 加料：3D 天体与拓展
         self.kepler_orbits_3d()
         self.binary_stars_3d()
+        self.star_cluster_3d()
         self.gravitation_derivation()
         self.cardioid_playground()
         self.heart_surface_3d()
@@ -166,10 +555,10 @@ class ConicSectionsComplete(ThreeDScene):
             r = v
             z = sign * k * v
             return np.array([r * np.cos(u), r * np.sin(u), z])
-        top_cone = Surface(lambda u, v: cone(u, v, +1.0), u_range=(0, TAU), v_range=(0, r_max),
-                           resolution=(32, 16), fill_opacity=0.6, checkerboard_colors=[BLUE_D, BLUE_E])
-        bottom_cone = Surface(lambda u, v: cone(u, v, -1.0), u_range=(0, TAU), v_range=(0, r_max),
-                              resolution=(32, 16), fill_opacity=0.6, checkerboard_colors=[BLUE_D, BLUE_E])
+        top_cone = lod_surface(lambda u, v: cone(u, v, +1.0), u_range=(0, TAU), v_range=(0, r_max),
+                               resolution=(32, 16), fill_opacity=0.6, checkerboard_colors=[BLUE_D, BLUE_E])
+        bottom_cone = lod_surface(lambda u, v: cone(u, v, -1.0), u_range=(0, TAU), v_range=(0, r_max),
+                                  resolution=(32, 16), fill_opacity=0.6, checkerboard_colors=[BLUE_D, BLUE_E])
         plane = Rectangle(width=6, height=6, color=GREEN_E).set_fill(GREEN_E, opacity=0.45).set_stroke(width=0)
         if hasattr(plane, "set_shade_in_3d"):
             plane.set_shade_in_3d(True)
@@ -227,7 +616,8 @@ class ConicSectionsComplete(ThreeDScene):
                        always_redraw(lambda: DecimalNumber(e.get_value(), num_decimal_places=2, color=YELLOW, font_size=32))
                       ).arrange(RIGHT, buff=0.15).to_corner(UL)
 
-        conic_curve = always_redraw(lambda: segmented_polar_conic(e.get_value(), l, color=TEAL, stroke_width=5))
+        conic_curve = PolarConic(e.get_value(), l, color=TEAL, stroke_width=5)
+        conic_curve.add_updater(lambda m: m.set_e(e.get_value()))
         self.play(FadeIn(focus), FadeIn(focus_label), FadeIn(directrix), FadeIn(dlabel), Write(formula), FadeIn(etext))
         self.add(conic_curve)
         self.wait(0.6)
@@ -274,21 +664,12 @@ class ConicSectionsComplete(ThreeDScene):
             font_size=32, color=TEAL
         ).to_corner(UL))
 
-        def get_curve():
-            e = e_tracker.get_value()
-            if e < 0.01:
-                return Circle(radius=2.2, color=BLUE)
-            elif e < 0.99:
-                a = 2.5; b = 2.5 * np.sqrt(1 - e*e)
-                return Ellipse(width=2*a, height=2*b, color=GREEN)
-            elif e <= 1.01:
-                return FunctionGraph(lambda x: x*x/4, x_range=[-3, 3], color=YELLOW)
-            else:
-                return VGroup(
-                    FunctionGraph(lambda x: np.sqrt(1 + x*x), x_range=[0.3, 3.0], color=RED),
-                    FunctionGraph(lambda x: -np.sqrt(1 + x*x), x_range=[0.3, 3.0], color=RED)
-                )
-        curve = always_redraw(get_curve)
+        # 统一极坐标族 r = l / (1 + e cosθ)：关键帧缓存 + 插值，逐帧只改写点坐标
+        keyframes = EccentricityKeyframes(l_val=2.0)
+        def type_color(e):
+            return BLUE if e < 0.01 else (GREEN if e < 0.99 else (YELLOW if e <= 1.01 else RED))
+        curve = PolarConic(0.0, 2.0, sampler=keyframes, color=BLUE, stroke_width=4)
+        curve.add_updater(lambda m: m.set_e(e_tracker.get_value()).set_color(type_color(e_tracker.get_value())))
 
         self.play(Write(title), Create(axes), FadeIn(e_text), FadeIn(type_text))
         self.add(curve)
@@ -410,22 +791,19 @@ class ConicSectionsComplete(ThreeDScene):
         p = a*(1-e*e)
 
         sun = make_sphere(ORIGIN, 0.25, YELLOW)
-        orbit = ParametricFunction(lambda f: kepler_pos_3d(f, a, e, Omega, inc, omega),
-                                   t_range=(-PI, PI), color=TEAL, stroke_width=4)
-
-        f_tracker = ValueTracker(-PI)
-        def P():
-            return kepler_pos_3d(f_tracker.get_value(), a, e, Omega, inc, omega)
+        engine = KeplerOrbit(a, e, Omega, inc, omega)
+        orbit = engine.path(color=TEAL, stroke_width=4)
 
-        planet = always_redraw(lambda: make_sphere(P(), 0.15, BLUE))
-        radius_line = always_redraw(lambda: Line(ORIGIN, P(), color=GRAY_B, stroke_width=3))
+        pos0, tan0, rad0 = engine.at(-PI)
+        planet = MovingBody(pos0, 0.15, BLUE).with_radius(color=GRAY_B, stroke_width=3)
+        planet.with_vector("velocity", tan0*1.2, color=GREEN, stroke_width=4)
+        planet.with_vector("acceleration", -rad0*1.2, color=RED, stroke_width=4)
 
-        def tdir(df=1e-3):
-            p1 = kepler_pos_3d(f_tracker.get_value(), a, e, Omega, inc, omega)
-            p2 = kepler_pos_3d(f_tracker.get_value()+df, a, e, Omega, inc, omega)
-            return safe_normalize(p2-p1)
-        vel_vec = always_redraw(lambda: Line(P(), P()+tdir()*1.2, color=GREEN, stroke_width=4))
-        acc_vec = always_redraw(lambda: Line(P(), P()+safe_normalize(ORIGIN-P())*1.2, color=RED, stroke_width=4))
+        # 物理时间：平近点角 M 随时间线性增长，由开普勒方程解出真近点角
+        solver = KeplerSolver(e)
+        def move_planet(m, alpha):
+            pos, tan, rad = engine.at(solver.true_anomaly(interpolate(-PI, PI, alpha)))
+            m.set_state(pos, velocity=tan*1.2, acceleration=-rad*1.2)
 
         title = Text("3D 行星轨道与开普勒定律", font_size=34)
         law2 = Text("第二定律：等时扫过面积相等", font_size=26, color=GRAY_A)
@@ -435,9 +813,9 @@ class ConicSectionsComplete(ThreeDScene):
         title.to_corner(UL); law2.next_to(title, DOWN, aligned_edge=LEFT); law3.to_corner(UR)
 
         self.play(FadeIn(sun), Create(orbit), FadeIn(title), FadeIn(law2), FadeIn(law3), run_time=1.2)
-        self.add(planet, radius_line, vel_vec, acc_vec)
+        self.add(planet)
         self.begin_ambient_camera_rotation(rate=0.05)
-        self.play(f_tracker.animate.set_value(PI), run_time=8, rate_func=linear)
+        self.play(UpdateFromAlphaFunc(planet, move_planet), run_time=8, rate_func=linear)
 
         # 第二定律：近拱/远拱等面积
         f_peri, f_ap = 0.0, PI
@@ -445,8 +823,7 @@ class ConicSectionsComplete(ThreeDScene):
         dth1 = 35*DEGREES
         dth2 = dth1*(r_peri**2)/(r_ap**2)
         def wedge(f0, dth, col):
-            A = kepler_pos_3d(f0, a, e, Omega, inc, omega)
-            B = kepler_pos_3d(f0+dth, a, e, Omega, inc, omega)
+            A, B = engine.position([f0, f0+dth])
             return Polygon(A, B, ORIGIN, color=col, stroke_width=0).set_fill(col, opacity=0.4)
         w1 = wedge(f_peri, dth1, BLUE); w2 = wedge(f_ap, dth2, ORANGE)
         cap = Text("等面积 ⇒ 等时间", font_size=26, color=WHITE)
@@ -455,7 +832,7 @@ class ConicSectionsComplete(ThreeDScene):
         self.play(FadeIn(w1), FadeIn(w2), FadeIn(cap), run_time=1.0)
         self.wait(1.4)
         self.stop_ambient_camera_rotation()
-        self.play(FadeOut(axes, orbit, sun, planet, radius_line, vel_vec, acc_vec, w1, w2, title, law2, law3, cap), run_time=0.8)
+        self.play(FadeOut(axes, orbit, sun, planet, w1, w2, title, law2, law3, cap), run_time=0.8)
 
     # ---------- 3D 双星系统 ----------
     def binary_stars_3d(self):
@@ -468,18 +845,22 @@ class ConicSectionsComplete(ThreeDScene):
         mu1, mu2 = m1/(m1+m2), m2/(m1+m2)
         Omega, inc, omega = 10*DEGREES, 25*DEGREES, 20*DEGREES
 
-        def r_rel(f): return kepler_pos_3d(f, a_total, e, Omega, inc, omega)
-        def pos1(f): return -mu2 * r_rel(f)
-        def pos2(f): return  mu1 * r_rel(f)
+        engine = KeplerOrbit(a_total, e, Omega, inc, omega)
+        fs = np.linspace(-PI, PI, 181)
+        rel = engine.position(fs)
+        orbit1 = VMobject(color=BLUE, stroke_width=3).set_points_smoothly(-mu2 * rel)
+        orbit2 = VMobject(color=RED,  stroke_width=3).set_points_smoothly( mu1 * rel)
 
-        orbit1 = ParametricFunction(lambda f: pos1(f), t_range=(-PI, PI), color=BLUE, stroke_width=3)
-        orbit2 = ParametricFunction(lambda f: pos2(f), t_range=(-PI, PI), color=RED,  stroke_width=3)
-
-        f_tracker = ValueTracker(-PI)
-        star1 = always_redraw(lambda: make_sphere(pos1(f_tracker.get_value()), 0.22, BLUE))
-        star2 = always_redraw(lambda: make_sphere(pos2(f_tracker.get_value()), 0.18, RED))
+        rel0 = engine.position(-PI)
+        star1 = MovingBody(-mu2 * rel0, 0.22, BLUE).with_vector("link", rel0, color=GRAY_B, stroke_width=3)
+        star2 = MovingBody( mu1 * rel0, 0.18, RED)
         bary = make_sphere(ORIGIN, 0.06, YELLOW)
-        link = always_redraw(lambda: Line(pos1(f_tracker.get_value()), pos2(f_tracker.get_value()), color=GRAY_B, stroke_width=3))
+
+        solver = KeplerSolver(e)
+        def move_stars(m, alpha):
+            rel = engine.at(solver.true_anomaly(interpolate(-PI, PI, alpha)))[0]
+            star1.set_state(-mu2 * rel, link=rel)
+            star2.set_state( mu1 * rel)
 
         formula = MathTex(r"F = \frac{G m_1 m_2}{r^2}", font_size=36)
         cap = Text("双星绕质心椭圆轨道（同周期）", font_size=26, color=GRAY_A)
@@ -487,16 +868,53 @@ class ConicSectionsComplete(ThreeDScene):
         formula.to_corner(UR); cap.to_corner(UL)
 
         self.play(Create(orbit1), Create(orbit2), FadeIn(bary), FadeIn(formula), FadeIn(cap), run_time=1.2)
-        self.add(star1, star2, link)
+        stars = VGroup(star1, star2)
+        self.add(stars)
         self.begin_ambient_camera_rotation(rate=0.05)
-        self.play(f_tracker.animate.set_value(PI), run_time=8, rate_func=linear)
+        self.play(UpdateFromAlphaFunc(stars, move_stars), run_time=8, rate_func=linear)
         self.stop_ambient_camera_rotation()
 
         note = Text("距离比 r₁:r₂ = m₂:m₁", font_size=26, color=GRAY_A)
         self.add_fixed_in_frame_mobjects(note); note.to_edge(DOWN)
         self.play(FadeIn(note), run_time=0.6)
         self.wait(0.8)
-        self.play(FadeOut(axes, orbit1, orbit2, star1, star2, link, bary, formula, cap, note), run_time=0.8)
+        self.play(FadeOut(axes, orbit1, orbit2, stars, bary, formula, cap, note), run_time=0.8)
+
+    # ---------- 3D 星团：N 体引力 ----------
+    def star_cluster_3d(self):
+        self.set_camera_orientation(phi=65*DEGREES, theta=35*DEGREES, zoom=0.95)
+        axes = ThreeDAxes(x_range=(-8,8,2), y_range=(-8,8,2), z_range=(-6,6,2))
+        self.play(FadeIn(axes), run_time=0.5)
+
+        # 与 binary_stars_3d 相同的双星（周期取 8 秒），外加数百颗轻质恒星
+        m1, m2 = 2.0, 1.0
+        a_total, e, T = 6.0, 0.5, 8.0
+        G = 4*PI**2 * a_total**3 / ((m1+m2) * T**2)
+        pair = NBodySystem.binary(m1, m2, a_total, e, 10*DEGREES, 25*DEGREES, 20*DEGREES, G=G)
+        stars = NBodySystem.cluster(300, radius=5.0, total_mass=1.5, G=G, seed=7)
+        system = NBodySystem.combine(pair, stars, softening=0.25)
+
+        cloud = PMobject(stroke_width=4)
+        colors = [BLUE, RED] + [interpolate_color(WHITE, YELLOW, k) for k in np.random.default_rng(7).random(300)]
+        cloud.add_points(system.pos.copy(), rgbas=np.array([color_to_rgba(c) for c in colors]))
+
+        def evolve(m, dt):
+            m.points = system.advance(dt).copy()
+
+        cap = Text("星团：N 体引力（蛙跳积分）", font_size=26, color=GRAY_A)
+        self.add_fixed_in_frame_mobjects(cap); cap.to_corner(UL)
+        self.play(FadeIn(cap), run_time=0.6)
+        self.add(cloud)
+        cloud.add_updater(evolve)
+        self.begin_ambient_camera_rotation(rate=0.05)
+        self.wait(10)
+        self.stop_ambient_camera_rotation()
+        cloud.remove_updater(evolve)
+
+        def fade_cloud(m, alpha):
+            m.rgbas[:, 3] = 1 - alpha
+        self.play(FadeOut(axes, cap), UpdateFromAlphaFunc(cloud, fade_cloud), run_time=0.8)
+        self.remove(cloud)
 
     # ---------- 万有引力推导（板书） ----------
     def gravitation_derivation(self):
@@ -561,7 +979,7 @@ class ConicSectionsComplete(ThreeDScene):
         def x_of(t): return a*(1-np.cos(t))*np.cos(t)
         def y_of(t): return a*(1-np.cos(t))*np.sin(t)
 
-        heart_surface = Surface(
+        heart_surface = lod_surface(
             lambda u, v: np.array([x_of(u), y_of(u)*np.cos(v), y_of(u)*np.sin(v)]),
             u_range=(0, TAU), v_range=(0, TAU),
             resolution=(40, 20),
@@ -589,23 +1007,23 @@ class ConicSectionsComplete(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title); title.to_corner(UL)
 
         a,b,c = 2.0, 1.2, 1.0
-        ellipsoid = Surface(
+        ellipsoid = lod_surface(
             lambda u,v: np.array([a*np.sin(v)*np.cos(u), b*np.sin(v)*np.sin(u), c*np.cos(v)]),
-            u_range=(0, TAU), v_range=(0, PI), resolution=(32,16),
+            u_range=(0, TAU), v_range=(0, PI), resolution=(32,16), zoom=0.95,
             checkerboard_colors=[GREEN_D, GREEN_E], fill_opacity=0.6
         ).shift(LEFT*3)
 
         p = 1.0
-        paraboloid = Surface(
+        paraboloid = lod_surface(
             lambda u,v: np.array([u*np.cos(v), u*np.sin(v), (u*u)/(2*p)]),
-            u_range=(0, 2.2), v_range=(0, TAU), resolution=(32,16),
+            u_range=(0, 2.2), v_range=(0, TAU), resolution=(32,16), zoom=0.95,
             checkerboard_colors=[YELLOW_D, YELLOW_E], fill_opacity=0.65
         )
 
         a2,b2,c2 = 1.2, 0.9, 1.0
-        hyper_one = Surface(
+        hyper_one = lod_surface(
             lambda u,v: np.array([a2*np.cosh(u)*np.cos(v), b2*np.cosh(u)*np.sin(v), c2*np.sinh(u)]),
-            u_range=(-1.0, 1.0), v_range=(0, TAU), resolution=(40,20),
+            u_range=(-1.0, 1.0), v_range=(0, TAU), resolution=(40,20), zoom=0.95,
             checkerboard_colors=[RED_D, RED_E], fill_opacity=0.55
         ).shift(RIGHT*3)
 
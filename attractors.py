@@ -0,0 +1,187 @@
+"""
+奇怪吸引子与批量常微分方程积分 —— 纯 NumPy
+function_dance_extended.py 第七幕的洛伦兹吸引子使用
+
+    向量场：lorenz、rossler、aizawa、thomas、halvorsen、chen，均作用于 (N, 3) 状态数组
+    rk4_step / rk4:   定步长 RK4，N 个初值同时推进
+    rk45:             Dormand–Prince 5(4) 自适应步长；整批共用步长，按批内最大误差控制
+    TrailBuffer:      预分配的轨迹贝塞尔点缓冲区；每次只写入新增的线段，
+                      取出的是缓冲区的切片视图，不复制、不重建整条路径
+"""
+
+import numpy as np
+
+
+# ---------- 向量场 ----------
+def lorenz(sigma=10.0, rho=28.0, beta=8 / 3):
+    def f(p):
+        x, y, z = p[..., 0], p[..., 1], p[..., 2]
+        return np.stack([sigma * (y - x), x * (rho - z) - y, x * y - beta * z], axis=-1)
+    return f
+
+
+def rossler(a=0.2, b=0.2, c=5.7):
+    def f(p):
+        x, y, z = p[..., 0], p[..., 1], p[..., 2]
+        return np.stack([-y - z, x + a * y, b + z * (x - c)], axis=-1)
+    return f
+
+
+def aizawa(a=0.95, b=0.7, c=0.6, d=3.5, e=0.25, f_=0.1):
+    def f(p):
+        x, y, z = p[..., 0], p[..., 1], p[..., 2]
+        return np.stack([
+            (z - b) * x - d * y,
+            d * x + (z - b) * y,
+            c + a * z - z ** 3 / 3 - (x ** 2 + y ** 2) * (1 + e * z) + f_ * z * x ** 3,
+        ], axis=-1)
+    return f
+
+
+def thomas(b=0.208186):
+    def f(p):
+        x, y, z = p[..., 0], p[..., 1], p[..., 2]
+        return np.stack([np.sin(y) - b * x, np.sin(z) - b * y, np.sin(x) - b * z], axis=-1)
+    return f
+
+
+def halvorsen(a=1.89):
+    def f(p):
+        x, y, z = p[..., 0], p[..., 1], p[..., 2]
+        return np.stack([
+            -a * x - 4 * y - 4 * z - y ** 2,
+            -a * y - 4 * z - 4 * x - z ** 2,
+            -a * z - 4 * x - 4 * y - x ** 2,
+        ], axis=-1)
+    return f
+
+
+def chen(a=35.0, b=3.0, c=28.0):
+    def f(p):
+        x, y, z = p[..., 0], p[..., 1], p[..., 2]
+        return np.stack([a * (y - x), (c - a) * x - x * z + c * y, x * y - b * z], axis=-1)
+    return f
+
+
+# 名称 → (向量场, 典型初值, 建议定步长)
+ATTRACTORS = {
+    "lorenz": (lorenz(), (1.0, 1.0, 1.0), 0.01),
+    "rossler": (rossler(), (1.0, 1.0, 0.0), 0.02),
+    "aizawa": (aizawa(), (0.1, 0.0, 0.0), 0.01),
+    "thomas": (thomas(), (0.1, 0.0, 0.0), 0.05),
+    "halvorsen": (halvorsen(), (-1.48, -1.51, 2.04), 0.005),
+    "chen": (chen(), (-10.0, 0.0, 37.0), 0.002),
+}
+
+
+# ---------- 积分器 ----------
+def rk4_step(f, y, dt):
+    k1 = f(y)
+    k2 = f(y + dt / 2 * k1)
+    k3 = f(y + dt / 2 * k2)
+    k4 = f(y + dt * k3)
+    return y + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+
+def rk4(f, y0, dt, steps, every=1):
+    """定步长 RK4；返回每 every 步记录一次的状态 (steps // every + 1, N, 3)"""
+    y = np.array(y0, dtype=float)
+    out = np.empty((steps // every + 1,) + y.shape)
+    out[0] = y
+    for i in range(1, steps + 1):
+        y = rk4_step(f, y, dt)
+        if i % every == 0:
+            out[i // every] = y
+    return out
+
+
+# Dormand–Prince 5(4) 系数
+_DP_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+_DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_DP_B5 = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+_DP_B4 = np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+
+def rk45(f, y0, t_eval, rtol=1e-6, atol=1e-9, dt=1e-3, max_steps=1_000_000):
+    """
+    自适应 Dormand–Prince；整批状态共用一个步长（取批内最大的归一化误差），
+    步长在每个输出时刻处截断，使 t_eval 恰好落在步点上。返回 (len(t_eval), N, 3)。
+    """
+    t_eval = np.asarray(t_eval, dtype=float)
+    y = np.array(y0, dtype=float)
+    t = t_eval[0]
+    out = np.empty((len(t_eval),) + y.shape)
+    out[0] = y
+    k = np.empty((7,) + y.shape)
+    steps = 0
+    for j, target in enumerate(t_eval[1:], start=1):
+        while t < target:
+            h = min(dt, target - t)
+            k[0] = f(y)
+            for s in range(1, 7):
+                k[s] = f(y + h * np.tensordot(_DP_A[s], k[:s], axes=1))
+            y5 = y + h * np.tensordot(_DP_B5, k, axes=1)
+            err = h * np.tensordot(_DP_B5 - _DP_B4, k, axes=1)
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(y5))
+            norm = np.sqrt(np.mean((err / scale) ** 2, axis=-1)).max()
+            if norm <= 1:
+                t, y = t + h, y5
+            # 标准步长控制：安全系数 0.9，单步放缩限制在 [0.2, 5]
+            factor = 5.0 if norm == 0 else min(5.0, max(0.2, 0.9 * norm ** -0.2))
+            if h == dt or norm > 1:
+                dt = h * factor
+            steps += 1
+            if steps > max_steps:
+                raise RuntimeError("rk45: 步数超过上限，方程可能过于刚性")
+        out[j] = y
+    return out
+
+
+# ---------- 轨迹缓冲 ----------
+class TrailBuffer:
+    """
+    N 条轨迹、每条最多 capacity 段的贝塞尔点缓冲区 (N, 4·capacity, 3)。
+    extend 只写入新增线段的控制点；容量不足时丢弃最旧的线段，始终保留最近 capacity 段。
+    points(i) 返回第 i 条轨迹的切片视图，tail 给定时只取最近 tail 段。
+    """
+    def __init__(self, start, capacity):
+        start = np.asarray(start, dtype=float)
+        self.capacity = capacity
+        self.buffer = np.empty((len(start), 4 * capacity, 3))
+        self.last = start.copy()
+        self.count = 0
+
+    def extend(self, positions):
+        """positions: (m, N, 3)，依次连接到各轨迹末端"""
+        positions = np.asarray(positions, dtype=float)
+        m = len(positions)
+        if m == 0:
+            return
+        if positions.shape[1:] != self.last.shape:
+            raise ValueError(f"TrailBuffer.extend: 需要形如 (m, {len(self.last)}, 3) 的数组，收到 {positions.shape}")
+        a0 = np.concatenate([self.last[None], positions[:-1]])  # (m, N, 3)
+        a1 = positions
+        seg = np.stack([a0, a0 + (a1 - a0) / 3, a1 - (a1 - a0) / 3, a1], axis=2)  # (m, N, 4, 3)
+        seg = seg.transpose(1, 0, 2, 3).reshape(len(self.last), 4 * m, 3)
+        self.last = positions[-1].copy()
+        if m > self.capacity:
+            seg, m = seg[:, -4 * self.capacity:], self.capacity
+        overflow = self.count + m - self.capacity
+        if overflow > 0:
+            # 前移保留的线段，腾出末尾空间（numpy 会正确处理重叠区域的复制）
+            self.buffer[:, :4 * (self.count - overflow)] = self.buffer[:, 4 * overflow:4 * self.count]
+            self.count -= overflow
+        self.buffer[:, 4 * self.count:4 * (self.count + m)] = seg
+        self.count += m
+
+    def points(self, i, tail=None):
+        start = 0 if tail is None else max(0, self.count - tail)
+        return self.buffer[i, 4 * start:4 * self.count]
@@ -2,12 +2,329 @@ import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from my_manim_setup import *
 import random
-import itertools
 from manim import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 import numpy as np
+from fractal_tiles import MandelbrotTileCache, complex_grid, escape_time
+from surface_geometry import SurfaceGeometry
+from polytope import hypercube, perspective, rotation
+from spectral import SampledSignal, set_bars
+from golden import golden_spiral, spiral_points, square_points, vogel
 
 config.background_color = "#111111"
 
+# ---------- 分形：向量化逃逸时间（计算部分见 fractal_tiles.py） ----------
+def escape_colors(nu, max_iter, colors):
+    """
+    平滑迭代次数 → RGBA（uint8）。colors = (暗端起点, 暗端终点, 亮端起点, 亮端终点)，
+    与原先 interpolate_color(interpolate_color(a, b, t), interpolate_color(c, d, t), t) 相同的配色；
+    集合内部为黑色。
+    """
+    a, b, c, d = [np.array(color_to_rgb(col)) for col in colors]
+    t = np.log1p(np.nan_to_num(nu, nan=0.0).clip(0)) / np.log1p(max_iter)
+    t = t.clip(0, 1)[..., None]
+    rgb = (1 - t) * ((1 - t) * a + t * b) + t * ((1 - t) * c + t * d)
+    rgb[np.isnan(nu)] = 0.0
+    rgba = np.concatenate([rgb, np.ones(rgb.shape[:-1] + (1,))], axis=-1)
+    return (rgba * 255).astype(np.uint8)
+
+def fractal_image(plane, x_range, y_range, julia_c=None, max_iter=256, colors=(BLACK, PURPLE, BLUE, WHITE), resolution=None):
+    """
+    按平面在屏幕上所占像素生成整幅逃逸时间图像，返回与 ComplexPlane 对齐的单个 ImageMobject。
+    julia_c 为 None 时画曼德布罗特集合（z₀ = 0, c = 网格），否则画 c = julia_c 的茱莉亚集合。
+    """
+    lower_left = plane.n2p(complex(x_range[0], y_range[0]))
+    upper_right = plane.n2p(complex(x_range[1], y_range[1]))
+    width_units, height_units = (upper_right - lower_left)[:2]
+    if resolution is None:
+        resolution = int(config.pixel_height * height_units / config.frame_height)
+    height_px = resolution
+    width_px = max(1, int(round(resolution * width_units / height_units)))
+    grid = complex_grid(x_range, y_range, width_px, height_px)
+    if julia_c is None:
+        nu = escape_time(np.zeros_like(grid), grid, max_iter)
+    else:
+        nu = escape_time(grid, julia_c, max_iter)
+    image = ImageMobject(escape_colors(nu, max_iter, colors))
+    image.stretch_to_fit_width(width_units).stretch_to_fit_height(height_units)
+    image.move_to((lower_left + upper_right) / 2)
+    return image
+
+# ---------- 复变函数：批量共形映射 ----------
+def plane_points(plane, z):
+    """复数数组 → 平面上的 3D 点（ComplexPlane 为仿射映射，整批一次换算）"""
+    origin = plane.n2p(0)
+    ex, ey = plane.n2p(1) - origin, plane.n2p(1j) - origin
+    z = np.asarray(z)
+    return origin + z.real[..., None] * ex + z.imag[..., None] * ey
+
+def polylines_to_points(lines, breaks=None):
+    """
+    (L, S, 3) 折线组 → 单个 VMobject 的贝塞尔点阵，每条折线成为一条子路径。
+    breaks 为 (L, S - 1) 布尔数组：标记的线段退化为终点处的一个点，折线在此断开成两条子路径，
+    点数不变，仍可与不断开的网格整体 Transform。
+    """
+    a0, a1 = lines[:, :-1], lines[:, 1:]
+    if breaks is not None:
+        a0 = np.where(breaks[..., None], a1, a0)
+    d = (a1 - a0) / 3
+    return np.stack([a0, a0 + d, a1 - d, a1], axis=2).reshape(-1, 3)
+
+def hue_colors(z, colors=(RED, YELLOW, GREEN, BLUE, PURPLE)):
+    """按辐角在 colors 间线性插值的域着色（数组运算），返回 (..., 3) RGB"""
+    stops = np.array([color_to_rgb(c) for c in colors])
+    t = (np.angle(z) % TAU) / TAU * (len(stops) - 1)
+    i = np.minimum(t.astype(int), len(stops) - 2)
+    frac = (t - i)[..., None]
+    return (1 - frac) * stops[i] + frac * stops[i + 1]
+
+class ConformalMap:
+    """
+    共形映射可视化：f 为作用于 ndarray 的向量化复函数。
+    定义域中等实部、等虚部各 n_lines 条网格线，每条 samples 个点，一次求值；
+    按网格线中点的辐角分成 hue_bins 个颜色组，每组是一个含多条子路径的 VMobject，
+    因此上千条线也只有十来个 mobject，定义域网格与像网格点数一致，可直接整体 Transform。
+    像网格中跨越支割线（如 √z 在负实轴上）的跳跃段会被断开，不画出虚假的弦。
+    """
+    def __init__(self, f, x_range, y_range, n_lines=60, samples=160, hue_bins=12):
+        self.f = f
+        xs = np.linspace(x_range[0], x_range[1], n_lines)
+        ys = np.linspace(y_range[0], y_range[1], n_lines)
+        t = np.linspace(0, 1, samples)
+        vertical = xs[:, None] + 1j * (y_range[0] + t[None, :] * (y_range[1] - y_range[0]))
+        horizontal = (x_range[0] + t[None, :] * (x_range[1] - x_range[0])) + 1j * ys[:, None]
+        self.z = np.concatenate([vertical, horizontal])  # (L, S)
+        mid = self.z[:, samples // 2]
+        self.bins = np.minimum((np.angle(mid) % TAU / TAU * hue_bins).astype(int), hue_bins - 1)
+        centers = np.exp(1j * (np.arange(hue_bins) + 0.5) * TAU / hue_bins)
+        self.bin_colors = [rgb_to_color(c) for c in hue_colors(centers)]
+
+    def grid(self, plane, mapped=False, stroke_width=1.5, stroke_opacity=0.8, max_step=None):
+        """
+        max_step 为像平面上相邻采样点的最大间距，超过即视为支割线处的跳跃而断开；
+        缺省取全部线段长度中位数的 20 倍。
+        """
+        with np.errstate(all="ignore"):
+            w = self.f(self.z) if mapped else self.z
+        finite = np.isfinite(w)
+        w = np.where(finite, w, 0)
+        breaks = None
+        if mapped:
+            step = np.abs(np.diff(w, axis=1))
+            limit = max_step if max_step is not None else 20 * np.median(step)
+            breaks = (step > limit) | ~finite[:, :-1] | ~finite[:, 1:]
+        pts = plane_points(plane, w)
+        group = VGroup()
+        for k, color in enumerate(self.bin_colors):
+            line = VMobject(stroke_color=color, stroke_width=stroke_width, stroke_opacity=stroke_opacity)
+            mask = self.bins == k
+            line.points = polylines_to_points(pts[mask], None if breaks is None else breaks[mask])
+            group.add(line)
+        return group
+
+    def domain_image(self, plane, x_range, y_range, resolution=256, opacity=0.35):
+        """定义域上 f(z) 的域着色背景（整幅数组着色，单个 ImageMobject）"""
+        grid = complex_grid(x_range, y_range, resolution, resolution)
+        with np.errstate(all="ignore"):
+            w = self.f(grid)
+        rgb = hue_colors(w) * (0.6 + 0.4 * (np.log1p(np.abs(w)) % 1))[..., None]
+        rgba = np.concatenate([rgb, np.full(rgb.shape[:-1] + (1,), opacity)], axis=-1)
+        image = ImageMobject((np.nan_to_num(rgba) * 255).astype(np.uint8))
+        lower_left = plane.n2p(complex(x_range[0], y_range[0]))
+        upper_right = plane.n2p(complex(x_range[1], y_range[1]))
+        image.stretch_to_fit_width(upper_right[0] - lower_left[0]).stretch_to_fit_height(upper_right[1] - lower_left[1])
+        return image.move_to((lower_left + upper_right) / 2)
+
+# ---------- 参数曲面：连续缓冲区网格 ----------
+class ParametricMesh(VGroup):
+    """
+    参数曲面 (u, v) → R³ 的三角网格。func 对整张 (u, v) 网格一次求值，
+    返回 (x, y, z) 或形如 (3, ...) 的数组；sheets > 1 时调用 func(u, v, sheet)，
+    各叶的顶点拼接在同一缓冲区中（如 √z 的双叶黎曼曲面）。
+
+        vertices: (N, 3) 顶点        faces: (F, 3) 三角形顶点下标
+        face_sheet: (F,) 所属叶号    edges: (E, 2) 网格线段（不含三角形对角线）
+        params: (N, 2) 顶点的 (u, v)
+
+    线框与着色两种画法都从这些数组生成：线框按 (叶, 方向) 合并为少数几条多子路径的
+    VMobject，着色按 (深度层, 叶, 明暗档) 合并，整个曲面只有几十个子对象。
+    mode="colored" 时按标量场 values（顶点数组或 values(u, v)）分档着色，如曲率分布。
+
+    Cairo 按非零环绕规则填充：同一 VMobject 中投影绕向相反的三角形重叠处会互相抵消、
+    出现空洞，因此每个三角形都先统一为屏幕上的逆时针绕向；各着色对象再按深度层
+    从远到近排列（画家算法）。view 为初始视角的旋转矩阵，旋转动画用 set_view 逐帧更新。
+    """
+    def __init__(self, func, u_range, v_range, resolution=(24, 24), sheets=1,
+                 mode="wireframe", colors=(BLUE_E,), stroke_colors=None, wire_stride=(1, 1),
+                 stroke_width=1.5, stroke_opacity=0.8, fill_opacity=0.7,
+                 shade_bins=6, light=(-1, 1, 2), values=None, value_colors=(BLUE_E, WHITE, RED_E),
+                 value_range=None, depth_bands=8, view=None, **kwargs):
+        super().__init__(**kwargs)
+        nu, nv = resolution
+        u = np.linspace(u_range[0], u_range[1], nu + 1)
+        v = np.linspace(v_range[0], v_range[1], nv + 1)
+        U, V = np.meshgrid(u, v, indexing="ij")
+        grids = [func(U, V, k) if sheets > 1 else func(U, V) for k in range(sheets)]
+        self.shape = (sheets, nu + 1, nv + 1)
+        self.params = np.tile(np.stack([U.ravel(), V.ravel()], axis=-1), (sheets, 1))
+        self.vertices = np.concatenate(
+            [np.moveaxis(np.asarray(g, dtype=float), 0, -1).reshape(-1, 3) for g in grids]
+        )
+
+        # 网格下标：每个四边形 (i, j) 拆成两个三角形
+        index = np.arange(self.vertices.shape[0]).reshape(self.shape)
+        a, b = index[:, :-1, :-1], index[:, 1:, :-1]
+        c, d = index[:, 1:, 1:], index[:, :-1, 1:]
+        self.faces = np.concatenate([
+            np.stack([a, b, c], axis=-1).reshape(sheets, -1, 3),
+            np.stack([a, c, d], axis=-1).reshape(sheets, -1, 3),
+        ], axis=1).reshape(-1, 3)
+        self.face_sheet = np.repeat(np.arange(sheets), 2 * nu * nv)
+        su, sv = wire_stride
+        along_u = np.stack([index[:, :-1, ::sv], index[:, 1:, ::sv]], axis=-1)
+        along_v = np.stack([index[:, ::su, :-1], index[:, ::su, 1:]], axis=-1)
+        self.edges = np.concatenate([along_u.reshape(-1, 2), along_v.reshape(-1, 2)])
+        self.edge_sheet = np.concatenate([
+            np.repeat(np.arange(sheets), along_u[0].size // 2),
+            np.repeat(np.arange(sheets), along_v[0].size // 2),
+        ])
+        self.edge_direction = np.repeat([0, 1], [along_u.size // 2, along_v.size // 2])
+
+        self.colors = [colors[k % len(colors)] for k in range(sheets)]
+        self.depth_bands = depth_bands
+        self.light = np.asarray(light, dtype=float) / np.linalg.norm(light)
+        self.world = self.vertices.copy()  # 当前视角下的顶点
+        self._fill_groups, self._wire_groups = [], []
+        if mode in ("shaded", "both"):
+            self.add(*self.shaded(fill_opacity, shade_bins))
+        if mode == "colored":
+            self.add(*self.colored(values, value_colors, value_range, fill_opacity=fill_opacity))
+        if mode in ("wireframe", "both"):
+            self.add(*self.wireframe(stroke_colors, stroke_width, stroke_opacity))
+        if view is not None:
+            self.set_view(view)
+
+    def set_view(self, matrix, scale=1.0, center=None):
+        """
+        按视角重新生成全部点：world = center + scale · matrix · (v − 模型包围盒中心)，
+        center 缺省为模型包围盒中心。三角形绕向、明暗与深度次序随之更新；
+        会覆盖此前对本对象做的 scale / shift。
+        """
+        pivot = (self.vertices.min(axis=0) + self.vertices.max(axis=0)) / 2
+        center = pivot if center is None else np.asarray(center, dtype=float)
+        self.world = center + scale * (self.vertices - pivot) @ np.asarray(matrix, dtype=float).T
+        self._layout_wires()
+        self._layout_fill()
+        return self
+
+    def wireframe(self, stroke_colors=None, stroke_width=1.5, stroke_opacity=0.8):
+        """stroke_colors 为 (u 向, v 向) 线色；缺省时用各叶颜色提亮"""
+        for k, base in enumerate(self.colors):
+            for direction in (0, 1):
+                mask = (self.edge_sheet == k) & (self.edge_direction == direction)
+                if not mask.any():
+                    continue
+                color = stroke_colors[direction] if stroke_colors else interpolate_color(base, WHITE, 0.4)
+                line = VMobject(stroke_color=color, stroke_width=stroke_width, stroke_opacity=stroke_opacity)
+                self._wire_groups.append((line, mask))
+        self._layout_wires()
+        return [line for line, _ in self._wire_groups]
+
+    def _layout_wires(self):
+        for line, mask in self._wire_groups:
+            line.points = polylines_to_points(self.world[self.edges[mask]])
+
+    def _face_normals(self):
+        tri = self.world[self.faces]
+        normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        length = np.linalg.norm(normals, axis=1)
+        keep = length > 1e-12  # 去掉退化三角形（如极点处）
+        return tri, normals, length, keep
+
+    def _patches(self, bins, color_of, fill_opacity):
+        # 每个 (深度层, 叶, 档) 一个 VMobject，按深度层从远到近排列；color_of(叶号, 档) → 颜色
+        for band in range(self.depth_bands):
+            for k in range(len(self.colors)):
+                for s in range(bins):
+                    patch = VMobject(fill_color=color_of(k, s), fill_opacity=fill_opacity, stroke_width=0)
+                    self._fill_groups.append((patch, band, k, s))
+        self._layout_fill()
+        return [patch for patch, _, _, _ in self._fill_groups]
+
+    def _layout_fill(self):
+        if not self._fill_groups:
+            return
+        tri, normals, length, keep = self._face_normals()
+        if self._fill_levels is None:
+            # 明暗：面法向与光线夹角的 |cos|，两面同样受光
+            shade = np.abs(normals @ self.light) / np.where(keep, length, 1)
+            level = np.minimum((shade * self._fill_bins).astype(int), self._fill_bins - 1)
+        else:
+            level = self._fill_levels
+        # 统一投影绕向：屏幕上顺时针（法向 z < 0）的三角形交换后两个顶点
+        tri = np.where((normals[:, 2] < 0)[:, None, None], tri[:, [0, 2, 1]], tri)
+        # 深度层：相机位于 +z 方向，z 越小越远，先画
+        depth = tri[:, :, 2].mean(axis=1)
+        lo, hi = depth.min(), depth.max()
+        band = np.minimum(((depth - lo) / max(hi - lo, 1e-12) * self.depth_bands).astype(int), self.depth_bands - 1)
+        closed = np.concatenate([tri, tri[:, :1]], axis=1)  # a → b → c → a
+        for patch, b, k, s in self._fill_groups:
+            mask = keep & (band == b) & (self.face_sheet == k) & (level == s)
+            patch.points = polylines_to_points(closed[mask]) if mask.any() else np.zeros((0, 3))
+
+    def shaded(self, fill_opacity=0.7, shade_bins=6):
+        """按面法向与光线夹角的 |cos| 量化明暗；视角变化时 set_view 重新分档"""
+        self._fill_levels, self._fill_bins = None, shade_bins
+        return self._patches(
+            shade_bins,
+            lambda k, s: interpolate_color(BLACK, self.colors[k], 0.35 + 0.65 * (s + 0.5) / shade_bins),
+            fill_opacity
+        )
+
+    def colored(self, values, value_colors=(BLUE_E, WHITE, RED_E), value_range=None, bins=16, fill_opacity=0.8):
+        """标量场着色：面取三个顶点的平均值，在 value_range 内线性分成 bins 档"""
+        if callable(values):
+            values = values(self.params[:, 0], self.params[:, 1])
+        face_values = np.asarray(values, dtype=float)[self.faces].mean(axis=1)
+        lo, hi = value_range if value_range is not None else (face_values.min(), face_values.max())
+        t = np.clip((face_values - lo) / max(hi - lo, 1e-12), 0, 1)
+        self._fill_levels = np.minimum((t * bins).astype(int), bins - 1)
+        self._fill_bins = bins
+        palette = color_gradient(value_colors, bins)
+        return self._patches(bins, lambda k, s: palette[s], fill_opacity)
+
+# ---------- 高维多胞体：整体旋转与投影 ----------
+class PolytopeProjection(VMobject):
+    """
+    n 维多胞体的透视投影。所有边是本对象的子路径，所有顶点是子对象 dots 中的小圆；
+    set_rotation 对整个顶点数组做一次矩阵乘法和投影，再原地改写两者的点缓冲区，
+    每帧不新建任何对象。vertices 会先缩放到单位球内（perspective 的要求），
+    投影图形以 center 为中心（包围盒中心随旋转变化，不能作为参照）。
+    """
+    def __init__(self, vertices, edges, size=2.5, center=ORIGIN, dot_radius=0.05, dot_color=WHITE,
+                 stroke_width=1, stroke_opacity=0.7, **kwargs):
+        super().__init__(stroke_width=stroke_width, stroke_opacity=stroke_opacity, **kwargs)
+        vertices = np.asarray(vertices, dtype=float)
+        self.vertices = vertices / np.linalg.norm(vertices, axis=1).max()
+        self.edges = np.asarray(edges)
+        self.dot_radius = dot_radius
+        self.projection_center = np.asarray(center, dtype=float)
+        # 单位圆的贝塞尔控制点，顶点标记 = 模板 × 半径 + 投影点
+        self._dot_template = Circle(radius=1).points
+        self.unit = size / np.linalg.norm(perspective(self.vertices), axis=1).max()
+        self.dots = VMobject(fill_color=dot_color, fill_opacity=1, stroke_width=0)
+        self.add(self.dots)
+        self.set_rotation(np.eye(self.vertices.shape[1]))
+
+    def project(self, matrix):
+        return perspective(self.vertices @ matrix.T) * self.unit
+
+    def set_rotation(self, matrix):
+        p = self.project(matrix) + self.projection_center
+        self.points = polylines_to_points(p[self.edges])
+        self.dots.points = (p[:, None, :] + self.dot_radius * self._dot_template[None]).reshape(-1, 3)
+        return self
+
 class MathematicalDepthJourney(Scene):
     def construct(self):
         # 设置高质量渲染参数
@@ -118,85 +435,18 @@ class MathematicalDepthJourney(Scene):
         self.play(Create(rectangle), Write(formula))
         self.wait(0.5)
         
-        # 递归生成黄金矩形
-        rectangles = VGroup(rectangle)
-        squares = VGroup()
-        
-        # 创建5个递归黄金矩形
-        for i in range(5):
-            prev_rect = rectangles[-1]
-            width, height = prev_rect.width, prev_rect.height
-            
-            # 新矩形的尺寸
-            if width > height:
-                new_width = height
-                new_height = height
-                new_x = prev_rect.get_center()[0] - (width - new_width) / 2
-                new_y = prev_rect.get_center()[1]
-            else:
-                new_width = width
-                new_height = width
-                new_x = prev_rect.get_center()[0]
-                new_y = prev_rect.get_center()[1] - (height - new_height) / 2
-            
-            # 创建新正方形
-            square = Rectangle(
-                width=new_width,
-                height=new_height,
-                fill_color=GOLD_E,
-                fill_opacity=0.5 - i * 0.08,
-                stroke_color=GOLD_A,
-                stroke_width=2
-            )
-            square.move_to([new_x, new_y, 0])
-            squares.add(square)
-            
-            # 创建剩余矩形
-            if width > height:
-                remaining_width = width - new_width
-                remaining_height = height
-                remaining_x = prev_rect.get_center()[0] + (width - remaining_width) / 2
-                remaining_y = prev_rect.get_center()[1]
-            else:
-                remaining_width = width
-                remaining_height = height - new_height
-                remaining_x = prev_rect.get_center()[0]
-                remaining_y = prev_rect.get_center()[1] + (height - remaining_height) / 2
-            
-            new_rect = Rectangle(
-                width=remaining_width,
-                height=remaining_height,
-                fill_color=GOLD_E,
-                fill_opacity=0.3 - i * 0.05,
-                stroke_color=GOLD_A,
-                stroke_width=2
-            )
-            new_rect.move_to([remaining_x, remaining_y, 0])
-            rectangles.add(new_rect)
+        # 递归生成黄金矩形：15 级正方形依次从左、上、右、下切下，
+        # 全部轮廓是同一个 VMobject 的子路径，Create 时按级数顺序画出
+        levels = 15
+        golden = golden_spiral(rectangle.height, levels, center=rectangle.get_center()[:2])
+        squares = VMobject(fill_color=GOLD_E, fill_opacity=0.25, stroke_color=GOLD_A, stroke_width=2)
+        squares.points = square_points(golden)
         
-        # 依次显示正方形
-        for square in squares:
-            self.play(FadeIn(square), run_time=0.5)
+        self.play(Create(squares), run_time=2.5)
         
-        # 2. 黄金螺旋
+        # 2. 黄金螺旋：每个正方形内一段四分之一圆弧，首尾相接成一条路径
         spiral = VMobject(stroke_color=WHITE, stroke_width=3)
-        spiral_points = []
-        
-        # 黄金螺旋参数方程
-        t_values = np.linspace(0, 2 * np.pi * 2, 200)
-        a = 0.1  # 螺旋增长系数
-        
-        for t in t_values:
-            r = a * np.exp(t / golden_ratio)
-            x = r * np.cos(t)
-            y = r * np.sin(t)
-            spiral_points.append([x, y, 0])
-        
-        spiral.set_points_as_corners(spiral_points)
-        
-        # 螺旋和矩形一起缩放适应
-        spiral_group = VGroup(spiral)
-        spiral_group.scale(1.8).move_to(rectangle)
+        spiral.points = spiral_points(golden)
         
         self.play(Create(spiral), run_time=2)
         self.wait(0.5)
@@ -207,22 +457,14 @@ class MathematicalDepthJourney(Scene):
         
         self.play(Write(fib_formula))
         
-        # 创建树叶排列模拟
-        leaves = VGroup()
-        angle = 0
-        for i in range(50):
-            leaf = Dot(radius=0.02, color=GREEN_A)
-            # 使用黄金角度 (约137.5°) 旋转
-            r = 0.1 * np.sqrt(i)
-            angle += 137.5 * DEGREES
-            x = r * np.cos(angle)
-            y = r * np.sin(angle)
-            leaf.move_to([x, y, 0])
-            leaves.add(leaf)
-        
-        leaves.scale(5).to_edge(RIGHT, buff=1)
-        
-        self.play(FadeIn(leaves, lag_ratio=0.01))
+        # 向日葵：Vogel 模型 5000 粒种子（黄金角约 137.5°），单个点云对象，由内到外渐变着色
+        seeds, radius = vogel(5000, spacing=0.022)
+        seed_colors = np.array([color_to_rgba(interpolate_color(GOLD_E, GREEN_A, r)) for r in np.linspace(0, 1, 64)])
+        leaves = PMobject(stroke_width=3)
+        leaves.add_points(seeds, rgbas=seed_colors[(radius * 63).astype(int)])
+        leaves.to_edge(RIGHT, buff=0.3)
+        
+        self.play(FadeIn(leaves))
         self.wait(1)
         
         # 向下一部分过渡
@@ -256,35 +498,11 @@ class MathematicalDepthJourney(Scene):
             z = v/2 * np.sin(u/2)
             return np.array([x, y, z])
         
-        # 创建网格点
-        u_range = np.linspace(0, 2 * np.pi, 50)
-        v_range = np.linspace(-1, 1, 10)
-        
-        # 创建表面
-        mobius_surface = VGroup()
-        
-        # 添加u方向的线
-        for v_val in v_range:
-            points = []
-            for u_val in u_range:
-                points.append(mobius_strip_param(u_val, v_val))
-            
-            line = VMobject()
-            line.set_points_as_corners(points)
-            line.set_stroke(BLUE_B, width=1.5, opacity=0.7)
-            mobius_surface.add(line)
-        
-        # 添加v方向的线
-        for i, u_val in enumerate(u_range):
-            if i % 5 == 0:  # 减少线的数量以避免过度拥挤
-                points = []
-                for v_val in v_range:
-                    points.append(mobius_strip_param(u_val, v_val))
-                
-                line = VMobject()
-                line.set_points_as_corners(points)
-                line.set_stroke(BLUE_D, width=1.5, opacity=0.7)
-                mobius_surface.add(line)
+        # 创建表面：u 向 50 段；v 向线每 5 段一条以避免过度拥挤
+        mobius_surface = ParametricMesh(
+            mobius_strip_param, (0, 2 * np.pi), (-1, 1), resolution=(50, 10),
+            stroke_colors=(BLUE_B, BLUE_D), wire_stride=(5, 1), stroke_opacity=0.7
+        )
         
         # 让莫比乌斯带居中且旋转为最佳视角
         mobius_surface.scale(0.8).shift(LEFT * 3)
@@ -511,145 +729,67 @@ class MathematicalDepthJourney(Scene):
             Write(range_label)
         )
         
-        # 创建域中的网格点和映射点
-        def complex_function(z):
-            return z**2
-        
-        grid_dots = VGroup()
-        mapped_dots = VGroup()
+        # 批量共形映射：整张网格一次求值，映射过程是单个对象的整体形变
+        conformal = ConformalMap(lambda z: z**2, (-1.5, 1.5), (-1.5, 1.5), n_lines=60, samples=160)
+        domain_coloring = conformal.domain_image(domain_plane, (-2, 2), (-2, 2))
+        domain_grid = conformal.grid(domain_plane)
+        mapped_grid = conformal.grid(range_plane, mapped=True)
+        morph_grid = domain_grid.copy()
         
-        # 创建动态映射线
-        mapping_lines = VGroup()
-        
-        # 创建颜色编码的点和线
-        for x in np.linspace(-1.5, 1.5, 10):
-            for y in np.linspace(-1.5, 1.5, 10):
-                z = complex(x, y)
-                w = complex_function(z)
-                
-                # 计算色调
-                hue = (np.angle(z) % (2 * np.pi)) / (2 * np.pi)
-                color = color_gradient([RED, YELLOW, GREEN, BLUE, PURPLE], hue)
-                
-                # 在域和值域中创建点
-                dot_z = Dot(domain_plane.n2p(z), color=color, radius=0.05)
-                dot_w = Dot(range_plane.n2p(w), color=color, radius=0.05)
-                
-                grid_dots.add(dot_z)
-                mapped_dots.add(dot_w)
-                
-                # 创建映射线
-                line = Line(
-                    dot_z.get_center(), 
-                    dot_w.get_center(),
-                    stroke_width=1,
-                    stroke_opacity=0.3,
-                    stroke_color=color
-                )
-                mapping_lines.add(line)
-        
-        # 显示域中的点
-        self.play(FadeIn(grid_dots, lag_ratio=0.05))
+        # 显示定义域网格
+        self.play(FadeIn(domain_coloring), Create(domain_grid), run_time=1.5)
         
         # 显示映射过程
-        self.play(
-            LaggedStart(*[
-                FadeIn(line) for line in mapping_lines
-            ], lag_ratio=0.01),
-            run_time=2
-        )
-        
-        self.play(FadeIn(mapped_dots, lag_ratio=0.05))
+        self.add(morph_grid)
+        self.play(Transform(morph_grid, mapped_grid), run_time=2)
         self.wait(0.5)
         
+        # 同一网格换用其他映射：√z、exp z、莫比乌斯变换
+        map_label = MathTex("f(z) = z^2").scale(0.6).next_to(range_plane, UP, buff=0.2)
+        self.play(Write(map_label))
+        for f, tex in [
+            (np.sqrt, r"f(z) = \sqrt{z}"),
+            (np.exp, r"f(z) = e^z"),
+            (lambda z: (z - 0.5) / (1 - 0.5 * z), r"f(z) = \frac{z - 1/2}{1 - z/2}"),
+        ]:
+            conformal.f = f
+            self.play(
+                Transform(morph_grid, conformal.grid(range_plane, mapped=True)),
+                Transform(map_label, MathTex(tex).scale(0.6).next_to(range_plane, UP, buff=0.2)),
+                run_time=2
+            )
+            self.wait(0.3)
+        
         # 2. 黎曼曲面可视化
         riemann_title = Text("黎曼曲面（多值函数 f(z) = √z）", font="Source Han Sans CN").scale(0.7)
         riemann_title.next_to(complex_function_title, DOWN, buff=1.5)
         
         self.play(Write(riemann_title))
         
-        # 为简化，我们创建一个简化的双叶黎曼曲面模型
-        def riemann_surface(u, v, sheet=0):
-            # 参数化为极坐标 u=r, v=theta
-            r = u
-            theta = v + sheet * np.pi  # 不同的片
-            
-            z = r * np.exp(1j * theta)
-            w = np.sqrt(abs(z)) * np.exp(1j * theta / 2)
-            
-            # 将复数w转换为3D点
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)
-            z_height = abs(w) * np.cos(np.angle(w) / 2)
-            
-            return np.array([x, y, z_height])
-        
-        # 创建两个黎曼曲面片
-        sheet1_points = []
-        sheet2_points = []
-        
-        r_values = np.linspace(0.1, 1.5, 20)
-        theta_values = np.linspace(0, 2*np.pi, 40)
-        
-        # 生成第一片的网格
-        for r in r_values:
-            theta_line = []
-            for theta in theta_values:
-                point = riemann_surface(r, theta, sheet=0)
-                theta_line.append(point)
-            sheet1_points.append(theta_line)
-        
-        # 生成第二片的网格
-        for r in r_values:
-            theta_line = []
-            for theta in theta_values:
-                point = riemann_surface(r, theta, sheet=1)
-                theta_line.append(point)
-            sheet2_points.append(theta_line)
+        # 双叶黎曼曲面：z = r·e^{iθ}，第 k 叶 θ ∈ [2πk, 2π(k+1)]，高度取 Re √z = √r·cos(θ/2)，
+        # 两叶沿正实轴切口连续衔接，θ 绕满 4π 后回到起点
+        def riemann_surface(r, theta, sheet=0):
+            theta = theta + sheet * TAU
+            return r * np.cos(theta), r * np.sin(theta), np.sqrt(r) * np.cos(theta / 2)
         
-        # 创建曲面
-        riemann_sheets = VGroup()
-        
-        # 第一片
-        for i in range(len(r_values)):
-            for j in range(len(theta_values)):
-                if i < len(r_values) - 1 and j < len(theta_values) - 1:
-                    quad = Polygon(
-                        sheet1_points[i][j],
-                        sheet1_points[i][j+1],
-                        sheet1_points[i+1][j+1],
-                        sheet1_points[i+1][j],
-                        fill_color=BLUE_E,
-                        fill_opacity=0.7,
-                        stroke_width=0.5,
-                        stroke_color=BLUE_B
-                    )
-                    riemann_sheets.add(quad)
-        
-        # 第二片
-        for i in range(len(r_values)):
-            for j in range(len(theta_values)):
-                if i < len(r_values) - 1 and j < len(theta_values) - 1:
-                    quad = Polygon(
-                        sheet2_points[i][j],
-                        sheet2_points[i][j+1],
-                        sheet2_points[i+1][j+1],
-                        sheet2_points[i+1][j],
-                        fill_color=RED_E,
-                        fill_opacity=0.7,
-                        stroke_width=0.5,
-                        stroke_color=RED_B
-                    )
-                    riemann_sheets.add(quad)
-        
-        # 缩放和定位
-        riemann_sheets.scale(1.2).move_to(ORIGIN)
+        riemann_sheets = ParametricMesh(
+            riemann_surface, (0, 1.5), (0, TAU), resolution=(20, 40), sheets=2,
+            mode="both", colors=(BLUE_E, RED_E), stroke_width=0.5
+        )
+        
+        # 视角：先绕水平轴倾斜，放大 1.2 倍置于中心
+        tilt = rotation_matrix(-65 * DEGREES, RIGHT)
+        riemann_sheets.set_view(tilt, scale=1.2, center=ORIGIN)
         
         self.play(FadeIn(riemann_sheets))
         
-        # 添加旋转动画
+        # 添加旋转动画：每帧按新视角重排三角形的绕向与前后次序，两叶的遮挡关系随之变化
         self.play(
-            Rotate(riemann_sheets, angle=2*PI, axis=UP, run_time=5),
+            UpdateFromAlphaFunc(
+                riemann_sheets,
+                lambda mob, alpha: mob.set_view(rotation_matrix(alpha * TAU, UP) @ tilt, scale=1.2, center=ORIGIN)
+            ),
+            run_time=5
         )
         
         self.wait(1)
@@ -660,9 +800,10 @@ class MathematicalDepthJourney(Scene):
             FadeOut(range_plane),
             FadeOut(domain_label),
             FadeOut(range_label),
-            FadeOut(grid_dots),
-            FadeOut(mapped_dots),
-            FadeOut(mapping_lines),
+            FadeOut(domain_coloring),
+            FadeOut(domain_grid),
+            FadeOut(morph_grid),
+            FadeOut(map_label),
             FadeOut(complex_function_title),
             FadeOut(riemann_title),
             FadeOut(riemann_sheets),
@@ -684,34 +825,15 @@ class MathematicalDepthJourney(Scene):
             return np.array([x, y, z])
         
         # 创建曲面
-        u_range = np.linspace(-1, 1, 20)
-        v_range = np.linspace(-1, 1, 20)
-        
-        saddle = VGroup()
-        
-        # 创建曲面网格
-        for u in u_range:
-            v_line = []
-            for v in v_range:
-                v_line.append(saddle_surface(u, v))
-            
-            line = VMobject()
-            line.set_points_as_corners(v_line)
-            line.set_stroke(GREEN_B, width=1.5, opacity=0.8)
-            saddle.add(line)
-        
-        for v in v_range:
-            u_line = []
-            for u in u_range:
-                u_line.append(saddle_surface(u, v))
-            
-            line = VMobject()
-            line.set_points_as_corners(u_line)
-            line.set_stroke(GREEN_D, width=1.5, opacity=0.8)
-            saddle.add(line)
+        saddle = ParametricMesh(
+            saddle_surface, (-1, 1), (-1, 1), resolution=(19, 19),
+            stroke_colors=(GREEN_D, GREEN_B)
+        )
         
-        # 缩放和定位
+        # 缩放和定位；to_saddle 把曲面上的点换算到同样的位置（测地线用）
+        saddle_center = saddle.get_center()
         saddle.scale(1.5).to_edge(LEFT, buff=1)
+        to_saddle = lambda p: saddle.get_center() + 1.5 * (p - saddle_center)
         
         # 创建曲面标题
         saddle_title = Text("鞍面: z = x² - y²", font="Source Han Sans CN").scale(0.7)
@@ -730,32 +852,23 @@ class MathematicalDepthJourney(Scene):
         self.play(Write(curvature_title), Write(gauss_curvature))
         
         # 3. 创建曲率可视化
-        # 为鞍面计算高斯曲率
-        def gauss_curvature_saddle(u, v):
-            # 对于z = x^2 - y^2，高斯曲率为常数 K = -4/(1+(2x)^2+(2y)^2)^2
-            x, y = u, v
-            return -4 / ((1 + 4*x**2 + 4*y**2)**2)
-        
-        # 创建曲率可视化
-        curvature_surface = VGroup()
-        
-        for u in u_range:
-            v_line = []
-            for v in v_range:
-                point = saddle_surface(u, v)
-                # 计算该点的曲率
-                k = gauss_curvature_saddle(u, v)
-                
-                # 根据曲率映射颜色
-                # 负曲率 -> 蓝色，零曲率 -> 白色，正曲率 -> 红色
-                if k < 0:
-                    color = interpolate_color(BLUE_E, WHITE, min(1, abs(k) / 4))
-                else:
-                    color = interpolate_color(WHITE, RED_E, min(1, k / 4))
-                
-                # 创建点
-                dot = Dot(point, color=color, radius=0.05)
-                curvature_surface.add(dot)
+        # 由有限差分在整张网格上计算高斯曲率并着色（z = x² - y² 时 K = -4/(1+4x²+4y²)²）
+        geometry = SurfaceGeometry(saddle_surface)
+        curvature_surface = ParametricMesh(
+            saddle_surface, (-1, 1), (-1, 1), resolution=(60, 60), mode="colored",
+            values=lambda u, v: geometry.curvature(u, v)[0],
+            value_colors=(BLUE_E, WHITE, RED_E), value_range=(-4, 4), fill_opacity=0.9
+        )
+        
+        # 主方向：稀疏网格上两族互相垂直的短线（k1 方向黄色、k2 方向青色）
+        pu, pv = np.meshgrid(np.linspace(-0.9, 0.9, 9), np.linspace(-0.9, 0.9, 9), indexing="ij")
+        pu, pv = pu.ravel(), pv.ravel()
+        centers = geometry.point(pu, pv)
+        _, _, d1, d2 = geometry.principal(pu, pv)
+        for d, color in ((d1, YELLOW_B), (d2, TEAL_B)):
+            ticks = VMobject(stroke_color=color, stroke_width=2)
+            ticks.points = polylines_to_points(np.stack([centers - 0.08 * d, centers + 0.08 * d], axis=1))
+            curvature_surface.add(ticks)
         
         # 定位
         curvature_surface.scale(1.5).to_edge(RIGHT, buff=1)
@@ -808,34 +921,31 @@ class MathematicalDepthJourney(Scene):
         
         self.play(Write(geodesic_title))
         
-        # 在曲面上创建一条测地线
-        # 注：真实的测地线需要求解微分方程，这里用参数曲线近似
-        def geodesic_curve(t):
-            # 参数化的曲线
-            u = np.cos(t)
-            v = np.sin(t)
-            return saddle_surface(u, v)
-        
-        # 创建测地线
-        t_values = np.linspace(0, 2 * np.pi, 100)
-        geodesic_points = [geodesic_curve(t) for t in t_values]
-        
-        geodesic = VMobject(stroke_color=YELLOW, stroke_width=4)
-        geodesic.set_points_as_corners(geodesic_points)
-        geodesic.scale(1.5).to_edge(LEFT, buff=1)
+        # 从原点沿 12 个方向同时积分测地线方程（批量 RK4），离开参数域即截止
+        angles = np.linspace(0, TAU, 12, endpoint=False)
+        paths = geometry.geodesics(
+            np.zeros((12, 2)), np.stack([np.cos(angles), np.sin(angles)], axis=-1),
+            length=2.5, steps=150, domain=((-1, 1), (-1, 1))
+        )
+        geodesic = VGroup()
+        for k in range(paths.shape[1]):
+            uv = paths[:, k][~np.isnan(paths[:, k, 0])]
+            curve = VMobject(stroke_color=YELLOW, stroke_width=3)
+            curve.set_points_as_corners(to_saddle(geometry.point(uv[:, 0], uv[:, 1])))
+            geodesic.add(curve)
         
         # 显示测地线
-        self.play(Create(geodesic, run_time=2))
+        self.play(Create(geodesic, lag_ratio=0, run_time=2))
         
         # 添加动画粒子沿测地线运动
         particle = Sphere(radius=0.08, color=RED_A)
-        particle.move_to(geodesic.get_start())
+        particle.move_to(geodesic[1].get_start())
         
         self.play(FadeIn(particle))
         
         # 沿测地线运动
         self.play(
-            MoveAlongPath(particle, geodesic),
+            MoveAlongPath(particle, geodesic[1]),
             run_time=4,
             rate_func=linear
         )
@@ -878,42 +988,9 @@ class MathematicalDepthJourney(Scene):
             }
         ).scale(1.2)
         
-        # 简化的曼德布罗特集合（真实渲染需要更多计算）
-        def in_mandelbrot(c, max_iter=20):
-            z = 0
-            for i in range(max_iter):
-                z = z**2 + c
-                if abs(z) > 2:
-                    return i
-            return max_iter
-        
-        # 创建曼德布罗特集合点云
-        mandelbrot_set = VGroup()
-        
-        # 降低分辨率以提高性能
-        resolution = 40
-        x_range = np.linspace(-2, 1, resolution)
-        y_range = np.linspace(-1.5, 1.5, resolution)
-        
-        for x in x_range:
-            for y in y_range:
-                c = complex(x, y)
-                iter_count = in_mandelbrot(c)
-                
-                if iter_count == 20:  # 在集合内
-                    color = BLACK
-                else:
-                    # 根据迭代次数着色
-                    t = iter_count / 20
-                    color = interpolate_color(
-                        interpolate_color(BLACK, PURPLE, t),
-                        interpolate_color(BLUE, WHITE, t),
-                        t
-                    )
-                
-                point = mandelbrot_plane.n2p(c)
-                dot = Dot(point, radius=0.05, color=color)
-                mandelbrot_set.add(dot)
+        # 曼德布罗特集合：整幅网格向量化计算，单个图像对象
+        mandelbrot_set = fractal_image(mandelbrot_plane, (-2, 1), (-1.5, 1.5), max_iter=256,
+                                       colors=(BLACK, PURPLE, BLUE, WHITE))
         
         # 显示曼德布罗特集合
         self.play(
@@ -944,41 +1021,9 @@ class MathematicalDepthJourney(Scene):
         
         julia_plane.to_edge(DOWN, buff=1)
         
-        # 简化的茱莉亚集合函数
-        def in_julia(z, c=complex(-0.7, 0.27), max_iter=20):
-            for i in range(max_iter):
-                z = z**2 + c
-                if abs(z) > 2:
-                    return i
-            return max_iter
-        
-        # 创建茱莉亚集合点云
-        julia_set = VGroup()
-        
-        # 降低分辨率
-        resolution = 40
-        x_range = np.linspace(-1.5, 1.5, resolution)
-        y_range = np.linspace(-1.5, 1.5, resolution)
-        
-        for x in x_range:
-            for y in y_range:
-                z = complex(x, y)
-                iter_count = in_julia(z)
-                
-                if iter_count == 20:  # 在集合内
-                    color = BLACK
-                else:
-                    # 根据迭代次数着色
-                    t = iter_count / 20
-                    color = interpolate_color(
-                        interpolate_color(BLACK, RED, t),
-                        interpolate_color(YELLOW, WHITE, t),
-                        t
-                    )
-                
-                point = julia_plane.n2p(z)
-                dot = Dot(point, radius=0.05, color=color)
-                julia_set.add(dot)
+        # 茱莉亚集合 c = -0.7 + 0.27i
+        julia_set = fractal_image(julia_plane, (-1.5, 1.5), (-1.5, 1.5), julia_c=complex(-0.7, 0.27),
+                                  max_iter=256, colors=(BLACK, RED, YELLOW, WHITE))
         
         # 显示茱莉亚集合
         self.play(
@@ -1011,23 +1056,36 @@ class MathematicalDepthJourney(Scene):
         self.wait(1)
         
         # 放大曼德布罗特集合的一部分展示自相似性
+        # 缩放目标取在集合边界上（海马谷），放大 10⁴ 倍后仍有细节；集合外部的点放大后只剩平滑渐变
+        zoom_target = complex(-0.743643887, 0.131825904)
         zoom_box = Square(side_length=0.5, color=WHITE)
-        zoom_box.move_to(mandelbrot_plane.n2p(complex(-0.75, 0.1)))
+        zoom_box.move_to(mandelbrot_plane.n2p(zoom_target))
         
         self.play(Create(zoom_box))
         
-        # 创建放大的区域
-        zoomed_mandelbrot = mandelbrot_set.copy()
-        zoomed_mandelbrot.generate_target()
-        zoomed_mandelbrot.target.scale(4)
-        zoomed_mandelbrot.target.move_to(mandelbrot_set)
-        
-        # 放大动画
-        self.play(
-            MoveToTarget(zoomed_mandelbrot),
-            FadeOut(zoom_box),
-            run_time=2
-        )
+        # 深度缩放：以海马谷的边界点为中心，每帧从分块多分辨率缓存中取图（缺失分块由进程池并行计算）
+        zoom_cache = MandelbrotTileCache()
+        view_h, view_w = mandelbrot_set.pixel_array.shape[:2]
+        start_center, target = complex(-0.5, 0), zoom_target
+        start_width, zoom_depth = 3.0, 1e4
+        
+        def zoom_frame(alpha):
+            width = start_width / zoom_depth ** alpha
+            center = target + (start_center - target) * (width / start_width)  # 缩放中心保持不动
+            nu, max_iter = zoom_cache.view(center, width, width * view_h / view_w, view_w, view_h)
+            return escape_colors(nu, max_iter, (BLACK, PURPLE, BLUE, WHITE))
+        
+        def update_zoom(mob, alpha):
+            mob.pixel_array = zoom_frame(alpha)
+        
+        # 放大动画；渲染中断时也要关闭分块缓存的进程池
+        try:
+            zoomed_mandelbrot = ImageMobject(zoom_frame(0)).replace(mandelbrot_set, stretch=True)
+            self.add(zoomed_mandelbrot)
+            self.play(FadeOut(zoom_box), run_time=0.5)
+            self.play(UpdateFromAlphaFunc(zoomed_mandelbrot, update_zoom), run_time=10, rate_func=linear)
+        finally:
+            zoom_cache.close()
         
         self.wait(1)
         
@@ -1103,27 +1161,13 @@ class MathematicalDepthJourney(Scene):
                    0.15 * np.sin(2 * np.pi * 3 * t) + \
                    0.05 * np.sin(2 * np.pi * 5 * t)
         
-        # 创建波形
-        wave = axes_time.plot(
-            wave_function,
-            x_range=[0, 10, 0.01],
-            color=TEAL
-        )
-        
-        # 频谱（简化版，真实FFT需要更多计算）
-        bar1 = Rectangle(height=0.5, width=0.1, fill_color=TEAL, fill_opacity=1)
-        bar1.move_to(axes_freq.c2p(1, 0.25))
-        
-        bar2 = Rectangle(height=0.3, width=0.1, fill_color=TEAL, fill_opacity=1)
-        bar2.move_to(axes_freq.c2p(2, 0.15))
-        
-        bar3 = Rectangle(height=0.15, width=0.1, fill_color=TEAL, fill_opacity=1)
-        bar3.move_to(axes_freq.c2p(3, 0.075))
+        # 只采样一次：时域曲线、频谱（加汉宁窗的 rfft）和各分量都来自同一缓冲区
+        signal = SampledSignal(wave_function, (0, 10), n=2048, period=1)
+        wave = signal.graph(axes_time, color=TEAL)
         
-        bar5 = Rectangle(height=0.05, width=0.1, fill_color=TEAL, fill_opacity=1)
-        bar5.move_to(axes_freq.c2p(5, 0.025))
-        
-        spectrum = VGroup(bar1, bar2, bar3, bar5)
+        # 频谱：幅度谱的峰值（1、2、3、5 Hz）
+        peak_bins = signal.peaks(threshold=0.02, window="hann")
+        spectrum = signal.bars(axes_freq, peak_bins, window="hann", fill_color=TEAL, fill_opacity=1, stroke_width=0)
         
         # 显示波形
         self.play(Create(wave))
@@ -1132,40 +1176,16 @@ class MathematicalDepthJourney(Scene):
         self.play(FadeIn(spectrum))
         
         # 4. 动态演示波形合成
-        # 显示各个频率分量
-        def single_wave(t, freq, amp):
-            return amp * np.sin(2 * np.pi * freq * t)
-        
-        wave1 = axes_time.plot(
-            lambda t: single_wave(t, 1, 0.5),
-            x_range=[0, 10, 0.01],
-            color=RED
-        )
-        
-        wave2 = axes_time.plot(
-            lambda t: single_wave(t, 2, 0.3),
-            x_range=[0, 10, 0.01],
-            color=GREEN
-        )
-        
-        wave3 = axes_time.plot(
-            lambda t: single_wave(t, 3, 0.15),
-            x_range=[0, 10, 0.01],
-            color=BLUE
-        )
-        
-        wave5 = axes_time.plot(
-            lambda t: single_wave(t, 5, 0.05),
-            x_range=[0, 10, 0.01],
-            color=YELLOW
-        )
+        # 显示各个频率分量：逐个频点反变换
+        component_colors = [RED, GREEN, BLUE, YELLOW]
+        component_waves = [
+            signal.graph(axes_time, signal.component([k]), color=color)
+            for k, color in zip(peak_bins, component_colors)
+        ]
         
         # 一一显示各个分量
         self.play(FadeOut(wave))
         
-        component_waves = [wave1, wave2, wave3, wave5]
-        component_colors = [RED, GREEN, BLUE, YELLOW]
-        
         # 显示各个分量
         for i, (w, color) in enumerate(zip(component_waves, component_colors)):
             self.play(Create(w))
@@ -1189,50 +1209,30 @@ class MathematicalDepthJourney(Scene):
         self.wait(1)
         
         # 5. 动态时频域变换演示
-        # 创建波形变换器
-        def morph_wave(t, alpha):
-            # 从简单的正弦波变成复杂的方波
-            # alpha从0到1，控制变换程度
-            return (1 - alpha) * np.sin(2 * np.pi * t) + alpha * sum([
-                (4 / ((2*k + 1) * np.pi)) * np.sin(2 * np.pi * (2*k + 1) * t)
-                for k in range(5)
-            ])
+        # 从简单的正弦波变成方波（前 5 个奇次谐波）：两端的采样与频谱预先算好，
+        # 中间状态按 alpha 线性混合（傅里叶变换是线性的），每帧只改写已有对象的点
+        square_terms = lambda t: sum(
+            (4 / ((2*k + 1) * np.pi)) * np.sin(2 * np.pi * (2*k + 1) * t)
+            for k in range(5)
+        )
+        sine_signal = SampledSignal(lambda t: np.sin(2 * np.pi * t), (0, 10), n=2048, period=1)
+        square_signal = SampledSignal(square_terms, (0, 10), n=2048, period=1)
         
-        # 创建变换条
-        alpha_tracker = ValueTracker(0)
+        odd_freqs = 2 * np.arange(10) + 1
+        odd_bins = np.searchsorted(sine_signal.freqs, odd_freqs)
+        sine_mag = sine_signal.spectrum()[1][odd_bins]
+        square_mag = square_signal.spectrum()[1][odd_bins]
         
-        morph_wave_graph = always_redraw(
-            lambda: axes_time.plot(
-                lambda t: morph_wave(t, alpha_tracker.get_value()),
-                x_range=[0, 10, 0.01],
-                color=interpolate_color(TEAL, RED, alpha_tracker.get_value())
-            )
-        )
+        morph_wave_graph = sine_signal.graph(axes_time, color=TEAL)
+        bars = sine_signal.bars(axes_freq, odd_bins, fill_color=TEAL, fill_opacity=1, stroke_width=0)
         
-        # 从正弦波变成方波时的频谱变化
-        bars = VGroup()
-        for k in range(10):
-            freq = 2*k + 1
-            # 初始高度几乎为0，只有k=0时为1
-            height = 1 if k == 0 else 0.02
-            
-            bar = always_redraw(
-                lambda k=k, freq=freq: Rectangle(
-                    height=interpolate(
-                        height, 
-                        4 / (freq * np.pi) if freq <= 9 else 0.02,
-                        alpha_tracker.get_value()
-                    ),
-                    width=0.1,
-                    fill_color=interpolate_color(TEAL, RED, alpha_tracker.get_value()),
-                    fill_opacity=1
-                ).move_to(axes_freq.c2p(freq, interpolate(
-                    height / 2, 
-                    (4 / (freq * np.pi)) / 2 if freq <= 9 else 0.01,
-                    alpha_tracker.get_value()
-                )))
-            )
-            bars.add(bar)
+        def morph_spectrum(mob, alpha):
+            graph, spectrum_bars = mob
+            sine_signal.set_graph(graph, axes_time, (1 - alpha) * sine_signal.y + alpha * square_signal.y)
+            set_bars(spectrum_bars, axes_freq, odd_freqs, (1 - alpha) * sine_mag + alpha * square_mag)
+            color = interpolate_color(TEAL, RED, alpha)
+            graph.set_stroke(color)
+            spectrum_bars.set_fill(color)
         
         # 清除原有的图形
         self.play(
@@ -1248,7 +1248,7 @@ class MathematicalDepthJourney(Scene):
         
         # 变换动画
         self.play(
-            alpha_tracker.animate.set_value(1),
+            UpdateFromAlphaFunc(VGroup(morph_wave_graph, bars), morph_spectrum),
             run_time=5,
             rate_func=smooth
         )
@@ -1273,129 +1273,56 @@ class MathematicalDepthJourney(Scene):
         
         self.play(Write(section_title))
         
-        # 1. 创建四维超立方体投影
-        def hypercube_vertices(dim=4):
-            # 生成超立方体的顶点
-            return np.array(list(itertools.product([-1, 1], repeat=dim)))
-        
-        def project_4d_to_3d(vertices_4d, w_factor=0.5):
-            # 从4D投影到3D
-            vertices_3d = []
-            for vertex in vertices_4d:
-                x, y, z, w = vertex
-                factor = 1 / (w_factor - w)
-                x_proj = x * factor
-                y_proj = y * factor
-                z_proj = z * factor
-                vertices_3d.append([x_proj, y_proj, z_proj])
-            return np.array(vertices_3d)
-        
-        def project_3d_to_2d(vertices_3d, view_distance=4):
-            # 从3D投影到2D（简化视角）
-            vertices_2d = []
-            for vertex in vertices_3d:
-                x, y, z = vertex
-                factor = 1 / (view_distance - z)
-                x_proj = x * factor
-                y_proj = y * factor
-                vertices_2d.append([x_proj, y_proj, 0])
-            return np.array(vertices_2d)
-        
-        # 生成4D超立方体顶点
-        hypercube_4d = hypercube_vertices(4)
-        
-        # 投影到3D，再到2D
-        hypercube_3d = project_4d_to_3d(hypercube_4d)
-        hypercube_2d = project_3d_to_2d(hypercube_3d)
-        
-        # 创建顶点
-        vertices = VGroup(*[Dot(point, radius=0.05, color=WHITE) for point in hypercube_2d])
-        
-        # 连接边（只连接汉明距离为1的顶点，即只相差一个坐标）
-        edges = VGroup()
-        for i, v1 in enumerate(hypercube_4d):
-            for j, v2 in enumerate(hypercube_4d):
-                if i < j and np.sum(np.abs(v1 - v2)) == 2:  # 汉明距离为1
-                    edge = Line(
-                        hypercube_2d[i],
-                        hypercube_2d[j],
-                        stroke_width=1,
-                        stroke_opacity=0.7
-                    )
-                    edges.add(edge)
-        
-        # 创建超立方体
-        hypercube = VGroup(edges, vertices)
-        hypercube.scale(1.5).move_to(ORIGIN)
+        # 1. 四维超立方体：顶点与边由组合规则生成，整体旋转、逐级透视投影
+        tesseract = PolytopeProjection(*hypercube(4), size=2.5, color=BLUE_B)
+        dim_label = MathTex("n = 4").scale(0.7).to_corner(DR, buff=0.8)
         
         # 显示超立方体
         self.play(
-            Create(edges, lag_ratio=0.02),
-            FadeIn(vertices, lag_ratio=0.02),
+            Create(tesseract, lag_ratio=0.02),
+            FadeIn(dim_label),
             run_time=2
         )
         
-        # 2. 旋转动画
-        def update_hypercube(mob, alpha):
-            # 在4D空间中旋转
-            angle = alpha * 2 * np.pi
-            
-            # 旋转矩阵 (在xy和zw平面上)
-            rot_xy = np.array([
-                [np.cos(angle), -np.sin(angle), 0, 0],
-                [np.sin(angle), np.cos(angle), 0, 0],
-                [0, 0, 1, 0],
-                [0, 0, 0, 1]
-            ])
-            
-            rot_zw = np.array([
-                [1, 0, 0, 0],
-                [0, 1, 0, 0],
-                [0, 0, np.cos(angle), -np.sin(angle)],
-                [0, 0, np.sin(angle), np.cos(angle)]
-            ])
-            
-            # 应用旋转
-            rotated_4d = np.dot(hypercube_4d, rot_xy.T)
-            rotated_4d = np.dot(rotated_4d, rot_zw.T)
-            
-            # 重新投影
-            rotated_3d = project_4d_to_3d(rotated_4d)
-            rotated_2d = project_3d_to_2d(rotated_3d)
-            
-            # 更新顶点和边
-            for i, vertex in enumerate(vertices):
-                vertex.move_to(rotated_2d[i])
-            
-            for i, edge in enumerate(edges):
-                # 找到对应的顶点索引
-                for j, v1 in enumerate(rotated_4d):
-                    for k, v2 in enumerate(rotated_4d):
-                        if j < k and np.sum(np.abs(v1 - v2)) == 2:
-                            if i == 0:  # 只更新一次
-                                edge.put_start_and_end_on(
-                                    rotated_2d[j],
-                                    rotated_2d[k]
-                                )
-                                break
-                    else:
-                        continue
-                    break
-        
-        # 执行旋转动画
+        # 2. 旋转动画：同时在 (x, w) 与 (y, z) 两个互相垂直的平面内旋转（双旋转）
+        def rotate_in(dim, planes, turns=1.0):
+            def update(mob, alpha):
+                angle = alpha * turns * TAU
+                mob.set_rotation(rotation(dim, [(i, j, angle * speed) for i, j, speed in planes]))
+            return update
+        
         self.play(
-            UpdateFromAlphaFunc(hypercube, update_hypercube),
+            UpdateFromAlphaFunc(tesseract, rotate_in(4, [(0, 3, 1), (1, 2, 1)])),
             run_time=8,
             rate_func=linear
         )
         
+        # 五维、六维超立方体：各平面转速互不相同，旋转不会很快回到同一姿态
+        for dim, color, planes in [
+            (5, TEAL_B, [(0, 4, 1), (1, 3, 0.5), (2, 4, 0.25)]),
+            (6, PURPLE_B, [(0, 5, 1), (1, 4, 0.5), (2, 3, 0.75)]),
+        ]:
+            higher = PolytopeProjection(*hypercube(dim), size=2.5, color=color, stroke_width=0.8)
+            self.play(
+                ReplacementTransform(tesseract, higher),
+                Transform(dim_label, MathTex(f"n = {dim}").scale(0.7).move_to(dim_label)),
+                run_time=1.5
+            )
+            tesseract = higher
+            self.play(
+                UpdateFromAlphaFunc(tesseract, rotate_in(dim, planes)),
+                run_time=10,
+                rate_func=linear
+            )
+        
         # 3. 数学之美的总结
         beauty_title = Text("数学是宇宙的语言", font="Source Han Sans CN").scale(1)
         beauty_title.set_color_by_gradient(GOLD_A, GOLD_E)
         
         # 淡出超立方体，显示标题
         self.play(
-            FadeOut(hypercube),
+            FadeOut(tesseract),
+            FadeOut(dim_label),
             Write(beauty_title),
             run_time=2
         )
@@ -0,0 +1,489 @@
+"""
+多章节场景的渲染工具 —— 各场景文件共用
+
+本仓库的长场景都遵循同一写法：construct() 依次调用 self.xxx() 章节方法，
+例如 ConicSectionsComplete、MathematicalDepthJourney、GeneExpressionAnimation。
+本模块从 construct 源码中识别这些章节，并在不改动场景文件的前提下包装它们。
+
+    章节耗时分析（每章：墙钟时间、play 次数、渲染帧数、mobject 数；--memory 另跑一遍统计峰值内存）：
+        python chapter_tools.py profile Helloworld.py ConicSectionsComplete -q l --report profile.json
+
+    按章节分段渲染（每章一个片段文件，源码与参数未变的章节自动跳过），再无损拼接：
+        python chapter_tools.py render Helloworld.py ConicSectionsComplete -q k --chapters kepler_orbits_3d
+        python chapter_tools.py stitch Helloworld.py ConicSectionsComplete -q k
+
+    多进程并行渲染各章节，完成后按顺序拼接：
+        python chapter_tools.py render Helloworld.py ConicSectionsComplete -q k --jobs 32 --stitch
+
+    LaTeX 预编译（静态收集文件中的 MathTex / Tex 调用，进程池并行编译进 media/Tex 缓存）：
+        python chapter_tools.py precompile mathematical_formulas.py --jobs 16
+"""
+
+import argparse
+import ast
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import csv
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import textwrap
+import time
+import tracemalloc
+
+from manim import ThreeDScene, config, tempconfig
+
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+# ---------- 章节识别 ----------
+def chapter_names(scene_cls):
+    """按 construct 中的调用顺序返回章节方法名（形如 self.xxx() 的独立语句，排除 play/wait 等 Scene 自带方法）"""
+    src = textwrap.dedent(inspect.getsource(scene_cls.construct))
+    calls = []
+    for node in ast.walk(ast.parse(src)):
+        if not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)):
+            continue
+        func = node.value.func
+        if (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name)
+                and func.value.id == "self" and callable(getattr(scene_cls, func.attr, None))
+                and not hasattr(ThreeDScene, func.attr)):
+            calls.append((node.lineno, func.attr))
+    names = []
+    for _, name in sorted(calls):
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def load_module(path):
+    """与 manim 命令行一致：把场景文件所在目录加入 sys.path 后导入模块"""
+    path = os.path.abspath(path)
+    module_name = os.path.splitext(os.path.basename(path))[0]
+    sys.path.insert(0, os.path.dirname(path))
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_scene(path, scene_name):
+    return getattr(load_module(path), scene_name)
+
+
+def mobject_count(scene):
+    return sum(len(m.get_family()) for m in scene.mobjects)
+
+
+# ---------- 章节耗时分析 ----------
+class ChapterProfiler:
+    """
+    包装场景实例的每个章节方法与 play()，逐章记录：
+    wall_time（秒）、plays、frames、mobjects（章末场景中的 mobject 总数，含子对象）；
+    memory=True 时另记 peak_memory_mb（tracemalloc 统计的 Python 堆峰值）。
+    tracemalloc 会不均匀地拖慢各章，开启时的 wall_time 不能用于比较耗时。
+    """
+    def __init__(self, scene, chapters=None, memory=False):
+        self.scene = scene
+        self.chapters = chapters or chapter_names(type(scene))
+        self.memory = memory
+        self.records = []
+        self._plays = 0
+
+    def attach(self):
+        scene = self.scene
+        original_play = scene.play
+
+        def counted_play(*args, **kwargs):
+            self._plays += 1
+            return original_play(*args, **kwargs)
+        scene.play = counted_play
+
+        for name in self.chapters:
+            setattr(scene, name, self._wrap(name, getattr(scene, name)))
+        return self
+
+    def _wrap(self, name, method):
+        def profiled(*args, **kwargs):
+            renderer = self.scene.renderer
+            plays0, time0 = self._plays, renderer.time
+            if self.memory:
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record = {
+                    "chapter": name,
+                    "wall_time": round(time.perf_counter() - start, 3),
+                    "plays": self._plays - plays0,
+                    "frames": int(round((renderer.time - time0) * config.frame_rate)),
+                    "mobjects": mobject_count(self.scene),
+                }
+                if self.memory:
+                    record["peak_memory_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+                self.records.append(record)
+        return profiled
+
+    def write(self, path):
+        """按扩展名输出 .json 或 .csv"""
+        if path.endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=list(self.records[0]))
+                writer.writeheader()
+                writer.writerows(self.records)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.records, f, ensure_ascii=False, indent=2)
+
+
+def _profile_pass(scene_cls, quality, memory):
+    with tempconfig({"quality": QUALITY_FLAGS[quality]}):
+        scene = scene_cls()
+        profiler = ChapterProfiler(scene, memory=memory).attach()
+        scene.render()
+    return profiler
+
+
+def profile_scene(path, scene_name, report, quality="l", memory=False):
+    """
+    耗时取自不开 tracemalloc 的一遍渲染；memory=True 时再完整渲染一遍只统计峰值内存，
+    按章节名并入同一份报告。
+    """
+    scene_cls = load_scene(path, scene_name)
+    profiler = _profile_pass(scene_cls, quality, memory=False)
+    if memory:
+        tracemalloc.start()
+        try:
+            traced = _profile_pass(scene_cls, quality, memory=True)
+        finally:
+            tracemalloc.stop()
+        peaks = {r["chapter"]: r["peak_memory_mb"] for r in traced.records}
+        for r in profiler.records:
+            r["peak_memory_mb"] = peaks.get(r["chapter"])
+    profiler.write(report)
+    return profiler.records
+
+
+# ---------- 分段渲染与续渲 ----------
+def segment_dir(scene_name, quality):
+    return os.path.join(config.media_dir, "chapters", scene_name, QUALITY_FLAGS[quality])
+
+
+def local_imports(path):
+    """场景文件递归导入的本仓库模块（与场景文件同目录的 .py），按路径排序"""
+    folder = os.path.dirname(os.path.abspath(path))
+    found, todo = set(), [os.path.abspath(path)]
+    while todo:
+        with open(todo.pop(), encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            for module_name in names:
+                file = os.path.join(folder, module_name.split(".")[0] + ".py")
+                if file not in found and os.path.exists(file):
+                    found.add(file)
+                    todo.append(file)
+    found.discard(os.path.abspath(path))
+    return sorted(found)
+
+
+def chapter_hash(scene_cls, name, quality):
+    """
+    场景类源码（去掉本章之后的章节，它们不影响本章画面；之前的章节会先执行、
+    类内辅助方法会被调用，均计入）+ 场景类以外的模块源码 + 递归导入的本仓库模块源码
+    + 渲染参数
+    """
+    module = sys.modules[scene_cls.__module__]
+    class_src = inspect.getsource(scene_cls)
+    chapters = chapter_names(scene_cls)
+    for later in chapters[chapters.index(name) + 1:]:
+        class_src = class_src.replace(inspect.getsource(getattr(scene_cls, later)), "")
+    context = inspect.getsource(module).replace(inspect.getsource(scene_cls), "")
+    h = hashlib.sha256()
+    for part in (class_src, context, scene_cls.__name__, quality):
+        h.update(part.encode("utf-8"))
+    for file in local_imports(module.__file__):
+        with open(file, "rb") as f:
+            h.update(os.path.basename(file).encode("utf-8") + f.read())
+    return h.hexdigest()[:16]
+
+
+def isolate_chapter(scene, chapters, target):
+    """
+    只渲染 target 一章：之前的章节照常执行但跳过渲染（保证相机朝向、fixed-in-frame
+    等状态与整片渲染一致），之后的章节直接跳过；construct 中章节以外的 play 也不出帧。
+    """
+    renderer = scene.renderer
+    original_play = scene.play
+    active = [False]
+
+    def gated_play(*args, **kwargs):
+        renderer._original_skipping_status = not active[0]
+        return original_play(*args, **kwargs)
+    scene.play = gated_play
+
+    def rendered(method):
+        def run(*args, **kwargs):
+            active[0] = True
+            try:
+                return method(*args, **kwargs)
+            finally:
+                active[0] = False
+        return run
+
+    idx = chapters.index(target)
+    for i, name in enumerate(chapters):
+        if i == idx:
+            setattr(scene, name, rendered(getattr(scene, name)))
+        elif i > idx:
+            setattr(scene, name, lambda *args, **kwargs: None)
+
+
+def load_manifest(folder):
+    path = os.path.join(folder, "manifest.json")
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def save_manifest(folder, manifest):
+    with open(os.path.join(folder, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def render_chapter(path, scene_name, name, quality="l"):
+    """单章渲染为独立片段，返回 (章节名, 片段路径, 哈希)；可作为独立进程的任务"""
+    scene_cls = load_scene(path, scene_name)
+    chapters = chapter_names(scene_cls)
+    folder = segment_dir(scene_name, quality)
+    os.makedirs(folder, exist_ok=True)
+    # 每章独立的 partial_movie_dir，多个进程同时渲染同一场景时互不覆盖
+    with tempconfig({
+        "quality": QUALITY_FLAGS[quality],
+        "output_file": f"{scene_name}_{name}",
+        "partial_movie_dir": "{video_dir}/partial_movie_files/{scene_name}_" + name,
+    }):
+        scene = scene_cls()
+        isolate_chapter(scene, chapters, name)
+        scene.render()
+        movie = str(scene.renderer.file_writer.movie_file_path)
+    segment = os.path.join(folder, f"{chapters.index(name):02d}_{name}{os.path.splitext(movie)[1]}")
+    os.replace(movie, segment)
+    return name, segment, chapter_hash(scene_cls, name, quality)
+
+
+def stale_chapters(path, scene_name, chapters=None, quality="l", force=False):
+    """需要（重新）渲染的章节：片段缺失、或哈希（本章及之前的源码、依赖模块、参数）已变化"""
+    scene_cls = load_scene(path, scene_name)
+    chapters = chapters or chapter_names(scene_cls)
+    if force:
+        return chapters
+    manifest = load_manifest(segment_dir(scene_name, quality))
+    stale = []
+    for name in chapters:
+        entry = manifest.get(name)
+        if (entry is None or not os.path.exists(entry["file"])
+                or entry["hash"] != chapter_hash(scene_cls, name, quality)):
+            stale.append(name)
+    return stale
+
+
+def render_chapters(path, scene_name, chapters=None, quality="l", force=False, jobs=1):
+    """
+    渲染过期章节；jobs > 1 时每章作为独立进程任务并行渲染。
+    各任务都会先以跳过渲染的方式执行前面的章节，起始相机朝向与 fixed-in-frame 状态
+    与整片渲染一致；manifest 只由主进程写入。
+    某章失败时，其余已完成的章节照常写入 manifest，下次只需重渲失败的章节。
+    """
+    folder = segment_dir(scene_name, quality)
+    todo = stale_chapters(path, scene_name, chapters, quality, force)
+    if jobs > 1 and todo:
+        # 先集中编译公式，避免各章节进程重复编译同一表达式
+        precompile_tex(path, jobs)
+
+    def record(result):
+        name, segment, digest = result
+        manifest = load_manifest(folder)
+        manifest[name] = {"file": segment, "hash": digest}
+        save_manifest(folder, manifest)
+
+    if jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            futures = {pool.submit(render_chapter, path, scene_name, name, quality): name for name in todo}
+            failed = []
+            for future in as_completed(futures):
+                try:
+                    record(future.result())
+                except Exception as exc:
+                    failed.append((futures[future], exc))
+        if failed:
+            details = "; ".join(f"{name}: {exc!r}" for name, exc in failed)
+            raise RuntimeError(f"以下章节渲染失败：{details}") from failed[0][1]
+    else:
+        # 每章完成即写入 manifest，出错时前面的章节已记录，直接抛出
+        for name in todo:
+            record(render_chapter(path, scene_name, name, quality))
+    return todo
+
+
+def stitch(path, scene_name, quality="l", output=None):
+    """按 construct 中的章节顺序无损拼接各片段（只重封装，不重新编码）"""
+    import av
+
+    scene_cls = load_scene(path, scene_name)
+    folder = segment_dir(scene_name, quality)
+    manifest = load_manifest(folder)
+    chapters = chapter_names(scene_cls)
+    missing = [name for name in chapters if name not in manifest]
+    if missing:
+        raise FileNotFoundError(f"以下章节尚未渲染：{', '.join(missing)}")
+    output = output or os.path.join(folder, f"{scene_name}{os.path.splitext(manifest[chapters[0]]['file'])[1]}")
+    list_file = os.path.join(folder, "segments.txt")
+    with open(list_file, "w", encoding="utf-8") as f:
+        for name in chapters:
+            f.write(f"file '{os.path.abspath(manifest[name]['file']).replace(os.sep, '/')}'\n")
+
+    src = av.open(list_file, format="concat", options={"safe": "0"})
+    dst = av.open(output, mode="w")
+    in_stream = src.streams.video[0]
+    if hasattr(dst, "add_stream_from_template"):
+        out_stream = dst.add_stream_from_template(in_stream)
+    else:
+        out_stream = dst.add_stream(template=in_stream)
+    for packet in src.demux(in_stream):
+        if packet.dts is None:
+            continue
+        packet.dts = None  # 各片段的 dts 各自从 0 开始，交给 libav 重新计算
+        packet.stream = out_stream
+        dst.mux(packet)
+    dst.close()
+    src.close()
+    return output
+
+
+# ---------- LaTeX 预编译 ----------
+TEX_CLASSES = ("MathTex", "Tex")
+_tex_module = None
+
+
+def tex_calls(path):
+    """静态收集文件中所有 MathTex(...) / Tex(...) 调用的源码片段，按出现顺序去重"""
+    with open(path, encoding="utf-8") as f:
+        src = f.read()
+    calls = []
+    for node in ast.walk(ast.parse(src)):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id in TEX_CLASSES):
+            calls.append((node.lineno, node.col_offset, ast.get_source_segment(src, node)))
+    return list(dict.fromkeys(snippet for _, _, snippet in sorted(calls)))
+
+
+def _init_tex_worker(path):
+    # 每个工作进程导入一次场景模块，使模块中对 config.tex_template / tex_compiler 的修改生效
+    global _tex_module
+    _tex_module = load_module(path)
+
+
+def _compile_tex(snippet):
+    """
+    在场景模块的全局命名空间中求值调用本身：LaTeX 与 dvisvgm 由 manim 照常执行，
+    生成的文件名、内容与正式渲染时完全相同；引用了局部变量的调用（如循环中的 f-string）跳过
+    """
+    try:
+        eval(snippet, vars(_tex_module))
+        return "ok"
+    except NameError:
+        return "dynamic"
+    except Exception as exc:  # LaTeX 语法错误等：记录后继续，正式渲染时会照常报错
+        return f"error: {exc}"
+
+
+def precompile_tex(path, jobs=1):
+    """
+    一次性编译文件中能静态确定的全部公式，返回 {片段: 状态}。
+    公式按表达式各自编译（与 manim 的缓存粒度一致），jobs > 1 时由进程池并行执行；
+    缓存已存在的公式在 manim 内部直接命中，不会重新编译。
+    """
+    snippets = tex_calls(path)
+    if jobs > 1 and len(snippets) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(snippets)),
+                                 initializer=_init_tex_worker, initargs=(path,)) as pool:
+            results = list(pool.map(_compile_tex, snippets, chunksize=4))
+    else:
+        _init_tex_worker(path)
+        results = [_compile_tex(snippet) for snippet in snippets]
+    return dict(zip(snippets, results))
+
+
+# ---------- 命令行 ----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="多章节场景的渲染工具")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("profile", help="逐章统计渲染开销")
+    p.add_argument("file")
+    p.add_argument("scene")
+    p.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    p.add_argument("--report", default="chapter_profile.json")
+    p.add_argument("--memory", action="store_true", help="另渲染一遍，用 tracemalloc 统计各章峰值内存")
+
+    r = sub.add_parser("render", help="按章节分段渲染，跳过未变化的章节")
+    r.add_argument("file")
+    r.add_argument("scene")
+    r.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    r.add_argument("--chapters", nargs="*", help="只渲染这些章节（默认全部）")
+    r.add_argument("--force", action="store_true", help="忽略哈希，强制重渲")
+    r.add_argument("-j", "--jobs", type=int, default=1, help="并行渲染的进程数")
+    r.add_argument("--stitch", action="store_true", help="渲染完成后按顺序拼接全片")
+
+    st = sub.add_parser("stitch", help="按章节顺序拼接片段")
+    st.add_argument("file")
+    st.add_argument("scene")
+    st.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    st.add_argument("-o", "--output")
+
+    pc = sub.add_parser("precompile", help="并行预编译文件中的 MathTex / Tex 公式")
+    pc.add_argument("file")
+    pc.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="并行编译的进程数")
+
+    args = parser.parse_args(argv)
+    if args.command == "profile":
+        for r in profile_scene(args.file, args.scene, args.report, args.quality, args.memory):
+            memory = f"{r['peak_memory_mb']:>10.1f} MB" if r.get("peak_memory_mb") is not None else ""
+            print(f"{r['chapter']:<32}{r['wall_time']:>10.2f}s{r['frames']:>8} 帧{r['plays']:>6} play{memory}")
+    elif args.command == "render":
+        done = render_chapters(args.file, args.scene, args.chapters, args.quality, args.force, args.jobs)
+        print("已渲染：" + (", ".join(done) if done else "无（全部章节均为最新）"))
+        if args.stitch:
+            print(stitch(args.file, args.scene, args.quality))
+    elif args.command == "stitch":
+        print(stitch(args.file, args.scene, args.quality, args.output))
+    elif args.command == "precompile":
+        start = time.perf_counter()
+        results = precompile_tex(args.file, args.jobs)
+        for snippet, status in results.items():
+            if status.startswith("error"):
+                print(f"{snippet}\n    {status}")
+        counts = {s: sum(1 for v in results.values() if v.split(":")[0] == s) for s in ("ok", "dynamic", "error")}
+        print(f"共 {len(results)} 个公式：编译/命中 {counts['ok']}，运行时才能确定 {counts['dynamic']}，"
+              f"出错 {counts['error']}，用时 {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
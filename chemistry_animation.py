@@ -8,6 +8,7 @@ import networkx as nx
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from my_manim_setup import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 
 class ComprehensiveChemistryAnimation(Scene):
     def construct(self):
@@ -0,0 +1,122 @@
+"""
+本轮（epicycle）引擎：任意闭合路径 → 复傅里叶系数 → 首尾相接的旋转向量与圆
+function_dance_extended.py 第八幕、integration_romance.py 场景七共用
+
+    closed_path:    VMobject（可含多条子路径，如字形轮廓）的全部贝塞尔段 → 闭合折线
+    arc_resample:   闭合折线按弧长等距重采样为复数序列
+    fourier_terms:  numpy.fft.fft 得到复系数，按频率 0, 1, -1, 2, -2, … 取前 n 项
+    EpicycleChain:  全部圆共用一个 VMobject、全部向量共用一个 VMobject；
+                    set_time 一次 cumsum 得到所有向量端点，原地改写点缓冲区；
+                    笔尖轨迹按固定时间步长增量写入 TrailBuffer
+"""
+
+from manim import Circle, VGroup, VMobject
+import numpy as np
+
+from attractors import TrailBuffer
+from spectral import corner_points
+
+
+# ---------- 路径 ----------
+def bezier_samples(points, per_curve=8):
+    """贝塞尔点 (4K, 3) → 每段等参数取 per_curve 个点（不含段终点）的折线 (K·per_curve, 3)"""
+    curves = np.asarray(points, dtype=float).reshape(-1, 4, 3)
+    t = np.linspace(0, 1, per_curve, endpoint=False)[:, None]
+    basis = np.concatenate([(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3], axis=1)
+    return np.einsum("pk,ckd->cpd", basis, curves).reshape(-1, 3)
+
+
+def closed_path(mob, per_curve=8):
+    """VMobject 及其子对象的全部轮廓依次相连；子路径之间以直线跳接，末尾回到起点"""
+    points = [m.points for m in mob.family_members_with_points()]
+    return bezier_samples(np.concatenate(points), per_curve)
+
+
+def heart_curve(m=2048, size=1.0, center=(0.0, 0.0)):
+    """经典参数心形 x = 16 sin³t，y = 13 cos t − 5 cos 2t − 2 cos 3t − cos 4t，高约 2·size"""
+    t = np.linspace(0, 2 * np.pi, m, endpoint=False)
+    x = 16 * np.sin(t) ** 3
+    y = 13 * np.cos(t) - 5 * np.cos(2 * t) - 2 * np.cos(3 * t) - np.cos(4 * t)
+    return size / 16 * (x + 1j * (y + 2.5)) + complex(*center)
+
+
+def arc_resample(path, m):
+    """闭合路径（复数 (M,) 或坐标 (M, 2|3)）按弧长等分为 m 个点，返回复数 (m,)"""
+    path = np.asarray(path)
+    z = path if np.iscomplexobj(path) else path[:, 0] + 1j * path[:, 1]
+    ring = np.append(z, z[0])
+    s = np.concatenate([[0], np.cumsum(np.abs(np.diff(ring)))])
+    target = np.linspace(0, s[-1], m, endpoint=False)
+    return np.interp(target, s, ring.real) + 1j * np.interp(target, s, ring.imag)
+
+
+def fourier_terms(z, n):
+    """
+    z 视为一个周期内的等距采样：z(t) = Σ c_k e^{2πikt}，t ∈ [0, 1)。
+    返回按 |k| 从小到大（同 |k| 时正频率在前）的前 n 个频率与系数。
+    """
+    m = len(z)
+    coefficients = np.fft.fft(z) / m
+    freqs = np.rint(np.fft.fftfreq(m) * m).astype(int)
+    order = np.lexsort((freqs < 0, np.abs(freqs)))[:n]
+    return freqs[order], coefficients[order]
+
+
+def _to_points(z):
+    z = np.asarray(z)
+    return np.stack([z.real, z.imag, np.zeros(z.shape)], axis=-1)
+
+
+# ---------- 本轮链 ----------
+class EpicycleChain(VGroup):
+    """
+    path 为 VMobject 或闭合路径数组（场景坐标），取 n 项（含作为链条起点的直流项）。
+    t 以圈为单位：t = 1 时笔尖恰好走完整条路径；turns 为最多描绘的圈数，
+    trace_samples 为每圈轨迹的采样点数，与帧率无关。
+    """
+    def __init__(self, path, n=300, samples=4096, turns=1.0, trace_samples=2000,
+                 circle_style=None, vector_style=None, trace_style=None, **kwargs):
+        super().__init__(**kwargs)
+        if isinstance(path, VMobject):
+            path = closed_path(path)
+        self.freqs, self.coefficients = fourier_terms(arc_resample(path, samples), n)
+        self.radii = np.abs(self.coefficients[1:])
+        self.trace_samples = trace_samples
+        self._template = Circle(radius=1).points.copy()
+
+        self.circles = VMobject(**(circle_style or {"stroke_width": 1, "stroke_opacity": 0.35}))
+        self.vectors = VMobject(**(vector_style or {"stroke_width": 1.5}))
+        self.trace = VMobject(**(trace_style or {"stroke_width": 3}))
+        self.add(self.circles, self.vectors, self.trace)
+
+        self.capacity = int(np.ceil(turns * trace_samples))
+        self.buffer = TrailBuffer(_to_points([self.coefficients.sum()]), self.capacity)
+        self.set_time(0)
+
+    def tips(self, t):
+        """时刻 t（标量或 (T,)）各向量端点的复坐标 (…, n)，第 0 个为链条起点"""
+        phase = np.exp(2j * np.pi * np.multiply.outer(t, self.freqs))
+        return np.cumsum(self.coefficients * phase, axis=-1)
+
+    def pen(self, t):
+        """只求笔尖位置，不做累加"""
+        return np.exp(2j * np.pi * np.multiply.outer(t, self.freqs)) @ self.coefficients
+
+    def set_time(self, t):
+        chain = _to_points(self.tips(t))
+        self.vectors.points = corner_points(chain)
+        self.circles.points = (chain[:-1, None] + self.radii[:, None, None] * self._template).reshape(-1, 3)
+
+        # 轨迹只补写上次之后、已到达的整数采样点
+        done = min(int(np.floor(t * self.trace_samples)), self.capacity)
+        if done > self.buffer.count:
+            ts = np.arange(self.buffer.count + 1, done + 1) / self.trace_samples
+            self.buffer.extend(_to_points(self.pen(ts))[:, None])
+        self.trace.points = self.buffer.points(0)
+        return self
+
+    def drawer(self, turns=1.0):
+        """UpdateFromAlphaFunc 用的更新函数，alpha 从 0 到 1 对应 0 到 turns 圈"""
+        def update(mob, alpha):
+            mob.set_time(alpha * turns)
+        return update
@@ -0,0 +1,126 @@
+"""
+逃逸时间分形计算 —— 纯 NumPy，可在子进程中运行
+calculus_outline.py 的曼德布罗特 / 茱莉亚集合及深度缩放动画共用
+
+    escape_time:   整个复数网格一次迭代，返回平滑迭代次数
+    MandelbrotTileCache: 四叉树分块、多分辨率缓存；缩放动画相邻帧视口重叠时复用已有分块，
+                   缺失分块交给进程池并行计算，迭代上限随缩放层级增加
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+
+import numpy as np
+
+
+def complex_grid(x_range, y_range, width, height):
+    """width × height 的复数网格，第 0 行对应虚部最大处（与图像行序一致）"""
+    re = np.linspace(x_range[0], x_range[1], width)
+    im = np.linspace(y_range[1], y_range[0], height)
+    return re[None, :] + 1j * im[:, None]
+
+
+def escape_time(z0, c, max_iter=256, bailout=256.0):
+    """
+    整个网格一次迭代 z ← z² + c，只更新尚未逃逸的点；
+    返回平滑迭代次数 ν = n + 1 - log₂(log|z|)，未逃逸（属于集合）的点为 NaN。
+    """
+    z = np.array(z0, dtype=np.complex128)
+    c = np.broadcast_to(c, z.shape).astype(np.complex128)
+    nu = np.full(z.shape, np.nan)
+    idx = np.arange(z.size)  # 尚未逃逸的点
+    zf, cf = z.ravel(), c.ravel()
+    for n in range(max_iter):
+        zf[idx] = zf[idx] ** 2 + cf[idx]
+        mag = np.abs(zf[idx])
+        out = mag > bailout
+        if out.any():
+            nu.ravel()[idx[out]] = n + 1 - np.log2(np.log(mag[out]))
+            idx = idx[~out]
+        if idx.size == 0:
+            break
+    return nu
+
+
+def _render_tile(args):
+    # 进程池任务：单个分块的平滑迭代次数（float32）
+    x0, y0, size, tile_px, max_iter = args
+    half = size / tile_px / 2  # 取像素中心
+    grid = complex_grid((x0 + half, x0 + size - half), (y0 + half, y0 + size - half), tile_px, tile_px)
+    return escape_time(np.zeros_like(grid), grid, max_iter).astype(np.float32)
+
+
+class MandelbrotTileCache:
+    """
+    曼德布罗特集合的分块缓存。第 L 层分块边长为 base_size / 2^L，每块 tile_px × tile_px 像素，
+    迭代上限 base_iter + iter_per_level · L。view() 为给定视口选出像素密度足够的层级，
+    取出覆盖视口的分块（缺失的并行计算），拼接后按最近邻采样到输出分辨率。
+    """
+    def __init__(self, origin=(-2.5, -2.0), base_size=4.0, tile_px=256,
+                 base_iter=256, iter_per_level=64, max_tiles=2048, workers=None):
+        self.origin = origin
+        self.base_size = base_size
+        self.tile_px = tile_px
+        self.base_iter, self.iter_per_level = base_iter, iter_per_level
+        self.max_tiles = max_tiles
+        self.workers = workers or os.cpu_count() or 1
+        self.tiles = OrderedDict()  # (L, i, j) → ν，按最近使用排序（LRU）
+        self._pool = None
+
+    def max_iter(self, level):
+        return self.base_iter + self.iter_per_level * level
+
+    def level_for(self, width, px_w):
+        # 分块像素尺寸不大于输出像素尺寸的最浅层级
+        return max(0, math.ceil(math.log2(self.base_size * px_w / (self.tile_px * width))))
+
+    def _compute(self, keys):
+        jobs = []
+        for level, i, j in keys:
+            size = self.base_size / 2 ** level
+            jobs.append((self.origin[0] + i * size, self.origin[1] + j * size, size,
+                         self.tile_px, self.max_iter(level)))
+        if self.workers > 1 and len(jobs) > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return list(self._pool.map(_render_tile, jobs))
+        return [_render_tile(job) for job in jobs]
+
+    def view(self, center, width, height, px_w, px_h):
+        """返回 (ν 数组 px_h × px_w, 该层迭代上限)；center 为复数，width/height 为复平面尺寸"""
+        level = self.level_for(width, px_w)
+        size = self.base_size / 2 ** level
+        xs = center.real - width / 2 + (np.arange(px_w) + 0.5) * width / px_w
+        ys = center.imag + height / 2 - (np.arange(px_h) + 0.5) * height / px_h
+        tx = np.floor((xs - self.origin[0]) / size).astype(int)
+        ty = np.floor((ys - self.origin[1]) / size).astype(int)
+        keys = [(level, i, j) for i in np.unique(tx) for j in np.unique(ty)]
+
+        missing = [k for k in keys if k not in self.tiles]
+        for key, tile in zip(missing, self._compute(missing)):
+            self.tiles[key] = tile
+        for key in keys:
+            self.tiles.move_to_end(key)
+        while len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+
+        # 拼接覆盖视口的分块，再按像素坐标取值
+        i0, j0 = tx.min(), ty.min()
+        ni, nj = tx.max() - i0 + 1, ty.max() - j0 + 1
+        t = self.tile_px
+        mosaic = np.empty((nj * t, ni * t), dtype=np.float32)
+        for level_, i, j in keys:
+            row = (nj - 1 - (j - j0)) * t  # 虚部大的分块在上方
+            mosaic[row:row + t, (i - i0) * t:(i - i0 + 1) * t] = self.tiles[(level_, i, j)]
+        px = ((xs - self.origin[0]) / size - i0) * t
+        py = (nj - ((ys - self.origin[1]) / size - j0)) * t
+        px = np.clip(px.astype(int), 0, ni * t - 1)
+        py = np.clip(py.astype(int), 0, nj * t - 1)
+        return mosaic[py[:, None], px[None, :]], self.max_iter(level)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
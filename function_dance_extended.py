@@ -4,6 +4,12 @@ import random
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from my_manim_setup import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
+from surface_lod import lod_surface
+from spectral import SampledSignal, corner_points, progressive_sums, square_wave
+from lsystem import DRAGON, KOCH_SNOWFLAKE, SIERPINSKI_ARROWHEAD, centered, resample
+from attractors import TrailBuffer, lorenz, rk4_step
+from epicycles import EpicycleChain, heart_curve
 
 class FunctionDanceExtended(ThreeDScene):
     def construct(self):
@@ -245,17 +251,22 @@ class FunctionDanceExtended(ThreeDScene):
         # 6. 傅里叶级数的形成
         self.wait(1)
 
-        fourier_sum = axes.plot(
-            lambda x: sum(np.sin((2 * k + 1) * x) / (2 * k + 1) for k in range(5)),
-            color=WHITE,
-            stroke_width=4
+        # Σ sin((2k+1)x)/(2k+1) 是方波 (π/4)·sgn(sin x) 的傅里叶部分和：
+        # 方波只采样一次，各阶部分和由 rfft 截断后反变换得到
+        square = SampledSignal(
+            lambda x: PI / 4 * np.sign(np.sin(x)), (-3 * PI, 3 * PI), n=2048, period=2 * PI
         )
+        fourier_sum = square.graph(axes, square.partial_sum(1), color=WHITE, stroke_width=4)
 
-        fourier_label = MathTex(
-            r"f(x) = \sum_{k=0}^{4} \frac{\sin((2k+1)x)}{2k+1}",
-            color=WHITE,
-            font_size=28
-        ).to_corner(UL)
+        # 求和上限 K 对应最高谐波 2K+1，标签与曲线同步：从 K = 0（只有 sin x）开始
+        def fourier_label_for(upper):
+            return MathTex(
+                rf"f(x) = \sum_{{k=0}}^{{{upper}}} \frac{{\sin((2k+1)x)}}{{2k+1}}",
+                color=WHITE,
+                font_size=28
+            ).to_corner(UL)
+
+        fourier_label = fourier_label_for(0)
 
         self.play(
             FadeOut(func_family),
@@ -265,6 +276,15 @@ class FunctionDanceExtended(ThreeDScene):
             run_time=2
         )
 
+        # 逐项加入 sin(3x)/3、…、sin(9x)/9，每加一项标签的上限随之加一
+        for upper in range(1, 5):
+            self.play(
+                UpdateFromAlphaFunc(fourier_sum, progressive_sums(square, axes, [2 * upper - 1, 2 * upper + 1])),
+                Transform(fourier_label, fourier_label_for(upper)),
+                run_time=0.75,
+                rate_func=linear
+            )
+
         # 展示方波逼近
         square_wave_text = Text("方波的诞生", font="STSong", font_size=32, color=YELLOW).next_to(fourier_label, DOWN)
         self.play(Write(square_wave_text), run_time=1)
@@ -1125,7 +1145,7 @@ class FunctionDanceExtended(ThreeDScene):
         # 2. 环面
         self.play(FadeOut(helix1), FadeOut(helix2), FadeOut(connections))
 
-        torus = Surface(
+        torus = lod_surface(
             lambda u, v: np.array([
                 (3 + np.cos(v)) * np.cos(u),
                 (3 + np.cos(v)) * np.sin(u),
@@ -1146,7 +1166,7 @@ class FunctionDanceExtended(ThreeDScene):
         # 3. 莫比乌斯带
         self.play(FadeOut(torus))
 
-        mobius = Surface(
+        mobius = lod_surface(
             lambda u, v: np.array([
                 (2 + v * np.cos(u / 2)) * np.cos(u),
                 (2 + v * np.cos(u / 2)) * np.sin(u),
@@ -1168,7 +1188,7 @@ class FunctionDanceExtended(ThreeDScene):
         # 4. 球面谐波
         self.play(FadeOut(mobius))
 
-        spherical_harmonic = Surface(
+        spherical_harmonic = lod_surface(
             lambda u, v: np.array([
                 2 * np.abs(np.cos(2 * v)) * np.sin(u) * np.cos(v),
                 2 * np.abs(np.cos(2 * v)) * np.sin(u) * np.sin(v),
@@ -1226,148 +1246,52 @@ class FunctionDanceExtended(ThreeDScene):
         self.wait(1)
         self.play(FadeOut(chapter_group))
 
-        # 1. 科赫雪花
-        def koch_curve(start, end, depth):
-            if depth == 0:
-                return Line(start=start, end=end, color=BLUE, stroke_width=1)
+        # 分形由 L 系统生成：每一级是一条折线、一个 VMobject；
+        # 升级时把上一级折线重采样到新一级的点数，再逐点插值变形
+        def grow(mob, vertices, run_time):
+            start = resample(mob.vertices, len(vertices))
 
-            points = []
-            points.append(start)
+            def morph(m, alpha):
+                m.points = corner_points((1 - alpha) * start + alpha * vertices)
 
-            # 计算三等分点
-            p1 = start + (end - start) / 3
-            p2 = start + 2 * (end - start) / 3
-
-            # 计算突出点
-            angle = np.arctan2(end[1] - start[1], end[0] - start[0])
-            length = np.linalg.norm(end - start) / 3
-            p_mid = p1 + length * np.array([
-                np.cos(angle + PI / 3),
-                np.sin(angle + PI / 3),
-                0
-            ])
-
-            # 递归创建
-            curves = VGroup()
-            curves.add(koch_curve(start, p1, depth - 1))
-            curves.add(koch_curve(p1, p_mid, depth - 1))
-            curves.add(koch_curve(p_mid, p2, depth - 1))
-            curves.add(koch_curve(p2, end, depth - 1))
-
-            return curves
-
-        # 创建雪花的三边
-        triangle_points = [
-            np.array([-3, -2, 0]),
-            np.array([3, -2, 0]),
-            np.array([0, 3, 0])
-        ]
+            self.play(UpdateFromAlphaFunc(mob, morph), run_time=run_time)
+            mob.vertices = vertices
+            self.wait(0.3)
 
-        snowflake = VGroup()
-        for depth in range(5):
-            iteration = VGroup()
-            for i in range(3):
-                start = triangle_points[i]
-                end = triangle_points[(i + 1) % 3]
-                iteration.add(koch_curve(start, end, depth))
-
-            if depth == 0:
-                self.play(Create(iteration), run_time=2)
-                current = iteration
-            else:
-                self.play(Transform(current, iteration), run_time=1.5)
-            self.wait(0.5)
+        def fractal(vertices, color, stroke_width):
+            mob = VMobject(stroke_color=color, stroke_width=stroke_width)
+            mob.points = corner_points(vertices)
+            mob.vertices = vertices
+            return mob
+
+        # 1. 科赫雪花：边长 6 的三角形，第 7 级 3·4⁷ = 49152 段
+        side = 6
+        koch_origin = (-side / 2, -side * np.sqrt(3) / 6)
+        current = fractal(KOCH_SNOWFLAKE.vertices(0, side, koch_origin), BLUE, 1)
+        self.play(Create(current), run_time=2)
+        self.wait(0.5)
+        for depth in range(1, 8):
+            grow(current, KOCH_SNOWFLAKE.vertices(depth, side / 3 ** depth, koch_origin), run_time=1.5)
 
-        # 2. 龙形曲线
+        # 2. 龙形曲线：第 16 级 65536 段
         self.play(FadeOut(current))
 
-        def dragon_curve(order, length=4, start_angle=0):
-            if order == 0:
-                return Line(
-                    start=ORIGIN,
-                    end=length * RIGHT,
-                    color=GREEN,
-                    stroke_width=2
-                )
-
-            sequence = [1]
-            for _ in range(order):
-                sequence = sequence + [1] + [-x for x in sequence[::-1]]
-
-            points = [np.array([0, 0, 0])]
-            angle = start_angle
+        current_dragon = fractal(centered(DRAGON.vertices(1, 4 / 2 ** 0.5)), GREEN, 2)
+        self.play(Create(current_dragon), run_time=1)
+        for order in range(2, 17):
+            grow(current_dragon, centered(DRAGON.vertices(order, 4 / 2 ** (order / 2))), run_time=0.6)
 
-            for turn in sequence:
-                angle += turn * PI / 2
-                new_point = points[-1] + length / (2 ** (order / 2)) * np.array([
-                    np.cos(angle),
-                    np.sin(angle),
-                    0
-                ])
-                points.append(new_point)
-
-            curve = VMobject()
-            curve.set_points_as_corners(points)
-            curve.set_color(color=GREEN)
-            curve.set_stroke(width=2)
-
-            return curve
-
-        dragon_iterations = VGroup()
-        for order in range(1, 11):
-            dragon = dragon_curve(order)
-            dragon.move_to(ORIGIN)
-
-            if order == 1:
-                self.play(Create(dragon), run_time=1)
-                current_dragon = dragon
-            else:
-                self.play(Transform(current_dragon, dragon), run_time=0.8)
-            self.wait(0.3)
-
-        # 3. Sierpinski三角形
+        # 3. Sierpinski三角形（箭头曲线，一笔画成）
         self.play(FadeOut(current_dragon))
 
-        def sierpinski_triangle(order, size=4, position=ORIGIN):
-            if order == 0:
-                triangle = Polygon(
-                    position + np.array([0, size, 0]),
-                    position + np.array([-size * np.sqrt(3) / 2, -size / 2, 0]),
-                    position + np.array([size * np.sqrt(3) / 2, -size / 2, 0]),
-                    color=PURPLE,
-                    fill_opacity=0.7,
-                    stroke_width=1
-                )
-                return triangle
-
-            triangles = VGroup()
-            # 上方三角形
-            triangles.add(sierpinski_triangle(
-                order - 1, size / 2,
-                position + np.array([0, size / 2, 0])
-            ))
-            # 左下三角形
-            triangles.add(sierpinski_triangle(
-                order - 1, size / 2,
-                position + np.array([-size * np.sqrt(3) / 4, -size / 4, 0])
-            ))
-            # 右下三角形
-            triangles.add(sierpinski_triangle(
-                order - 1, size / 2,
-                position + np.array([size * np.sqrt(3) / 4, -size / 4, 0])
-            ))
-
-            return triangles
-
-        for order in range(6):
-            sierpinski = sierpinski_triangle(order)
-
-            if order == 0:
-                self.play(Create(sierpinski), run_time=1)
-                current_sierpinski = sierpinski
-            else:
-                self.play(Transform(current_sierpinski, sierpinski), run_time=1)
-            self.wait(0.5)
+        def sierpinski(order, size=7):
+            vertices = SIERPINSKI_ARROWHEAD.vertices(order, size / 2 ** order, start_angle=(order % 2) * PI / 3)
+            return centered(vertices)
+
+        current_sierpinski = fractal(sierpinski(0), PURPLE, 1.5)
+        self.play(Create(current_sierpinski), run_time=1)
+        for order in range(1, 8):
+            grow(current_sierpinski, sierpinski(order), run_time=1)
 
         # 4. 洛伦兹吸引子
         self.play(FadeOut(current_sierpinski))
@@ -1385,34 +1309,43 @@ class FunctionDanceExtended(ThreeDScene):
         self.set_camera_orientation(phi=60 * DEGREES, theta=-45 * DEGREES)
         self.play(Create(axes), run_time=1)
 
-        # Lorenz系统参数
-        sigma = 10
-        rho = 28
-        beta = 8 / 3
-
-        def lorenz_step(point, dt=0.01):
-            x, y, z = point
-            dx = sigma * (y - x)
-            dy = x * (rho - z) - y
-            dz = x * y - beta * z
-            return point + dt * np.array([dx, dy, dz])
-
-        # 创建轨迹
-        point = np.array([1, 1, 1])
-        points = [point]
-
-        for _ in range(5000):
-            point = lorenz_step(point)
-            points.append(point / 10)  # 缩放以适应屏幕
-
-        lorenz_curve = VMobject()
-        lorenz_curve.set_points_smoothly([p for p in points[::10]])
-        lorenz_curve.set_color_by_gradient(BLUE, PURPLE, RED)
-        lorenz_curve.set_stroke(width=2)
-
-        self.play(Create(lorenz_curve), run_time=4)
+        # Lorenz系统：200 个初值只差 10⁻⁵ 量级，整批 (200, 3) 数组用 RK4 同步推进，
+        # 起初重合为一条曲线，约十几个时间单位后彼此分离，铺满整个吸引子
+        flow = lorenz(sigma=10, rho=28, beta=8 / 3)
+        n_trajectories = 200
+        rng = np.random.default_rng(7)
+        state = np.array([1.0, 1.0, 1.0]) + 1e-5 * rng.standard_normal((n_trajectories, 3))
+
+        dt, steps_per_sample = 0.005, 2   # 每个记录点 = 2 个 RK4 步
+        total_samples = 3000              # 共 30 个时间单位
+        origin = axes.c2p(0, 0, 0)
+        basis = np.stack([axes.c2p(*e) - origin for e in np.eye(3)])  # 坐标轴为线性，整批仿射换算
+
+        trails = TrailBuffer(origin + state @ basis, total_samples)
+        trail_colors = color_gradient([BLUE, PURPLE, RED], n_trajectories)
+        lorenz_curve = VGroup(*[
+            VMobject(stroke_color=c, stroke_width=1, stroke_opacity=0.6) for c in trail_colors
+        ])
+
+        def stream(mob, alpha):
+            # 只积分并写入新增的点，各轨迹的 points 直接取缓冲区视图
+            nonlocal state
+            target = int(alpha * total_samples)
+            if target <= trails.count:
+                return
+            new = np.empty((target - trails.count, n_trajectories, 3))
+            for k in range(len(new)):
+                for _ in range(steps_per_sample):
+                    state = rk4_step(flow, state, dt)
+                new[k] = origin + state @ basis
+            trails.extend(new)
+            for i, trail in enumerate(mob):
+                trail.points = trails.points(i, tail=600)
+
+        self.add(lorenz_curve)
         self.begin_ambient_camera_rotation(rate=0.2)
-        self.wait(3)
+        self.play(UpdateFromAlphaFunc(lorenz_curve, stream), run_time=10, rate_func=linear)
+        self.wait(1)
         self.stop_ambient_camera_rotation()
 
         # 清理场景
@@ -1449,17 +1382,16 @@ class FunctionDanceExtended(ThreeDScene):
 
         self.play(Create(axes), run_time=1)
 
-        # 1. 方波的傅里叶级数
-        def square_wave_term(n, x):
-            return (4 / (n * PI)) * np.sin(n * x) if n % 2 == 1 else 0
+        # 1. 方波的傅里叶级数：各谐波与部分和共用一次算好的谐波矩阵
+        series = square_wave(39)
 
         # 显示各个谐波分量
         harmonics = VGroup()
         colors = [BLUE, GREEN, YELLOW, ORANGE, RED]
 
         for i, n in enumerate([1, 3, 5, 7, 9]):
-            harmonic = axes.plot(
-                lambda x: square_wave_term(n, x),
+            harmonic = series.graph(
+                axes, n, x_range=[-PI, PI], kind="term",
                 color=colors[i % len(colors)],
                 stroke_width=2
             )
@@ -1474,20 +1406,20 @@ class FunctionDanceExtended(ThreeDScene):
         # 合成方波
         self.wait(1)
 
-        square_wave = axes.plot(
-            lambda x: sum(square_wave_term(2 * k + 1, x) for k in range(20)),
+        square_wave_curve = series.graph(
+            axes, 39, x_range=[-PI, PI],
             color=WHITE,
             stroke_width=3
         )
 
         self.play(
             FadeOut(harmonics),
-            Create(square_wave),
+            Create(square_wave_curve),
             run_time=2
         )
 
         # 2. 傅里叶圆圈动画
-        self.play(FadeOut(square_wave), FadeOut(axes))
+        self.play(FadeOut(square_wave_curve), FadeOut(axes))
 
         # 创建新的平面
         plane = NumberPlane(
@@ -1501,81 +1433,30 @@ class FunctionDanceExtended(ThreeDScene):
         )
         self.play(Create(plane), run_time=1)
 
-        # 傅里叶圆圈
-        t = ValueTracker(0)
-        circles = VGroup()
-        vectors = VGroup()
-
-        # 创建多个旋转圆
-        frequencies = [1, 2, 3, 4]
-        amplitudes = [1.5, 0.7, 0.4, 0.2]
-        colors = [BLUE, GREEN, YELLOW, RED]
-
-        for freq, amp, color in zip(frequencies, amplitudes, colors):
-            circle = Circle(radius=amp, color=color, stroke_width=1)
-            circles.add(circle)
-
-            vector = Arrow(
-                start=ORIGIN,
-                end=amp * RIGHT,
-                color=color,
-                buff=0
-            )
-            vectors.add(vector)
-
-        # 定位圆圈
-        circles[0].move_to(ORIGIN)
-        for i in range(1, len(circles)):
-            circles[i].move_to(circles[i - 1].get_center() + amplitudes[i - 1] * RIGHT)
-
-        self.play(*[Create(c) for c in circles], run_time=2)
-
-        # 追踪路径
-        path = VMobject()
-        path.set_color(WHITE)
-
-        def update_circles(mob):
-            time = t.get_value()
-            # 更新第一个圆的向量
-            angle1 = frequencies[0] * time
-            end1 = circles[0].get_center() + amplitudes[0] * np.array([
-                np.cos(angle1), np.sin(angle1), 0
-            ])
-
-            # 更新后续圆圈位置
-            for i in range(1, len(circles)):
-                angle = frequencies[i] * time
-                prev_end = circles[i - 1].get_center() + amplitudes[i - 1] * np.array([
-                    np.cos(frequencies[i - 1] * time),
-                    np.sin(frequencies[i - 1] * time),
-                    0
-                ])
-                circles[i].move_to(prev_end)
-
-            # 获取最后一个点
-            last_angle = frequencies[-1] * time
-            last_point = circles[-1].get_center() + amplitudes[-1] * np.array([
-                np.cos(last_angle), np.sin(last_angle), 0
-            ])
-
-            # 添加到路径
-            if len(path.points) == 0:
-                path.set_points_as_corners([last_point, last_point])
-            else:
-                path.add_points_as_corners([last_point])
-
-        circles.add_updater(update_circles)
-        self.add(path)
+        # 傅里叶圆圈：心形曲线按弧长重采样后做 FFT，取 301 项（300 个旋转向量）
+        epicycles = EpicycleChain(
+            heart_curve(size=2.0),
+            n=301,
+            turns=2,
+            circle_style={"stroke_color": BLUE, "stroke_width": 1, "stroke_opacity": 0.35},
+            vector_style={"stroke_color": YELLOW, "stroke_width": 1.5},
+            trace_style={"stroke_color": RED, "stroke_width": 3},
+        )
 
-        self.play(t.animate.set_value(4 * PI), run_time=8, rate_func=linear)
+        self.play(Create(epicycles.circles), Create(epicycles.vectors), run_time=2)
+        self.add(epicycles)
 
-        circles.remove_updater(update_circles)
+        # 每帧一次向量化计算：全部端点、全部圆与新增的轨迹段
+        self.play(
+            UpdateFromAlphaFunc(epicycles, epicycles.drawer(turns=2)),
+            run_time=8,
+            rate_func=linear
+        )
 
         # 清理场景
         self.play(
             FadeOut(plane),
-            FadeOut(circles),
-            FadeOut(path),
+            FadeOut(epicycles),
             run_time=2
         )
         self.wait(0.5)
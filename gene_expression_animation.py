@@ -5,6 +5,7 @@ import random
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from my_manim_setup import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 
 
 # 自定义替代函数，替换SVGMobject的功能
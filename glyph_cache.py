@@ -0,0 +1,112 @@
+"""
+文字 / 公式对象缓存：相同参数的 Text、MarkupText、MathTex、Tex 只排版一次
+所有场景文件共用，导入方式：from glyph_cache import Text, MarkupText, MathTex, Tex
+（放在 from manim import * 与 my_manim_setup 之后，同名覆盖，调用处无需改动）
+
+    内存：按最近使用排序的 LRU，命中时返回原型的 copy()，省去 Pango / LaTeX 排版与 SVG 解析
+    磁盘：以参数内容的 SHA-256 为文件名，保存矢量轮廓（pickle），
+          放在 media/glyph_cache 下，各场景文件、chapter_tools 的各工作进程共用
+    color 不参与键：相同文字、不同颜色共用一份轮廓，取出后再 set_color
+"""
+
+from collections import OrderedDict
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+
+import manim
+from manim import config
+
+
+class GlyphCache:
+    def __init__(self, max_items=1024, directory=None):
+        self.max_items = max_items
+        self._directory = directory
+        self.items = OrderedDict()  # 键 → 原型对象
+        self.enabled = True
+        self.hits = self.misses = 0
+
+    @property
+    def directory(self):
+        # media_dir 由命令行参数决定，使用时再取
+        return self._directory or os.path.join(config.media_dir, "glyph_cache")
+
+    def key(self, cls, args, kwargs):
+        # set_default 修改的默认参数与 LaTeX 模板同样影响排版结果，一并计入
+        defaults = getattr(cls.__dict__.get("__init__"), "keywords", None)
+        template = kwargs.get("tex_template") or (config.tex_template if issubclass(cls, manim.SingleStringMathTex) else None)
+        content = repr((
+            manim.__version__, cls.__module__, cls.__qualname__, args,
+            sorted(kwargs.items()), sorted((defaults or {}).items()),
+            getattr(template, "body", None),
+        ))
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".pkl")
+
+    def _load(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+    def _store(self, key, mob):
+        # 先写临时文件再原子替换，多个进程同时写同一键也不会留下残缺文件
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(mob, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def get(self, cls, args, kwargs):
+        if not self.enabled:
+            return cls(*args, **kwargs)
+        # 带逐字着色参数时颜色属于排版结果的一部分，不能事后统一 set_color
+        per_char = any(k in kwargs for k in ("t2c", "t2g", "gradient", "tex_to_color_map"))
+        color = None if per_char else kwargs.pop("color", None)
+        key = self.key(cls, args, kwargs)
+        proto = self.items.get(key)
+        if proto is None:
+            proto = self._load(key)
+            if proto is None:
+                self.misses += 1
+                proto = cls(*args, **kwargs)
+                self._store(key, proto)
+            else:
+                self.hits += 1
+            self.items[key] = proto
+            while len(self.items) > self.max_items:
+                self.items.popitem(last=False)
+        else:
+            self.hits += 1
+        self.items.move_to_end(key)
+        mob = proto.copy()
+        if color is not None:
+            mob.set_color(color)
+        return mob
+
+
+cache = GlyphCache()
+
+
+def cached(cls):
+    """把 manim 的文字类包装成同名工厂函数，调用方式不变"""
+    @functools.wraps(cls, updated=())
+    def make(*args, **kwargs):
+        return cache.get(cls, args, kwargs)
+    return make
+
+
+Text = cached(manim.Text)
+MarkupText = cached(manim.MarkupText)
+MathTex = cached(manim.MathTex)
+Tex = cached(manim.Tex)
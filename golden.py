@@ -0,0 +1,72 @@
+"""
+黄金矩形的逐级分割、内切四分之一圆弧螺旋与 Vogel 叶序模型 —— 纯 NumPy
+calculus_outline.py 的黄金分割章节使用
+
+    golden_spiral:  levels 级正方形（依次从左、上、右、下切下）与各自的四分之一圆弧
+    spiral_points / square_points: 整条螺旋、全部正方形轮廓的贝塞尔点（单个 VMobject 即可绘制）
+    vogel:          第 k 粒种子位于 r = c·√k、θ = k·黄金角
+"""
+
+import numpy as np
+
+PHI = (1 + np.sqrt(5)) / 2
+GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))  # ≈ 137.508°
+ARC_HANDLE = 4 / 3 * np.tan(np.pi / 8)    # 单段三次贝塞尔逼近四分之一圆的控制柄长度
+
+
+def golden_spiral(height, levels, center=(0.0, 0.0)):
+    """
+    以 center 为中心、高 height、宽 φ·height 的黄金矩形，分割 levels 级。
+    第 k 个正方形边长 height / φ^k，其中的圆弧从角度 π - kπ/2 转到 π/2 - kπ/2，
+    圆心为正方形的一个角；相邻圆弧首尾相接。
+    返回 dict：side (L,)、arc_center (L, 2)、start / end (L, 2) 圆弧端点、angle (L,) 起始角。
+    """
+    k = np.arange(levels)
+    side = height / PHI ** k
+    angle = np.pi - k * np.pi / 2
+    start_dir = np.stack([np.cos(angle), np.sin(angle)], axis=-1)
+    end_dir = np.stack([np.cos(angle - np.pi / 2), np.sin(angle - np.pi / 2)], axis=-1)
+    step = side[:, None] * (end_dir - start_dir)
+
+    # 螺旋从外矩形左下角出发，每段的起点是前面各段位移之和
+    origin = np.asarray(center, dtype=float) - np.array([PHI * height, height]) / 2
+    start = origin + np.concatenate([np.zeros((1, 2)), np.cumsum(step, axis=0)[:-1]])
+    arc_center = start - side[:, None] * start_dir
+    return {
+        "side": side,
+        "arc_center": arc_center,
+        "start": start,
+        "end": start + step,
+        "angle": angle,
+    }
+
+
+def spiral_points(spiral):
+    """全部圆弧连成一条路径的贝塞尔点 (4L, 3)"""
+    side, c, a = spiral["side"], spiral["arc_center"], spiral["angle"]
+    d0 = np.stack([np.cos(a), np.sin(a)], axis=-1)
+    d1 = np.stack([np.cos(a - np.pi / 2), np.sin(a - np.pi / 2)], axis=-1)
+    p0, p3 = c + side[:, None] * d0, c + side[:, None] * d1
+    # 顺时针方向的切线：起点处为 d0 旋转 -90°（即 d1），终点处为 -d0
+    p1 = p0 + ARC_HANDLE * side[:, None] * d1
+    p2 = p3 + ARC_HANDLE * side[:, None] * d0
+    bezier = np.stack([p0, p1, p2, p3], axis=1)
+    return np.concatenate([bezier, np.zeros(bezier.shape[:2] + (1,))], axis=-1).reshape(-1, 3)
+
+
+def square_points(spiral):
+    """每个正方形一条闭合子路径的贝塞尔点 (16L, 3)；正方形的四角为圆心、两端点与对角"""
+    c, s, e = spiral["arc_center"], spiral["start"], spiral["end"]
+    corners = np.stack([c, s, s + e - c, e, c], axis=1)  # (L, 5, 2)
+    a0, a1 = corners[:, :-1], corners[:, 1:]
+    segments = np.stack([a0, a0 + (a1 - a0) / 3, a1 - (a1 - a0) / 3, a1], axis=2)
+    return np.concatenate([segments, np.zeros(segments.shape[:3] + (1,))], axis=-1).reshape(-1, 3)
+
+
+def vogel(n, spacing=1.0, angle=GOLDEN_ANGLE):
+    """Vogel 叶序模型：返回种子坐标 (n, 3) 与归一化半径 (n,)（用于着色）"""
+    k = np.arange(n)
+    r = spacing * np.sqrt(k)
+    theta = k * angle
+    points = np.stack([r * np.cos(theta), r * np.sin(theta), np.zeros(n)], axis=-1)
+    return points, np.sqrt(k / max(n - 1, 1))
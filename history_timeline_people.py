@@ -5,6 +5,7 @@ import textwrap
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from my_manim_setup import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 
 # =========================
 # 可调参数（全局外观与时长）
@@ -14,7 +14,12 @@
 """
 
 from manim import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 import numpy as np
+from surface_lod import lod_surface
+from epicycles import EpicycleChain
+from spectral import square_wave
+from quadrature import RULES, DiskStack, ShellStack, SliceApproximation
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 全局配置 | Global Configuration
@@ -230,50 +235,78 @@ class Scene02_AreaUnderCurve(Scene):
         riemann_text.to_edge(DOWN)
         self.play(FadeIn(riemann_text), run_time=1)
         
-        prev_rects = None
-        prev_count = None
-        
-        # 不同数量的矩形
-        for n_rects in [4, 8, 16, 32, 64]:
-            dx = (4 - 0.5) / n_rects
-            rects = axes.get_riemann_rectangles(
-                curve,
-                x_range=[0.5, 4],
-                dx=dx,
-                fill_opacity=0.6,
-                stroke_width=1,
-                stroke_color=WHITE
+        # 每种近似一个对象：所有切片是同一个 VMobject 的子路径
+        def approximation(rule, n):
+            mob = SliceApproximation(
+                axes, func, 0.5, 4, n=n, rule=rule,
+                stroke_width=1, stroke_color=WHITE
             )
-            
-            # 设置渐变色
-            for i, rect in enumerate(rects):
-                t = i / len(rects)
-                rect.set_fill(color=interpolate_color(BLUE, GREEN, t))
-            
-            if n_rects == 4:
-                self.play(Create(rects), run_time=2)
-            else:
-                self.play(
-                    ReplacementTransform(prev_rects, rects),
-                    run_time=1.5
-                )
-            
-            # 显示矩形数量
-            count_text = MathTex(f"n = {n_rects}").scale(0.8)
-            count_text.to_corner(UR)
-            
-            if n_rects == 4:
-                self.play(Write(count_text))
-            else:
-                self.play(
-                    ReplacementTransform(prev_count, count_text),
-                    run_time=0.5
-                )
-            
-            prev_rects = rects
-            prev_count = count_text
+            # 渐变色由填充的 sheen 方向给出，不再逐个矩形插值
+            mob.set_fill([BLUE, GREEN], opacity=0.6).set_sheen_direction(RIGHT)
+            return mob
+        
+        rects = approximation("left", 6)
+        
+        # 切片数与误差读数（参考值为 scipy 的 quad）
+        count_label = MathTex("n =").scale(0.8)
+        count_value = Integer(rects.n).scale(0.8)
+        error_label = MathTex(r"|S_n - I| =").scale(0.8)
+        error_value = DecimalNumber(abs(rects.error), num_decimal_places=6).scale(0.8)
+        readout = VGroup(count_label, error_label).arrange(DOWN, aligned_edge=RIGHT)
+        readout.to_corner(UR).shift(LEFT * 2.2)
+        
+        def update_readout(mob):
+            count_value.set_value(mob.n).next_to(count_label, RIGHT)
+            error_value.set_value(abs(mob.error)).next_to(error_label, RIGHT)
+            # 切片越密，边框越细，避免白边盖住填充
+            mob.set_stroke(width=min(1, 48 / mob.n))
+        
+        update_readout(rects)
+        self.play(Create(rects), run_time=2)
+        self.play(Write(readout), FadeIn(count_value), FadeIn(error_value))
+        
+        # 同样 6 个切片：左、右、中点、梯形、辛普森
+        rule_names = {
+            "left": "Left", "right": "Right", "midpoint": "Midpoint",
+            "trapezoid": "Trapezoid", "simpson": "Simpson",
+        }
+        rule_label = get_english_text(rule_names["left"]).scale(0.5)
+        rule_label.next_to(readout, DOWN, aligned_edge=LEFT)
+        self.play(FadeIn(rule_label), run_time=0.5)
+        self.wait(0.5)
+        
+        for rule in RULES[1:]:
+            new_rects = approximation(rule, 6)
+            update_readout(new_rects)
+            new_label = get_english_text(rule_names[rule]).scale(0.5)
+            new_label.move_to(rule_label, aligned_edge=LEFT)
+            self.play(
+                ReplacementTransform(rects, new_rects),
+                ReplacementTransform(rule_label, new_label),
+                run_time=1
+            )
+            rects, rule_label = new_rects, new_label
             self.wait(0.5)
         
+        # 回到左矩形，切片数从 6 几何增长到 4096，每帧只改写一个对象的点
+        new_rects = approximation("left", 6)
+        new_label = get_english_text(rule_names["left"]).scale(0.5)
+        new_label.move_to(rule_label, aligned_edge=LEFT)
+        update_readout(new_rects)
+        self.play(
+            ReplacementTransform(rects, new_rects),
+            ReplacementTransform(rule_label, new_label),
+            run_time=1
+        )
+        rects, rule_label = new_rects, new_label
+        
+        self.play(
+            UpdateFromAlphaFunc(rects, rects.refiner(6, 4096, on_change=update_readout)),
+            run_time=6,
+            rate_func=linear
+        )
+        self.wait(0.5)
+        
         # === 极限过程 ===
         limit_text = get_bilingual_text(
             "当矩形数量趋向无穷，我们得到精确的面积",
@@ -290,8 +323,11 @@ class Scene02_AreaUnderCurve(Scene):
         area.set_opacity(0.7)
         
         self.play(
-            FadeOut(prev_rects),
-            FadeOut(prev_count),
+            FadeOut(rects),
+            FadeOut(readout),
+            FadeOut(count_value),
+            FadeOut(error_value),
+            FadeOut(rule_label),
             FadeIn(area),
             run_time=2
         )
@@ -674,36 +710,16 @@ class Scene05_VolumeOfRevolution(Scene):
         disk_text.to_edge(DOWN)
         self.play(FadeIn(disk_text), run_time=1)
         
-        # 创建圆盘（用椭圆表示侧面视角）
-        disks = VGroup()
-        x_vals = np.linspace(0.3, 3.2, 15)
-        
-        for x_val in x_vals:
-            y_val = func(x_val)
-            # 用椭圆表示侧面看的圆盘
-            disk = Ellipse(
-                width=0.18,
-                height=2 * y_val * 0.65,
-                color=BLUE,
-                fill_opacity=0.5,
-                stroke_width=2
-            )
-            disk_center = axes.c2p(x_val, 0)
-            disk.move_to(disk_center)
-            disks.add(disk)
-        
-        # 设置渐变色
-        for i, disk in enumerate(disks):
-            t = i / len(disks)
-            disk.set_fill(interpolate_color(BLUE, TEAL, t), opacity=0.6)
-        
-        self.play(
-            LaggedStart(
-                *[GrowFromCenter(disk) for disk in disks],
-                lag_ratio=0.1,
-                run_time=3
-            )
+        # 创建圆盘（用椭圆表示侧面视角）：全部圆盘是同一个对象的子路径
+        b = 3.5
+        disks = DiskStack(
+            axes, func, 0, b, n=15, depth=0.18,
+            exact=PI * b ** 2 / 2,
+            stroke_color=BLUE, stroke_width=2
         )
+        disks.set_fill([BLUE, TEAL], opacity=0.6).set_sheen_direction(RIGHT)
+        
+        self.play(Create(disks), run_time=3)
         
         self.wait(1)
         
@@ -726,8 +742,85 @@ class Scene05_VolumeOfRevolution(Scene):
         self.play(Write(volume_formula), run_time=2)
         self.wait(1)
         
+        # 圆盘数从 15 增加到 2000，读数对照解析值 πb²/2
+        count_label = MathTex("n =").scale(0.7)
+        count_value = Integer(disks.n).scale(0.7)
+        error_label = MathTex(r"|V_n - V| =").scale(0.7)
+        error_value = DecimalNumber(abs(disks.error), num_decimal_places=6).scale(0.7)
+        readout = VGroup(count_label, error_label).arrange(DOWN, aligned_edge=RIGHT)
+        readout.to_corner(UL).shift(DOWN * 1.2)
+        
+        def update_readout(mob):
+            count_value.set_value(mob.n).next_to(count_label, RIGHT)
+            error_value.set_value(abs(mob.error)).next_to(error_label, RIGHT)
+            mob.set_stroke(width=min(2, 30 / mob.n))
+        
+        update_readout(disks)
+        self.play(Write(readout), FadeIn(count_value), FadeIn(error_value), run_time=1)
+        self.play(
+            UpdateFromAlphaFunc(disks, disks.refiner(15, 2000, on_change=update_readout)),
+            run_time=5,
+            rate_func=linear
+        )
+        self.wait(1)
+        
+        # === 柱壳法：同一立体按半径 y 切成一层层同轴圆筒 ===
+        shell_text = get_bilingual_text(
+            "柱壳法：按半径切成一层层同轴圆筒",
+            "Shell Method: slice the solid into nested cylindrical shells"
+        )
+        shell_text.to_edge(DOWN)
+        self.play(ReplacementTransform(formula_text, shell_text), run_time=1)
+        
+        # 半径 y 处的柱壳从曲线 x = y² 延伸到 x = b：V = 2π ∫ y (b − y²) dy = πb²/2
+        shells = ShellStack(
+            axes, lambda y: b - y ** 2, 0, np.sqrt(b), n=15,
+            vertical=False, start=lambda y: y ** 2,
+            exact=PI * b ** 2 / 2,
+            stroke_color=GREEN, stroke_width=2
+        )
+        shells.set_fill([GREEN, YELLOW], opacity=0.6).set_sheen_direction(RIGHT)
+        
+        shell_count_label = MathTex(r"n_{\text{shell}} =").scale(0.7)
+        shell_count_value = Integer(shells.n).scale(0.7)
+        shell_error_label = MathTex(r"|V^{\text{shell}}_n - V| =").scale(0.7)
+        shell_error_value = DecimalNumber(abs(shells.error), num_decimal_places=6).scale(0.7)
+        shell_readout = VGroup(shell_count_label, shell_error_label).arrange(DOWN, aligned_edge=RIGHT)
+        shell_readout.next_to(readout, DOWN, aligned_edge=RIGHT, buff=0.3)
+        
+        def update_shell_readout(mob):
+            shell_count_value.set_value(mob.n).next_to(shell_count_label, RIGHT)
+            shell_error_value.set_value(abs(mob.error)).next_to(shell_error_label, RIGHT)
+            mob.set_stroke(width=min(2, 30 / mob.n))
+        
+        update_shell_readout(shells)
+        self.play(
+            disks.animate.set_fill(opacity=0.15).set_stroke(opacity=0.15),
+            Create(shells),
+            Write(shell_readout),
+            FadeIn(shell_count_value),
+            FadeIn(shell_error_value),
+            run_time=2
+        )
+        self.play(
+            UpdateFromAlphaFunc(shells, shells.refiner(15, 2000, on_change=update_shell_readout)),
+            run_time=5,
+            rate_func=linear
+        )
+        self.wait(1)
+        
+        # 两种切法得到同一个体积，回到圆盘
+        self.play(
+            FadeOut(shells),
+            FadeOut(shell_readout),
+            FadeOut(shell_count_value),
+            FadeOut(shell_error_value),
+            disks.animate.set_fill(opacity=0.6).set_stroke(opacity=1),
+            run_time=1
+        )
+        
         # === 动态旋转效果 ===
-        self.play(FadeOut(formula_text))
+        self.play(FadeOut(shell_text))
         
         rotate_text = get_bilingual_text(
             "想象曲线绕轴旋转的美妙过程",
@@ -737,9 +830,12 @@ class Scene05_VolumeOfRevolution(Scene):
         self.play(FadeIn(rotate_text), run_time=1)
         
         # 模拟3D效果 - 让圆盘产生波动
+        def breathe(mob, alpha):
+            mob.set_disk_depth(0.18 * (1 + 0.4 * alpha))
+        
         for _ in range(2):
             self.play(
-                *[disk.animate.stretch(1.4, 0) for disk in disks],
+                UpdateFromAlphaFunc(disks, breathe),
                 rate_func=there_and_back,
                 run_time=1.2
             )
@@ -755,6 +851,9 @@ class Scene05_VolumeOfRevolution(Scene):
         
         self.play(
             FadeOut(disks),
+            FadeOut(readout),
+            FadeOut(count_value),
+            FadeOut(error_value),
             FadeIn(filled_area),
             run_time=2
         )
@@ -1011,14 +1110,8 @@ class Scene07_FourierSeries(Scene):
         
         self.play(Create(axes), run_time=1)
         
-        # 傅里叶级数逐项相加
-        def square_wave_approx(n_terms):
-            def func(x):
-                result = 0
-                for n in range(1, n_terms + 1, 2):
-                    result += (4 / (n * PI)) * np.sin(n * x)
-                return result
-            return func
+        # 傅里叶级数逐项相加：同一采样网格上的全部部分和一次算好
+        series = square_wave(99)
         
         colors = [RED, ORANGE, YELLOW, GREEN, BLUE, PURPLE]
         n_values = [1, 3, 5, 9, 15, 25]
@@ -1027,8 +1120,7 @@ class Scene07_FourierSeries(Scene):
         prev_label = None
         
         for i, n in enumerate(n_values):
-            func = square_wave_approx(n)
-            curve = axes.plot(func, x_range=[-3.8, 3.8], color=colors[i % len(colors)])
+            curve = series.graph(axes, n, x_range=[-3.8, 3.8], color=colors[i % len(colors)])
             curve.set_stroke(width=3)
             
             n_label = MathTex(f"n = {n}").scale(0.8)
@@ -1062,12 +1154,11 @@ class Scene07_FourierSeries(Scene):
         self.play(FadeIn(perfect_text), run_time=1)
         
         # 画出接近理想的方波
-        high_approx = square_wave_approx(99)
-        square_wave = axes.plot(high_approx, x_range=[-3.8, 3.8], color=WHITE)
-        square_wave.set_stroke(width=3)
+        square_wave_curve = series.graph(axes, 99, x_range=[-3.8, 3.8], color=WHITE)
+        square_wave_curve.set_stroke(width=3)
         
         self.play(
-            ReplacementTransform(prev_curve, square_wave),
+            ReplacementTransform(prev_curve, square_wave_curve),
             FadeOut(prev_label),
             run_time=2
         )
@@ -1080,7 +1171,7 @@ class Scene07_FourierSeries(Scene):
         
         # === 圆的叠加可视化 ===
         self.play(
-            FadeOut(square_wave),
+            FadeOut(square_wave_curve),
             FadeOut(axes),
             FadeOut(perfect_text),
             FadeOut(infinity_label),
@@ -1094,45 +1185,33 @@ class Scene07_FourierSeries(Scene):
         circle_text.to_edge(DOWN)
         self.play(FadeIn(circle_text), run_time=1)
         
-        # 创建叠加的圆
-        circles = VGroup()
-        radii = [1.5, 0.5, 0.3, 0.2, 0.15]
-        colors_c = [BLUE, GREEN, YELLOW, ORANGE, RED]
-        
-        current_center = ORIGIN
-        for r, c in zip(radii, colors_c):
-            circle = Circle(radius=r, color=c, stroke_width=3)
-            circle.move_to(current_center)
-            circles.add(circle)
-            current_center = circle.point_at_angle(0)
-        
+        # 创建叠加的圆：积分号的轮廓按弧长重采样后做 FFT，
+        # 300 个旋转向量首尾相接，笔尖画出原来的字形
+        integral_sign = MathTex(r"\int").set_height(4.5).move_to(0.4 * UP)
+        epicycles = EpicycleChain(
+            integral_sign,
+            n=301,
+            circle_style={"stroke_color": BLUE, "stroke_width": 1, "stroke_opacity": 0.4},
+            vector_style={"stroke_color": YELLOW, "stroke_width": 1.5},
+            trace_style={"stroke_color": GOLD, "stroke_width": 3},
+        )
+
         self.play(
-            LaggedStart(
-                *[Create(c) for c in circles],
-                lag_ratio=0.3,
-                run_time=2
-            )
+            Create(epicycles.circles),
+            Create(epicycles.vectors),
+            run_time=2
         )
-        
-        # 添加圆心连线和轨迹点
-        dots = VGroup()
-        for i, circle in enumerate(circles):
-            dot = Dot(circle.get_center(), color=colors_c[i], radius=0.05)
-            dots.add(dot)
-        
-        self.play(FadeIn(dots), run_time=0.5)
-        
-        # 旋转动画
-        angle = PI
+        self.add(epicycles)
+
+        # 旋转动画：转满一圈，轨迹随笔尖增量绘出
         self.play(
-            Rotate(circles, angle=angle, about_point=ORIGIN),
-            Rotate(dots, angle=angle, about_point=ORIGIN),
-            run_time=3,
-            rate_func=smooth
+            UpdateFromAlphaFunc(epicycles, epicycles.drawer()),
+            run_time=6,
+            rate_func=linear
         )
-        
+
         self.wait(1)
-        
+
         # 结语
         ending = get_bilingual_text(
             "傅里叶揭示：复杂源于简单的叠加",
@@ -1434,7 +1513,7 @@ class Scene3D_HeartSurface(ThreeDScene):
                 x * np.sin(v) * scale
             ])
         
-        heart_3d = Surface(
+        heart_3d = lod_surface(
             heart_surface,
             u_range=[0, TAU],
             v_range=[0, TAU],
@@ -1499,7 +1578,7 @@ class Scene3D_Revolution(ThreeDScene):
                 r * np.sin(v)
             ])
         
-        surface = Surface(
+        surface = lod_surface(
             revolution_surface,
             u_range=[0.01, 3],
             v_range=[0, TAU],
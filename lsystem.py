@@ -0,0 +1,61 @@
+"""
+L 系统：字符串重写 + 数组化的海龟解释器 —— 纯 NumPy
+function_dance_extended.py 第七幕的科赫雪花、龙形曲线、谢尔宾斯基曲线使用
+
+    LSystem.expand:    按规则并行重写 n 次（str.translate，一次替换整串）
+    LSystem.vertices:  无分支的海龟命令 → 折线顶点 (M, 3)：
+                       朝向 = 转向符号的累加和，位置 = 前进步长向量的累加和，全程无逐步循环
+    resample:          把上一级折线按顶点序号重采样到新一级的点数，两级之间逐点插值变形
+"""
+
+import numpy as np
+
+
+class LSystem:
+    """
+    axiom 与 rules 为重写规则（单字符 → 字符串）；angle 为 + / - 的转角（弧度，+ 为左转）；
+    draw 中的字符表示前进一步并画线，其余字符（如 X、Y）只参与重写。
+    """
+    def __init__(self, axiom, rules, angle, draw="F", start_angle=0.0):
+        self.axiom = axiom
+        self.table = str.maketrans(rules)
+        self.angle = angle
+        self.draw = np.frombuffer(draw.encode("ascii"), dtype=np.uint8)
+        self.start_angle = start_angle
+        self._iterations = [axiom]
+
+    def expand(self, n):
+        while len(self._iterations) <= n:
+            self._iterations.append(self._iterations[-1].translate(self.table))
+        return self._iterations[n]
+
+    def vertices(self, n, step=1.0, origin=(0.0, 0.0), start_angle=None):
+        commands = np.frombuffer(self.expand(n).encode("ascii"), dtype=np.uint8)
+        turn = (commands == ord("+")).astype(np.int64) - (commands == ord("-"))
+        heading = (self.start_angle if start_angle is None else start_angle) + self.angle * np.cumsum(turn)
+        h = heading[np.isin(commands, self.draw)]
+        steps = step * np.stack([np.cos(h), np.sin(h)], axis=-1)
+        xy = np.concatenate([np.zeros((1, 2)), np.cumsum(steps, axis=0)]) + origin
+        return np.concatenate([xy, np.zeros((len(xy), 1))], axis=-1)
+
+
+def resample(vertices, m):
+    """折线顶点 (M, 3) 按序号等分重采样为 m 个点；各段等长时即按弧长对应"""
+    position = np.linspace(0, len(vertices) - 1, m)
+    i = np.minimum(position.astype(int), len(vertices) - 2)
+    frac = (position - i)[:, None]
+    return (1 - frac) * vertices[i] + frac * vertices[i + 1]
+
+
+def centered(vertices):
+    """平移使包围盒中心位于原点"""
+    return vertices - (vertices.min(axis=0) + vertices.max(axis=0)) / 2
+
+
+# 科赫雪花：顺时针绕三角形，每条边向外凸起
+KOCH_SNOWFLAKE = LSystem("F--F--F", {"F": "F+F--F+F"}, np.pi / 3, start_angle=np.pi / 3)
+# 龙形曲线：第 n 级 2^n 段
+DRAGON = LSystem("FX", {"X": "X+YF+", "Y": "-FX-Y"}, np.pi / 2, draw="F")
+# 谢尔宾斯基箭头曲线：一笔画出的谢尔宾斯基三角形，第 n 级 3^n 段；
+# 奇数级取 start_angle=π/3 才与偶数级同向（底边水平、尖朝上）
+SIERPINSKI_ARROWHEAD = LSystem("A", {"A": "B-A-B", "B": "A+B+A"}, np.pi / 3, draw="AB")
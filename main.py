@@ -3,6 +3,7 @@ import numpy as np
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from my_manim_setup import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 
 # =========================================
 # 字体与配色
@@ -5,6 +5,7 @@ from my_manim_setup import *
 
 
 from manim import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 import numpy as np
 from manim.utils.space_ops import rotate_vector  # 添加这个导入用于旋转向量
 
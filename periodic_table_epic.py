@@ -4,6 +4,7 @@ import random
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from my_manim_setup import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 class PeriodicTableOrigins(Scene):
     def construct(self):
         # 设置背景为深空黑
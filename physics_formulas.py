@@ -9,6 +9,7 @@ config.tex_compiler = "xelatex"  # 重要：必须安装 XeLaTeX
 config.tex_template = TexTemplateLibrary.ctex  # 使用中文模板 (需确认是否已加载)
 
 from manim import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 import numpy as np
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
@@ -0,0 +1,62 @@
+"""
+n 维正多胞体的组合生成、平面旋转与逐级透视投影 —— 纯 NumPy
+calculus_outline.py 的高维空间章节使用
+
+    hypercube / cross_polytope: 顶点 (V, n) 与边 (E, 2)，由组合规则直接给出，无需两两比较
+    plane_rotation / rotation:   在坐标平面 (i, j) 内的旋转矩阵及其复合
+    perspective:                 n 维 → 3 维逐级透视，再投到画面平面
+"""
+
+import numpy as np
+
+
+def hypercube(dim):
+    """
+    顶点为 {-1, 1}^dim，第 k 位二进制为 1 表示第 k 个坐标取 +1；
+    边连接只差一位的两个顶点：对每个顶点 i 和其为 0 的位 k，连 (i, i | 2^k)
+    """
+    index = np.arange(2 ** dim)
+    bits = (index[:, None] >> np.arange(dim)) & 1
+    vertices = 2.0 * bits - 1
+    lo, k = np.nonzero(bits == 0)
+    edges = np.stack([lo, lo | (1 << k)], axis=-1)
+    return vertices, edges
+
+
+def cross_polytope(dim):
+    """顶点为 ±e_k；除互为相反的一对外，任意两个顶点之间都有边"""
+    vertices = np.concatenate([np.eye(dim), -np.eye(dim)])
+    i, j = np.triu_indices(2 * dim, k=1)
+    keep = j - i != dim
+    return vertices, np.stack([i[keep], j[keep]], axis=-1)
+
+
+def plane_rotation(dim, i, j, angle):
+    """坐标平面 (x_i, x_j) 内转 angle，其余坐标不变"""
+    m = np.eye(dim)
+    c, s = np.cos(angle), np.sin(angle)
+    m[i, i], m[i, j], m[j, i], m[j, j] = c, -s, s, c
+    return m
+
+
+def rotation(dim, planes):
+    """planes 为 [(i, j, angle), ...]，依次复合各平面旋转"""
+    m = np.eye(dim)
+    for i, j, angle in planes:
+        m = plane_rotation(dim, i, j, angle) @ m
+    return m
+
+
+def perspective(points, distance=3.0):
+    """
+    (..., n) → (..., 3)：每次把最后一个坐标作为深度做透视 x ← x · d / (d - w)，直到只剩 3 维；
+    最后再以 z 为深度投到画面平面（z 置 0）。输入应在单位球内，
+    每级的视距按上一级的最大半径放大，保证分母恒正。
+    """
+    x = np.asarray(points, dtype=float)
+    bound = 1.0
+    while x.shape[-1] > 2:
+        depth = x[..., -1:]
+        x = x[..., :-1] * (distance * bound / (distance * bound - depth))
+        bound *= distance / (distance - 1)
+    return np.concatenate([x, np.zeros(x.shape[:-1] + (1,))], axis=-1)
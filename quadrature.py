@@ -0,0 +1,214 @@
+"""
+数值积分的可视化：黎曼和（左、右、中点）、梯形、辛普森，以及圆盘法 / 柱壳法体积
+integration_romance.py 的场景二、场景五使用
+
+    riemann_sum:      f 在整个网格上只向量化求值一次；矩形、梯形的数值与画出的面积完全一致
+    slice_profiles:   每个切片顶边的折线（矩形为水平线、梯形为斜线、辛普森为抛物线）
+    disk_volume / shell_volume: 绕 x 轴的圆盘法、绕竖直轴 x = axis 的柱壳法
+    reference:        有解析值时直接使用，否则 scipy.integrate.quad
+    SliceApproximation / DiskStack / ShellStack: 一种方法一个 VMobject，每个切片是一条闭合子路径；
+                      set_n 原地改写点缓冲区，数千个切片也只是一个对象
+"""
+
+from manim import Circle, VMobject
+import numpy as np
+from scipy.integrate import quad
+
+RULES = ("left", "right", "midpoint", "trapezoid", "simpson")
+
+
+# ---------- 数值 ----------
+def _even(n, rule):
+    # 复合辛普森公式两段一组，切片数取偶数
+    return n + n % 2 if rule == "simpson" else n
+
+
+def riemann_sum(f, a, b, n, rule="midpoint"):
+    n = _even(n, rule)
+    x = np.linspace(a, b, n + 1)
+    dx = (b - a) / n
+    if rule == "midpoint":
+        return dx * np.sum(f((x[:-1] + x[1:]) / 2))
+    y = f(x)
+    if rule == "left":
+        return dx * np.sum(y[:-1])
+    if rule == "right":
+        return dx * np.sum(y[1:])
+    if rule == "trapezoid":
+        return dx * (np.sum(y) - (y[0] + y[-1]) / 2)
+    if rule == "simpson":
+        return dx / 3 * (y[0] + y[-1] + 4 * np.sum(y[1:-1:2]) + 2 * np.sum(y[2:-1:2]))
+    raise ValueError(f"未知的积分规则：{rule}")
+
+
+def slice_profiles(f, a, b, n, rule="midpoint", samples=9):
+    """
+    每个切片顶边的采样 (S, k) 的 x 与 y：矩形、梯形 k = 2，辛普森每两段一片、
+    k = samples 个点的过三节点抛物线。返回 (x, y)。
+    """
+    n = _even(n, rule)
+    x = np.linspace(a, b, n + 1)
+    if rule == "simpson":
+        nodes = np.stack([x[:-1:2], x[1::2], x[2::2]], axis=1)  # (S, 3)
+        y = f(x)
+        values = np.stack([y[:-1:2], y[1::2], y[2::2]], axis=1)
+        # 等距三节点的拉格朗日基函数，在 [0, 2] 上取 samples 个点，整批矩阵乘
+        s = np.linspace(0, 2, samples)[:, None]
+        basis = np.concatenate([(s - 1) * (s - 2) / 2, -s * (s - 2), s * (s - 1) / 2], axis=1)
+        xs = nodes[:, :1] + s.T * (nodes[:, 1:2] - nodes[:, :1])
+        return xs, values @ basis.T
+    xs = np.stack([x[:-1], x[1:]], axis=1)
+    if rule == "trapezoid":
+        y = f(x)
+        return xs, np.stack([y[:-1], y[1:]], axis=1)
+    heights = {
+        "left": lambda: f(x[:-1]),
+        "right": lambda: f(x[1:]),
+        "midpoint": lambda: f((x[:-1] + x[1:]) / 2),
+    }[rule]()
+    return xs, np.repeat(heights[:, None], 2, axis=1)
+
+
+def disk_volume(f, a, b, n, rule="midpoint"):
+    """绕 x 轴旋转：V = π ∫ f² dx，按给定规则求和"""
+    return np.pi * riemann_sum(lambda x: f(x) ** 2, a, b, n, rule)
+
+
+def shell_volume(f, a, b, n, rule="midpoint", axis=0.0):
+    """绕竖直轴 x = axis 旋转：V = 2π ∫ |x − axis| f dx"""
+    return 2 * np.pi * riemann_sum(lambda x: np.abs(x - axis) * f(x), a, b, n, rule)
+
+
+def reference(f, a, b, exact=None):
+    """参考值：优先用解析值，否则 quad 自适应积分"""
+    return exact if exact is not None else quad(f, a, b, limit=200)[0]
+
+
+def refined_counts(n0, n1, alpha):
+    """alpha ∈ [0, 1] 时切片数从 n0 几何增长到 n1"""
+    return int(round(n0 * (n1 / n0) ** alpha))
+
+
+# ---------- 图形 ----------
+def _axes_frame(axes):
+    # Axes 为线性坐标：场景点 = 原点 + x·ex + y·ey
+    origin = axes.c2p(0, 0)
+    return origin, axes.c2p(1, 0) - origin, axes.c2p(0, 1) - origin
+
+
+def polygon_points(vertices):
+    """S 条折线的顶点 (S, K, 3) → 贝塞尔点，每条折线一条子路径"""
+    a0, a1 = vertices[:, :-1], vertices[:, 1:]
+    return np.stack([a0, a0 + (a1 - a0) / 3, a1 - (a1 - a0) / 3, a1], axis=2).reshape(-1, 3)
+
+
+class _Slices(VMobject):
+    def __init__(self, n, **kwargs):
+        super().__init__(**kwargs)
+        self.n = None
+        self.set_n(n)
+
+    def set_n(self, n):
+        if n != self.n:
+            self.n = n
+            self.points = self.slice_points(n)
+        return self
+
+    @property
+    def error(self):
+        return self.value - self.reference
+
+    def refiner(self, n0, n1, on_change=None):
+        """UpdateFromAlphaFunc 用的更新函数；切片数变化时才重建点，on_change(mob) 可同步标签"""
+        def update(mob, alpha):
+            n = refined_counts(n0, n1, alpha)
+            if n != mob.n:
+                mob.set_n(n)
+                if on_change is not None:
+                    on_change(mob)
+        return update
+
+
+class SliceApproximation(_Slices):
+    """
+    axes 上 f 在 [a, b] 的一种数值积分（rule ∈ RULES），每个切片一条闭合子路径。
+    value 为当前切片数下的近似值，error 为相对参考值（exact 或 quad）的误差。
+    """
+    def __init__(self, axes, f, a, b, n=8, rule="midpoint", exact=None, **kwargs):
+        self.axes, self.f, self.a, self.b, self.rule = axes, f, a, b, rule
+        self.reference = reference(f, a, b, exact)
+        super().__init__(n, **kwargs)
+
+    @property
+    def value(self):
+        return riemann_sum(self.f, self.a, self.b, self.n, self.rule)
+
+    def slice_points(self, n):
+        xs, ys = slice_profiles(self.f, self.a, self.b, n, self.rule)
+        origin, ex, ey = _axes_frame(self.axes)
+        # 每片：左下 → 顶边各点 → 右下 → 回到左下
+        bx = np.concatenate([xs[:, :1], xs, xs[:, -1:], xs[:, :1]], axis=1)
+        by = np.concatenate([np.zeros((len(xs), 1)), ys, np.zeros((len(xs), 2))], axis=1)
+        vertices = origin + bx[..., None] * ex + by[..., None] * ey
+        return polygon_points(vertices)
+
+
+class DiskStack(_Slices):
+    """
+    圆盘法的侧视图：每个切片是中心在 (x, 0)、竖直半轴 f(x)、水平半轴 depth / 2 的椭圆，
+    切片越密，椭圆叠成的轮廓越接近旋转体。value 为 π Σ f² Δx（中点规则）。
+    """
+    def __init__(self, axes, f, a, b, n=15, depth=0.18, exact=None, **kwargs):
+        self.axes, self.f, self.a, self.b, self.disk_depth = axes, f, a, b, depth
+        self.reference = reference(lambda x: np.pi * f(x) ** 2, a, b, exact)
+        self._template = Circle(radius=1).points.copy()
+        super().__init__(n, **kwargs)
+
+    @property
+    def value(self):
+        return disk_volume(self.f, self.a, self.b, self.n)
+
+    def slice_points(self, n):
+        x = self.a + (np.arange(n) + 0.5) * (self.b - self.a) / n
+        origin, ex, ey = _axes_frame(self.axes)
+        centers = origin + np.outer(x, ex)
+        half_height = self.f(x) * np.linalg.norm(ey)
+        scale = np.stack([np.full(n, self.disk_depth / 2), half_height, np.ones(n)], axis=-1)
+        return (centers[:, None] + scale[:, None] * self._template).reshape(-1, 3)
+
+    def set_disk_depth(self, depth):
+        """改变椭圆的水平半轴（侧视的透视感），切片数不变"""
+        self.disk_depth = depth
+        self.points = self.slice_points(self.n)
+        return self
+
+
+class ShellStack(_Slices):
+    """
+    柱壳法的侧视图。vertical=True 时绕竖直线 x = axis 旋转，半径变量 t 为 x；
+    否则绕水平线 y = axis 旋转，t 为 y。每个柱壳的截面是关于轴对称的两条细长矩形：
+    径向宽 Δt，沿轴方向从 start(t)（常数或函数）延伸 f(t)。value 为 2π Σ |t − axis| f Δt（中点规则）。
+    """
+    def __init__(self, axes, f, a, b, n=15, axis=0.0, vertical=True, start=0.0, exact=None, **kwargs):
+        self.axes, self.f, self.a, self.b = axes, f, a, b
+        self.axis, self.vertical, self.start = axis, vertical, start
+        self.reference = reference(lambda t: 2 * np.pi * np.abs(t - axis) * f(t), a, b, exact)
+        super().__init__(n, **kwargs)
+
+    @property
+    def value(self):
+        return shell_volume(self.f, self.a, self.b, self.n, axis=self.axis)
+
+    def slice_points(self, n):
+        edges = np.linspace(self.a, self.b, n + 1)
+        t = (edges[:-1] + edges[1:]) / 2
+        lo = self.start(t) if callable(self.start) else np.full(n, float(self.start))
+        lo, hi = np.tile(lo, 2), np.tile(lo + self.f(t), 2)
+        # 轴两侧的截面：t 处与关于轴的镜像 2·axis − t 处，两者绕向一致
+        r0 = np.concatenate([edges[:-1], 2 * self.axis - edges[1:]])
+        r1 = np.concatenate([edges[1:], 2 * self.axis - edges[:-1]])
+        radial = np.stack([r0, r1, r1, r0, r0], axis=1)
+        along = np.stack([lo, lo, hi, hi, lo], axis=1)
+        x, y = (radial, along) if self.vertical else (along, radial)
+        origin, ex, ey = _axes_frame(self.axes)
+        return polygon_points(origin + x[..., None] * ex + y[..., None] * ey)
@@ -6,6 +6,7 @@ from math import sin, cos, pi
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from my_manim_setup import *
+from glyph_cache import Text, MarkupText, MathTex, Tex
 
 # 自定义颜色
 PHOTON_YELLOW = "#FFD700"
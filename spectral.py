@@ -0,0 +1,203 @@
+"""
+频谱分析：信号只采样一次，时域曲线、幅度/相位谱与傅里叶部分和都由同一采样缓冲区得到
+calculus_outline.py、function_dance_extended.py 中的傅里叶章节共用
+
+    SampledSignal.spectrum:     numpy.fft.rfft，可选窗函数（按相干增益归一化为正弦振幅）
+    SampledSignal.partial_sum:  保留前 n 个谐波后 irfft，得到傅里叶部分和
+    SampledSignal.graph / bars: 由采样数组直接生成曲线与频谱条，不再逐点调用 Python 函数
+    progressive_sums:           部分和逐项增加的动画更新函数（原地改写曲线点缓冲区）
+    FourierSeries:              已知系数表的三角级数；每个采样网格只建一次谐波矩阵，
+                                cumsum 一次得到全部部分和（方波、锯齿波、三角波预设）
+"""
+
+from manim import VGroup, VMobject
+import numpy as np
+
+WINDOWS = {
+    None: np.ones,
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+}
+
+
+def axes_points(axes, x, y):
+    """坐标数组 → 场景点 (N, 3)；Axes 为线性坐标时是仿射变换，整批一次换算"""
+    origin = axes.c2p(0, 0)
+    ex, ey = axes.c2p(1, 0) - origin, axes.c2p(0, 1) - origin
+    return origin + np.asarray(x)[:, None] * ex + np.asarray(y)[:, None] * ey
+
+
+def corner_points(points):
+    """折线顶点 (N, 3) → 贝塞尔点，与 set_points_as_corners 相同"""
+    a0, a1 = points[:-1], points[1:]
+    return np.stack([a0, a0 + (a1 - a0) / 3, a1 - (a1 - a0) / 3, a1], axis=1).reshape(-1, 3)
+
+
+def bar_points(axes, x, heights, width=0.1):
+    """以 (x, 0) 为底边中点、高 heights 的矩形，每个矩形是一条闭合子路径"""
+    x, heights = np.asarray(x, dtype=float), np.asarray(heights, dtype=float)
+    half = width / 2 * np.linalg.norm(axes.c2p(1, 0) - axes.c2p(0, 0))
+    base, top = axes_points(axes, x, np.zeros_like(x)), axes_points(axes, x, heights)
+    side = np.array([half, 0, 0])
+    corners = np.stack([base - side, base + side, top + side, top - side, base - side], axis=1)
+    return np.concatenate([corner_points(c) for c in corners]) if len(corners) else np.zeros((0, 3))
+
+
+class SampledSignal:
+    """
+    在 t_range 上等间距采样 n 点（不含右端点，按周期信号处理）。
+    func 需接受 ndarray；也可直接传入采样数组 samples。
+    period 为基本周期（谐波的单位），缺省为整个采样区间。
+    """
+    def __init__(self, func, t_range, n=4096, period=None, samples=None):
+        self.t0, self.t1 = t_range
+        self.t = np.linspace(self.t0, self.t1, n, endpoint=False)
+        self.y = np.asarray(func(self.t) if samples is None else samples, dtype=float)
+        self.period = period or (self.t1 - self.t0)
+        self.freqs = np.fft.rfftfreq(n, d=self.t[1] - self.t[0])
+        self.coefficients = np.fft.rfft(self.y)
+        self._spectra = {}
+
+    def spectrum(self, window=None):
+        """返回 (频率, 幅度, 相位)；幅度按窗的相干增益归一化为各正弦分量的振幅"""
+        if window not in self._spectra:
+            w = WINDOWS[window](len(self.y))
+            X = self.coefficients if window is None else np.fft.rfft(self.y * w)
+            magnitude = 2 * np.abs(X) / w.sum()
+            magnitude[0] /= 2  # 直流分量不对折
+            if len(self.y) % 2 == 0:
+                magnitude[-1] /= 2  # 奈奎斯特频率同样不对折
+            self._spectra[window] = (self.freqs, magnitude, np.angle(X))
+        return self._spectra[window]
+
+    def peaks(self, threshold=0.01, window=None):
+        """幅度高于 threshold 的局部极大值所在频点下标"""
+        _, magnitude, _ = self.spectrum(window)
+        padded = np.concatenate([[0], magnitude, [0]])
+        local_max = (magnitude >= padded[:-2]) & (magnitude > padded[2:])
+        return np.nonzero(local_max & (magnitude > threshold))[0]
+
+    def component(self, bins):
+        """只保留给定频点（不加窗）的采样，如单个正弦分量"""
+        X = np.zeros_like(self.coefficients)
+        X[bins] = self.coefficients[bins]
+        return np.fft.irfft(X, n=len(self.y))
+
+    def partial_sum(self, harmonics):
+        """频率不超过 harmonics / period 的所有分量之和（傅里叶部分和）"""
+        return self.component(self.freqs <= (harmonics + 0.5) / self.period)
+
+    def graph(self, axes, y=None, **style):
+        """采样数组 → 曲线；末尾补上周期延拓的第一个点，使曲线覆盖整个 t_range"""
+        mob = VMobject(**style)
+        return self.set_graph(mob, axes, self.y if y is None else y)
+
+    def set_graph(self, mob, axes, y):
+        x = np.append(self.t, self.t1)
+        mob.points = corner_points(axes_points(axes, x, np.append(y, y[0])))
+        return mob
+
+    def bars(self, axes, bins=None, kind="magnitude", window=None, width=0.1, **style):
+        """每个频点一个矩形（VGroup，便于单独高亮）；kind 为 "magnitude" 或 "phase" """
+        freqs, magnitude, phase = self.spectrum(window)
+        bins = self.peaks(window=window) if bins is None else bins
+        heights = (magnitude if kind == "magnitude" else phase)[bins]
+        group = VGroup(*[VMobject(**style) for _ in bins])
+        return set_bars(group, axes, freqs[bins], heights, width)
+
+
+def set_bars(group, axes, freqs, heights, width=0.1):
+    """原地改写 bars 中各矩形的点"""
+    for bar, f, h in zip(group, freqs, heights):
+        bar.points = bar_points(axes, [f], [h], width)
+    return group
+
+
+def progressive_sums(signal, axes, harmonics):
+    """
+    UpdateFromAlphaFunc 用的更新函数：曲线依次经过 harmonics 中各阶部分和，
+    相邻两阶之间线性插值。所有部分和预先一次算好。
+    """
+    sums = np.stack([signal.partial_sum(h) for h in harmonics])
+
+    def update(mob, alpha):
+        position = alpha * (len(sums) - 1)
+        i = min(int(position), len(sums) - 2)
+        frac = position - i
+        signal.set_graph(mob, axes, (1 - frac) * sums[i] + frac * sums[i + 1])
+
+    return update
+
+
+# ---------- 三角级数部分和 ----------
+class FourierSeries:
+    """
+    f(x) = constant + Σ_{n≥1} [cos_n · cos(nωx) + sin_n · sin(nωx)]，ω = 2π / period。
+    cos、sin 为第 1…N 次谐波的系数数组，也可以是 {n: 系数} 的字典。
+    同一采样网格上的各项与全部部分和只计算一次并缓存。
+    """
+    def __init__(self, sin=None, cos=None, constant=0.0, period=2 * np.pi):
+        tables = [t for t in (sin, cos) if t is not None]
+        self.n_max = max((max(t) if isinstance(t, dict) else len(t)) for t in tables) if tables else 0
+        self.sin = self._table(sin)
+        self.cos = self._table(cos)
+        self.constant = constant
+        self.omega = 2 * np.pi / period
+        self._grids = {}
+
+    def _table(self, coefficients):
+        table = np.zeros(self.n_max)
+        if isinstance(coefficients, dict):
+            for n, c in coefficients.items():
+                table[n - 1] = c
+        elif coefficients is not None:
+            table[:len(coefficients)] = coefficients
+        return table
+
+    def _grid(self, x):
+        x = np.asarray(x, dtype=float)
+        key = x.tobytes()
+        if key not in self._grids:
+            # 谐波矩阵 (N, M)：n·ω·x 的外积，一次 sin / cos
+            phase = np.outer(np.arange(1, self.n_max + 1) * self.omega, x)
+            terms = np.empty((self.n_max + 1, len(x)))
+            terms[0] = self.constant
+            terms[1:] = self.sin[:, None] * np.sin(phase) + self.cos[:, None] * np.cos(phase)
+            self._grids[key] = (terms, np.cumsum(terms, axis=0))
+        return self._grids[key]
+
+    def terms(self, x):
+        """第 n 行为第 n 次谐波在 x 上的取值 (N + 1, M)，第 0 行为常数项"""
+        return self._grid(x)[0]
+
+    def partial_sums(self, x):
+        """第 n 行为前 n 次谐波的部分和 (N + 1, M)"""
+        return self._grid(x)[1]
+
+    def graph(self, axes, n, x_range, samples=1000, kind="sum", **style):
+        """第 n 个部分和（kind="term" 时为第 n 次谐波单项）的曲线"""
+        x = np.linspace(*x_range, samples)
+        y = (self.partial_sums(x) if kind == "sum" else self.terms(x))[n]
+        mob = VMobject(**style)
+        mob.points = corner_points(axes_points(axes, x, y))
+        return mob
+
+
+def square_wave(n_max, amplitude=1.0, period=2 * np.pi):
+    """奇函数方波：(4A/π) Σ sin(nωx) / n，n 为奇数"""
+    n = np.arange(1, n_max + 1)
+    return FourierSeries(sin=np.where(n % 2 == 1, 4 * amplitude / (np.pi * n), 0.0), period=period)
+
+
+def sawtooth_wave(n_max, amplitude=1.0, period=2 * np.pi):
+    """一个周期内从 -A 线性升到 A 的锯齿波：(2A/π) Σ (-1)^{n+1} sin(nωx) / n"""
+    n = np.arange(1, n_max + 1)
+    return FourierSeries(sin=2 * amplitude / np.pi * (-1.0) ** (n + 1) / n, period=period)
+
+
+def triangle_wave(n_max, amplitude=1.0, period=2 * np.pi):
+    """奇函数三角波：(8A/π²) Σ (-1)^{(n-1)/2} sin(nωx) / n²，n 为奇数"""
+    n = np.arange(1, n_max + 1)
+    b = 8 * amplitude / np.pi ** 2 * (-1.0) ** ((n - 1) // 2) / n ** 2
+    return FourierSeries(sin=np.where(n % 2 == 1, b, 0.0), period=period)
@@ -0,0 +1,129 @@
+"""
+参数曲面的数值微分几何 —— 纯 NumPy，对整张 (u, v) 网格向量化计算
+calculus_outline.py 的微分几何章节使用
+
+    SurfaceGeometry.curvature:  高斯曲率 K、平均曲率 H
+    SurfaceGeometry.principal:  主曲率 k1 ≥ k2 及对应主方向（R³ 单位向量）
+    SurfaceGeometry.geodesics:  多条测地线同时用 RK4 积分（状态按条数成批）
+
+func(u, v) 需接受同形状数组并返回 (x, y, z) 或形如 (3, ...) 的数组；
+各阶偏导用步长 h 的中心差分求得。
+"""
+
+import numpy as np
+
+
+def _dot(a, b):
+    return np.sum(a * b, axis=-1)
+
+
+class SurfaceGeometry:
+    def __init__(self, func, h=1e-4):
+        self.func = func
+        self.h = h
+
+    def point(self, u, v):
+        u, v = np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(v, dtype=float))
+        return np.moveaxis(np.asarray(self.func(u, v), dtype=float), 0, -1)
+
+    def derivatives(self, u, v):
+        """返回 (P_u, P_v, P_uu, P_uv, P_vv)，形状均为 (..., 3)"""
+        h, p = self.h, self.point
+        c = p(u, v)
+        pu, mu = p(u + h, v), p(u - h, v)
+        pv, mv = p(u, v + h), p(u, v - h)
+        return (
+            (pu - mu) / (2 * h),
+            (pv - mv) / (2 * h),
+            (pu - 2 * c + mu) / h ** 2,
+            (p(u + h, v + h) - p(u + h, v - h) - p(u - h, v + h) + p(u - h, v - h)) / (4 * h ** 2),
+            (pv - 2 * c + mv) / h ** 2,
+        )
+
+    def fundamental_forms(self, u, v):
+        """第一基本形式 (E, F, G)、第二基本形式 (L, M, N) 与单位法向"""
+        Pu, Pv, Puu, Puv, Pvv = self.derivatives(u, v)
+        n = np.cross(Pu, Pv)
+        n /= np.linalg.norm(n, axis=-1, keepdims=True)
+        first = (_dot(Pu, Pu), _dot(Pu, Pv), _dot(Pv, Pv))
+        second = (_dot(Puu, n), _dot(Puv, n), _dot(Pvv, n))
+        return first, second, n
+
+    def curvature(self, u, v):
+        """高斯曲率 K = (LN - M²)/(EG - F²)，平均曲率 H = (EN - 2FM + GL) / 2(EG - F²)"""
+        (E, F, G), (L, M, N), _ = self.fundamental_forms(u, v)
+        det = E * G - F ** 2
+        return (L * N - M ** 2) / det, (E * N - 2 * F * M + G * L) / (2 * det)
+
+    def principal(self, u, v):
+        """主曲率 k1 ≥ k2 与主方向 d1、d2（形状算子 I⁻¹II 的特征值与特征向量）"""
+        (E, F, G), (L, M, N), _ = self.fundamental_forms(u, v)
+        Pu, Pv = self.derivatives(u, v)[:2]
+        K, H = self.curvature(u, v)
+        root = np.sqrt(np.maximum(H ** 2 - K, 0))
+        k1, k2 = H + root, H - root
+
+        def direction(k):
+            # (II - k·I)(a, b)ᵀ = 0 的非零解；两行中取数值较大者避免退化
+            a1, b1 = -(M - k * F), L - k * E
+            a2, b2 = N - k * G, -(M - k * F)
+            first_row = (a1 ** 2 + b1 ** 2) >= (a2 ** 2 + b2 ** 2)
+            a, b = np.where(first_row, a1, a2), np.where(first_row, b1, b2)
+            # 脐点处任一方向都是主方向，取 u 方向
+            umbilic = (a ** 2 + b ** 2) < 1e-20
+            a, b = np.where(umbilic, 1.0, a), np.where(umbilic, 0.0, b)
+            d = a[..., None] * Pu + b[..., None] * Pv
+            return d / np.linalg.norm(d, axis=-1, keepdims=True)
+
+        return k1, k2, direction(k1), direction(k2)
+
+    def christoffel(self, u, v):
+        """第二类克里斯托费尔符号 Γ^k_ij，形状 (..., 2, 2, 2)，下标顺序 [k, i, j]"""
+        Pu, Pv, Puu, Puv, Pvv = self.derivatives(u, v)
+        g = np.stack([
+            np.stack([_dot(Pu, Pu), _dot(Pu, Pv)], axis=-1),
+            np.stack([_dot(Pu, Pv), _dot(Pv, Pv)], axis=-1),
+        ], axis=-2)
+        # P_ij 在切平面基 (P_u, P_v) 下的分量即 Γ^k_ij
+        second = np.stack([np.stack([Puu, Puv], axis=-2), np.stack([Puv, Pvv], axis=-2)], axis=-3)
+        proj = np.stack([_dot(second, Pu[..., None, None, :]), _dot(second, Pv[..., None, None, :])], axis=-1)
+        gamma = np.linalg.solve(g[..., None, None, :, :], proj[..., None])[..., 0]
+        return np.moveaxis(gamma, -1, -3)
+
+    def _geodesic_rhs(self, state):
+        u, v, du, dv = state.T
+        gamma = self.christoffel(u, v)
+        vel = np.stack([du, dv], axis=-1)
+        acc = -np.einsum("nkij,ni,nj->nk", gamma, vel, vel)
+        return np.stack([du, dv, acc[:, 0], acc[:, 1]], axis=-1)
+
+    def geodesics(self, uv0, directions, length, steps=200, domain=None):
+        """
+        从 uv0 (n, 2) 出发、初始参数方向 directions (n, 2) 的 n 条测地线，
+        按弧长归一化后同时积分到弧长 length。返回参数轨迹 (steps + 1, n, 2)；
+        给定 domain=((u0, u1), (v0, v1)) 时，离开参数域之后的点记为 NaN。
+        """
+        uv0 = np.atleast_2d(np.asarray(uv0, dtype=float))
+        d = np.atleast_2d(np.asarray(directions, dtype=float))
+        uv0, d = np.broadcast_arrays(uv0, d)
+        Pu, Pv = self.derivatives(uv0[:, 0], uv0[:, 1])[:2]
+        speed = np.linalg.norm(d[:, :1] * Pu + d[:, 1:] * Pv, axis=-1, keepdims=True)
+        state = np.concatenate([uv0, d / speed], axis=-1)
+
+        dt = length / steps
+        path = np.empty((steps + 1, len(state), 2))
+        path[0] = state[:, :2]
+        f = self._geodesic_rhs
+        for i in range(1, steps + 1):
+            k1 = f(state)
+            k2 = f(state + dt / 2 * k1)
+            k3 = f(state + dt / 2 * k2)
+            k4 = f(state + dt * k3)
+            state = state + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            path[i] = state[:, :2]
+
+        if domain is not None:
+            (u0, u1), (v0, v1) = domain
+            inside = (path[..., 0] >= u0) & (path[..., 0] <= u1) & (path[..., 1] >= v0) & (path[..., 1] <= v1)
+            path[~np.logical_and.accumulate(inside, axis=0)] = np.nan
+        return path
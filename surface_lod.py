@@ -0,0 +1,52 @@
+"""
+Surface 细节层次（LOD）：按渲染画质与曲面在屏幕上的投影尺寸选择网格分辨率
+Helloworld.py、integration_romance.py、function_dance_extended.py 中的 Surface 共用
+
+    -ql (480p) 预览用粗网格，-qk (2160p) 成片用密网格；
+    同一画质下，占屏越大的曲面分得越多面片。
+"""
+
+from manim import Surface, config
+import numpy as np
+
+# 设计基准：在 1080p 下、包围盒最长边约为半个画面高度时，base 分辨率恰好合适
+REFERENCE_PIXEL_HEIGHT = 1080
+MIN_RESOLUTION = 4
+MAX_RESOLUTION = 128
+
+
+def surface_extent(func, u_range, v_range, samples=9):
+    """粗采样参数域，估计曲面包围盒的最长边（世界坐标）"""
+    us = np.linspace(u_range[0], u_range[1], samples)
+    vs = np.linspace(v_range[0], v_range[1], samples)
+    pts = np.array([func(u, v) for u in us for v in vs], dtype=float)
+    return float(np.max(pts.max(axis=0) - pts.min(axis=0)))
+
+
+def lod_resolution(base, extent=None, zoom=1.0):
+    """
+    base:   设计分辨率 (nu, nv)
+    extent: 曲面最长边（世界坐标），None 表示按基准尺寸处理
+    zoom:   相机缩放（set_camera_orientation 的 zoom）
+    """
+    reference_extent = config.frame_height / 2
+    scale = config.pixel_height / REFERENCE_PIXEL_HEIGHT
+    if extent is not None:
+        scale *= zoom * extent / reference_extent
+    else:
+        scale *= zoom
+    return tuple(
+        int(np.clip(round(n * scale), MIN_RESOLUTION, MAX_RESOLUTION)) for n in base
+    )
+
+
+def lod_surface(func, u_range, v_range, resolution=(32, 16), zoom=1.0, **kwargs):
+    """与 Surface 用法相同；resolution 视为设计分辨率，实际值由 lod_resolution 决定"""
+    extent = surface_extent(func, u_range, v_range)
+    return Surface(
+        func,
+        u_range=u_range,
+        v_range=v_range,
+        resolution=lod_resolution(resolution, extent, zoom),
+        **kwargs
+    )